@@ -18,17 +18,22 @@ try:
     import json
 except ImportError:
     import simplejson as json
+import collections
 import logging
 import os
+import threading
+import time
 
 import debtcollector.renames
 from keystoneauth1 import access
 from keystoneauth1 import adapter
+from keystoneauth1 import exceptions as ksa_exc
 from oslo_utils import importutils
 import requests
 
 from neutronclient._i18n import _
 from neutronclient.common import exceptions
+from neutronclient.common import token_cache
 from neutronclient.common import utils
 
 osprofiler_web = importutils.try_import("osprofiler.web")
@@ -47,10 +52,264 @@ logging.getLogger("requests").setLevel(_requests_log_level)
 MAX_URI_LEN = 8192
 USER_AGENT = 'python-neutronclient'
 REQ_ID_HEADER = 'X-OpenStack-Request-ID'
+# Keyword arguments tuning the connection pool of the legacy HTTPClient.
+# They are meaningless for SessionClient, whose keystoneauth session owns
+# its own connection pool.
+POOL_KWARGS = ('pool_connections', 'pool_maxsize', 'pool_block',
+               'pool_idle_timeout')
+# Seconds before its expiry at which the legacy HTTPClient replaces its
+# token, so that requests are not sent with a token about to expire.
+DEFAULT_TOKEN_REFRESH_MARGIN = 60
+
+
+class EndpointCache(object):
+    """Bounded LRU cache of resolved service endpoints.
+
+    Entries are keyed by ``(auth_key, service_type, interface,
+    region_name)``, where auth_key identifies the authentication the
+    endpoint was resolved with, so that a new token never sees an endpoint
+    looked up for another one.
+    """
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, auth_key, service_type, interface, region_name, resolve):
+        """Return the cached endpoint or the result of ``resolve()``."""
+        key = (auth_key, service_type, interface, region_name)
+        with self._lock:
+            endpoint = self._entries.pop(key, None)
+            if endpoint is not None:
+                self._entries[key] = endpoint
+                return endpoint
+        endpoint = resolve()
+        self.set(auth_key, service_type, interface, region_name, endpoint)
+        return endpoint
+
+    def set(self, auth_key, service_type, interface, region_name, endpoint):
+        if not endpoint:
+            return
+        key = (auth_key, service_type, interface, region_name)
+        with self._lock:
+            self._entries[key] = endpoint
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, auth_key=None):
+        """Drop the entries of ``auth_key``, or all of them."""
+        with self._lock:
+            if auth_key is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if key[0] == auth_key:
+                    del self._entries[key]
+
+
+# Endpoints returned by keystone for tokens given to HTTPClient without an
+# endpoint, shared by all HTTPClient instances of the process.
+_token_endpoints = EndpointCache()
+
+ROUND_ROBIN = 'round-robin'
+LEAST_LATENCY = 'least-latency'
+ENDPOINT_SELECTIONS = (ROUND_ROBIN, LEAST_LATENCY)
+# Only these requests are moved to another endpoint after a failure; a
+# POST may have been processed by a node which then failed to answer.
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+# Responses meaning that the node, rather than the request, is at fault.
+FAILOVER_STATUS_CODES = frozenset([502, 503, 504])
+
+
+class EndpointPool(object):
+    """Spread requests across several endpoints of the same service.
+
+    Endpoints are tracked passively from the outcome of the requests sent
+    to them: an endpoint failing ``max_failures`` consecutive requests, by
+    refusing connections or answering 502, 503 or 504, is ejected for
+    ``eject_time`` seconds. Idempotent requests failing that way are sent
+    again to the next healthy endpoint.
+
+    :param urls: Endpoint URLs.
+    :param selection: ``round-robin`` or ``least-latency``, which prefers
+                      the endpoint with the lowest moving average response
+                      time. (default: round-robin)
+    :param float eject_time: Seconds a failed endpoint is skipped.
+                             (default: 30)
+    :param integer max_failures: Consecutive failures ejecting an endpoint.
+                                 (default: 1)
+    """
+
+    # Weight of the last response time in the moving average.
+    LATENCY_WEIGHT = 0.3
+
+    def __init__(self, urls, selection=ROUND_ROBIN, eject_time=30,
+                 max_failures=1):
+        if selection not in ENDPOINT_SELECTIONS:
+            raise ValueError(_("Unknown endpoint selection: %s") % selection)
+        self.selection = selection
+        self.eject_time = eject_time
+        self.max_failures = max_failures
+        self._lock = threading.Lock()
+        self._next = 0
+        self.urls = []
+        self.update(urls)
+
+    def update(self, urls):
+        """Replace the endpoints, keeping the state of the known ones."""
+        urls = [url.rstrip('/') for url in urls]
+        if not urls:
+            raise exceptions.EndpointNotFound()
+        with self._lock:
+            old = dict((e['url'], e) for e in getattr(self, '_endpoints', []))
+            self._endpoints = [old.get(url) or {'url': url, 'failures': 0,
+                                                'ejected_until': 0,
+                                                'latency': None,
+                                                'requests': 0}
+                               for url in urls]
+            self.urls = urls
+
+    @property
+    def stats(self):
+        """Per endpoint counters, for monitoring."""
+        now = utils.monotonic_time()
+        with self._lock:
+            return dict((e['url'], {'requests': e['requests'],
+                                    'latency': e['latency'],
+                                    'healthy': e['ejected_until'] <= now})
+                        for e in self._endpoints)
+
+    def candidates(self):
+        """Return the endpoints to try for a request, preferred first.
+
+        Ejected endpoints come last, soonest back first, so that a request
+        is still attempted when every endpoint is ejected.
+        """
+        now = utils.monotonic_time()
+        with self._lock:
+            healthy = [e for e in self._endpoints
+                       if e['ejected_until'] <= now]
+            ejected = sorted((e for e in self._endpoints
+                              if e['ejected_until'] > now),
+                             key=lambda e: e['ejected_until'])
+            if healthy:
+                # Rotate over the healthy endpoints only, so that the load
+                # of an ejected one is spread evenly.
+                start = self._next % len(healthy)
+                self._next += 1
+                healthy = healthy[start:] + healthy[:start]
+            if self.selection == LEAST_LATENCY:
+                # Unmeasured endpoints are tried first.
+                healthy.sort(key=lambda e: e['latency'] or 0)
+            return [e['url'] for e in healthy + ejected]
+
+    def _get(self, url):
+        for endpoint in self._endpoints:
+            if endpoint['url'] == url:
+                return endpoint
+        return None
+
+    def report_success(self, url, latency):
+        with self._lock:
+            endpoint = self._get(url)
+            if endpoint is None:
+                return
+            endpoint['requests'] += 1
+            endpoint['failures'] = 0
+            endpoint['ejected_until'] = 0
+            if endpoint['latency'] is None:
+                endpoint['latency'] = latency
+            else:
+                endpoint['latency'] += self.LATENCY_WEIGHT * (
+                    latency - endpoint['latency'])
+
+    def report_failure(self, url):
+        with self._lock:
+            endpoint = self._get(url)
+            if endpoint is None:
+                return
+            endpoint['requests'] += 1
+            endpoint['failures'] += 1
+            if endpoint['failures'] >= self.max_failures:
+                _logger.warning("Ejecting endpoint %(url)s for %(time)s "
+                                "seconds", {'url': url,
+                                            'time': self.eject_time})
+                endpoint['ejected_until'] = (utils.monotonic_time() +
+                                             self.eject_time)
+
+    def request(self, method, send):
+        """Send a request with failover.
+
+        :param method: HTTP method of the request.
+        :param send: Callable taking an endpoint URL and returning the
+                     ``(response, body)`` of the request sent to it.
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        endpoints = self.candidates()
+        for i, url in enumerate(endpoints):
+            last = not idempotent or i == len(endpoints) - 1
+            start = utils.monotonic_time()
+            try:
+                resp, body = send(url)
+            except (exceptions.ConnectionFailed, ksa_exc.ConnectionError):
+                self.report_failure(url)
+                if last:
+                    raise
+                _logger.debug("Connection to %s failed, trying the next "
+                              "endpoint", url)
+                continue
+            if resp.status_code in FAILOVER_STATUS_CODES:
+                self.report_failure(url)
+                if not last:
+                    continue
+            else:
+                self.report_success(url, utils.monotonic_time() - start)
+            return resp, body
 
 
 class HTTPClient(object):
-    """Handles the REST calls and responses, include authn."""
+    """Handles the REST calls and responses, include authn.
+
+    Requests are sent through a single :class:`requests.Session` so that
+    TCP connections (and TLS sessions) are kept alive and reused across
+    API calls.
+
+    :param integer pool_connections: Number of per-host connection pools
+                                     to cache. (default: 10)
+    :param integer pool_maxsize: Maximum number of connections to keep
+                                 open to a single host. (default: 10)
+    :param bool pool_block: Whether to block when ``pool_maxsize``
+                            connections to a host are already in use instead
+                            of opening an extra, non-pooled one.
+                            (default: False)
+    :param float pool_idle_timeout: Seconds a pooled connection may stay
+                                    unused before it is dropped and a new
+                                    one is opened. None keeps connections
+                                    until the server closes them.
+                                    (default: None)
+    :param token_cache: A :class:`neutronclient.common.token_cache.TokenCache`
+                        used to reuse the keystone token and service catalog
+                        obtained by a previous process with the same
+                        credentials. (optional)
+    :param integer token_refresh_margin: Seconds before the expiry of a
+                                         token obtained from keystone at
+                                         which a new one is requested ahead
+                                         of the next API call. Concurrent
+                                         callers wait for a single refresh.
+                                         None only re-authenticates after a
+                                         401 response. (default: 60)
+    :param endpoint_urls: Several URLs of the Neutron API to spread the
+                          requests across, see :class:`EndpointPool`.
+                          (optional)
+    :param endpoint_selection: ``round-robin`` or ``least-latency``. When
+                               given without ``endpoint_urls``, requests
+                               are spread across all the endpoints of the
+                               service catalog matching the service type,
+                               endpoint type and region. (optional)
+    :param float endpoint_eject_time: Seconds an endpoint which failed is
+                                      skipped. (default: 30)
+    """
 
     CONTENT_TYPE = 'application/json'
 
@@ -66,6 +325,13 @@ class HTTPClient(object):
                  endpoint_type='publicURL',
                  auth_strategy='keystone', ca_cert=None, log_credentials=False,
                  service_type='network', global_request_id=None,
+                 pool_connections=requests.adapters.DEFAULT_POOLSIZE,
+                 pool_maxsize=requests.adapters.DEFAULT_POOLSIZE,
+                 pool_block=requests.adapters.DEFAULT_POOLBLOCK,
+                 pool_idle_timeout=None, token_cache=None,
+                 token_refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN,
+                 endpoint_urls=None, endpoint_selection=None,
+                 endpoint_eject_time=30,
                  **kwargs):
 
         self.username = username
@@ -81,6 +347,15 @@ class HTTPClient(object):
         self.auth_token = token
         self.auth_tenant_id = None
         self.auth_user_id = None
+        self.endpoint_selection = endpoint_selection
+        self.endpoint_eject_time = endpoint_eject_time
+        self.endpoint_pool = None
+        self.endpoint_url_list = endpoint_urls
+        if endpoint_urls:
+            self.endpoint_pool = EndpointPool(
+                endpoint_urls, selection=endpoint_selection or ROUND_ROBIN,
+                eject_time=endpoint_eject_time)
+            endpoint_url = endpoint_url or self.endpoint_pool.urls[0]
         self.endpoint_url = endpoint_url
         self.auth_strategy = auth_strategy
         self.log_credentials = log_credentials
@@ -89,14 +364,44 @@ class HTTPClient(object):
             self.verify_cert = False
         else:
             self.verify_cert = ca_cert if ca_cert else True
+        self.token_cache = token_cache
+        self.token_refresh_margin = token_refresh_margin
+        self.auth_ref = None
+        self._auth_lock = threading.Lock()
+        self.pool_idle_timeout = pool_idle_timeout
+        self._last_request_time = None
+        self._idle_lock = threading.Lock()
+        self.http_session = requests.Session()
+        http_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block)
+        for prefix in ('http://', 'https://'):
+            self.http_session.mount(prefix, http_adapter)
+
+    def _expire_idle_connections(self):
+        if self.pool_idle_timeout is None:
+            return
+        with self._idle_lock:
+            now = time.time()
+            if (self._last_request_time is not None and
+                    now - self._last_request_time > self.pool_idle_timeout):
+                _logger.debug("Dropping connections idle for more than %s "
+                              "seconds", self.pool_idle_timeout)
+                # Closing the adapters only empties their pools; they keep
+                # serving requests on freshly opened connections.
+                self.http_session.close()
+            self._last_request_time = now
 
     def _cs_request(self, *args, **kwargs):
         kargs = {}
-        kargs.setdefault('headers', kwargs.get('headers', {}))
+        kargs['headers'] = dict(kwargs.get('headers') or {})
         kargs['headers']['User-Agent'] = USER_AGENT
 
         if 'body' in kwargs:
             kargs['body'] = kwargs['body']
+        if kwargs.get('stream'):
+            kargs['stream'] = True
 
         if self.log_credentials:
             log_kargs = kargs
@@ -139,17 +444,47 @@ class HTTPClient(object):
         else:
             return kwargs
 
+    def _token_needs_refresh(self):
+        auth_ref = self.auth_ref
+        return (self.token_refresh_margin is not None and
+                auth_ref is not None and auth_ref.expires is not None and
+                auth_ref.will_expire_soon(self.token_refresh_margin))
+
+    def _refresh_token(self, expired_token):
+        with self._auth_lock:
+            # Another thread may have replaced the token while this one
+            # was waiting for the lock.
+            if self.auth_token != expired_token:
+                return
+            _token_endpoints.invalidate((self.auth_url, expired_token))
+            self._invalidate_cached_auth()
+            self.authenticate()
+
     def authenticate_and_fetch_endpoint_url(self):
         if not self.auth_token:
-            self.authenticate()
+            with self._auth_lock:
+                if not self.auth_token:
+                    self.authenticate()
+        elif self._token_needs_refresh():
+            _logger.debug("Refreshing token expiring at %s",
+                          self.auth_ref.expires)
+            self._refresh_token(self.auth_token)
         elif not self.endpoint_url:
-            self.endpoint_url = self._get_endpoint_url()
+            self.endpoint_url = _token_endpoints.get(
+                (self.auth_url, self.auth_token), self.service_type,
+                self.endpoint_type, self.region_name, self._get_endpoint_url)
 
     def request(self, url, method, body=None, headers=None, **kwargs):
-        """Request without authentication."""
+        """Request without authentication.
+
+        With ``stream=True`` the body is left unread on the returned response
+        and None is returned in place of its text.
+        """
 
         content_type = kwargs.pop('content_type', None) or 'application/json'
-        headers = headers or {}
+        # The caller's headers are left untouched, they may be shared with
+        # other threads.
+        headers = dict(headers or {})
         headers.setdefault('Accept', content_type)
         headers.setdefault('wrs-header', 'true')
 
@@ -165,7 +500,8 @@ class HTTPClient(object):
         if osprofiler_web:
             headers.update(osprofiler_web.get_trace_id_headers())
 
-        resp = requests.request(
+        self._expire_idle_connections()
+        resp = self.http_session.request(
             method,
             url,
             data=body,
@@ -174,6 +510,8 @@ class HTTPClient(object):
             timeout=self.timeout,
             **kwargs)
 
+        if kwargs.get('stream'):
+            return resp, None
         return resp, resp.text
 
     def _check_uri_length(self, action):
@@ -190,25 +528,30 @@ class HTTPClient(object):
         # Perform the request once. If we get a 401 back then it
         # might be because the auth token expired, so try to
         # re-authenticate and try again. If it still fails, bail.
+        auth_token = self.auth_token
+        kwargs['headers'] = dict(kwargs.get('headers') or {})
         try:
-            kwargs.setdefault('headers', {})
-            if self.auth_token is None:
-                self.auth_token = ""
-            kwargs['headers']['X-Auth-Token'] = self.auth_token
-            resp, body = self._cs_request(self.endpoint_url + url, method,
-                                          **kwargs)
+            if auth_token is None:
+                auth_token = self.auth_token = ""
+            kwargs['headers']['X-Auth-Token'] = auth_token
+            resp, body = self._send(url, method, **kwargs)
             return resp, body
         except exceptions.Unauthorized:
-            self.authenticate()
-            kwargs.setdefault('headers', {})
+            self._refresh_token(auth_token)
             kwargs['headers']['X-Auth-Token'] = self.auth_token
-            resp, body = self._cs_request(
-                self.endpoint_url + url, method, **kwargs)
+            resp, body = self._send(url, method, **kwargs)
             return resp, body
 
-    def _extract_service_catalog(self, body):
+    def _send(self, url, method, **kwargs):
+        if self.endpoint_pool is None:
+            return self._cs_request(self.endpoint_url + url, method, **kwargs)
+        return self.endpoint_pool.request(
+            method, lambda endpoint: self._cs_request(endpoint + url, method,
+                                                      **kwargs))
+
+    def _extract_service_catalog(self, body, auth_token=None):
         """Set the client's service catalog from the response data."""
-        self.auth_ref = access.create(body=body)
+        self.auth_ref = access.create(body=body, auth_token=auth_token)
         self.service_catalog = self.auth_ref.service_catalog
         self.auth_token = self.auth_ref.auth_token
         self.auth_tenant_id = self.auth_ref.tenant_id
@@ -219,6 +562,17 @@ class HTTPClient(object):
                 region_name=self.region_name,
                 service_type=self.service_type,
                 interface=self.endpoint_type)
+        if self.endpoint_selection and not self.endpoint_url_list:
+            urls = self.service_catalog.get_urls(
+                region_name=self.region_name,
+                service_type=self.service_type,
+                interface=self.endpoint_type)
+            if self.endpoint_pool is None:
+                self.endpoint_pool = EndpointPool(
+                    urls, selection=self.endpoint_selection,
+                    eject_time=self.endpoint_eject_time)
+            else:
+                self.endpoint_pool.update(urls)
 
     def _authenticate_keystone(self):
         if self.user_id:
@@ -253,6 +607,31 @@ class HTTPClient(object):
         else:
             resp_body = None
         self._extract_service_catalog(resp_body)
+        if self.token_cache and resp_body:
+            self.token_cache.set(self._token_cache_key(),
+                                 {'auth_token': self.auth_token,
+                                  'body': resp_body})
+
+    def _token_cache_key(self):
+        return token_cache.credentials_cache_key(
+            self.auth_url, username=self.username, user_id=self.user_id,
+            project_name=self.project_name, project_id=self.project_id,
+            password=self.password, region_name=self.region_name)
+
+    def _load_cached_auth(self):
+        if not self.token_cache or self.auth_url is None:
+            return False
+        state = self.token_cache.get(self._token_cache_key())
+        if state is None:
+            return False
+        _logger.debug("Using cached token for %s", self.auth_url)
+        self._extract_service_catalog(state['body'],
+                                      auth_token=state['auth_token'])
+        return True
+
+    def _invalidate_cached_auth(self):
+        if self.token_cache and self.auth_url is not None:
+            self.token_cache.invalidate(self._token_cache_key())
 
     def _authenticate_noauth(self):
         if not self.endpoint_url:
@@ -263,7 +642,8 @@ class HTTPClient(object):
 
     def authenticate(self):
         if self.auth_strategy == 'keystone':
-            self._authenticate_keystone()
+            if not self._load_cached_auth():
+                self._authenticate_keystone()
         elif self.auth_strategy == 'noauth':
             self._authenticate_noauth()
         else:
@@ -280,6 +660,7 @@ class HTTPClient(object):
         except exceptions.Unauthorized:
             # rollback to authenticate() to handle case when neutron client
             # is initialized just before the token is expired
+            self._invalidate_cached_auth()
             self.authenticate()
             return self.endpoint_url
 
@@ -301,10 +682,45 @@ class HTTPClient(object):
                 'endpoint_url': self.endpoint_url}
 
     def get_auth_ref(self):
-        return getattr(self, 'auth_ref', None)
+        return self.auth_ref
 
 
 class SessionClient(adapter.Adapter):
+    """HTTP client built on a keystoneauth session.
+
+    The endpoint looked up in the service catalog is cached until the
+    authentication plugin obtains a new token.
+    """
+
+    # Set by construct_http_client, see HTTPClient.
+    token_cache = None
+    endpoint_pool = None
+    endpoint_selection = None
+    endpoint_eject_time = 30
+
+    def __init__(self, *args, **kwargs):
+        super(SessionClient, self).__init__(*args, **kwargs)
+        self._endpoint_cache = EndpointCache(max_entries=1)
+        self._pool_auth_ref = None
+        self._saved_auth_ref = None
+        self._auth_lock = threading.Lock()
+
+    def _update_token_cache(self, resp):
+        auth = self.auth or self.session.auth
+        if resp.status_code == 401:
+            # keystoneauth already retried once with a new token.
+            self.token_cache.invalidate_plugin(auth, self.region_name)
+            self._saved_auth_ref = None
+        else:
+            self._save_token_cache(auth)
+
+    def _save_token_cache(self, auth):
+        # Saving serializes the state of the plugin and writes a file, so
+        # it is only done when the plugin obtained a token since.
+        auth_ref = getattr(auth, 'auth_ref', None)
+        if auth_ref is None or auth_ref is not self._saved_auth_ref:
+            self.token_cache.save_plugin(auth, self.region_name)
+            self._saved_auth_ref = auth_ref
 
     def request(self, *args, **kwargs):
         kwargs.setdefault('authenticated', False)
@@ -312,7 +728,7 @@ class SessionClient(adapter.Adapter):
 
         content_type = kwargs.pop('content_type', None) or 'application/json'
 
-        headers = kwargs.setdefault('headers', {})
+        headers = kwargs['headers'] = dict(kwargs.get('headers') or {})
         headers.setdefault('Accept', content_type)
         headers.setdefault('wrs-header', 'true')
 
@@ -329,9 +745,56 @@ class SessionClient(adapter.Adapter):
         if kwargs.get('data'):
             headers.setdefault('Content-Type', content_type)
 
-        resp = super(SessionClient, self).request(*args, **kwargs)
+        if (kwargs.get('authenticated') and kwargs.pop('allow_reauth', True)
+                and (self.auth or self.session.auth) is not None):
+            resp = self._request_with_reauth(*args, **kwargs)
+        else:
+            resp = super(SessionClient, self).request(*args, **kwargs)
+        if self.token_cache and kwargs.get('authenticated'):
+            self._update_token_cache(resp)
+        if kwargs.get('stream'):
+            return resp, None
         return resp, resp.text
 
+    def _request_with_reauth(self, *args, **kwargs):
+        # keystoneauth invalidates the plugin, which is shared by all the
+        # threads using the session, whenever a request is answered 401.
+        # Threads which sent the same expired token would then discard the
+        # new tokens obtained by each other; only the first one does here.
+        auth = self.auth or self.session.auth
+        self.get_token()
+        sent_auth_ref = getattr(auth, 'auth_ref', None)
+        kwargs['allow_reauth'] = False
+        resp = super(SessionClient, self).request(
+            *args, **self._with_cached_endpoint(kwargs))
+        if resp.status_code != 401:
+            return resp
+        with self._auth_lock:
+            if getattr(auth, 'auth_ref', None) is sent_auth_ref:
+                self._reauthenticate(auth)
+        # The new token may come with another service catalog.
+        return super(SessionClient, self).request(
+            *args, **self._with_cached_endpoint(kwargs))
+
+    def _with_cached_endpoint(self, kwargs):
+        # Saves keystoneauth a service catalog lookup per request. The
+        # endpoint is left to keystoneauth when the request selects it
+        # differently from the adapter.
+        if (self.endpoint_override or kwargs.get('endpoint_override') or
+                kwargs.get('endpoint_filter')):
+            return kwargs
+        return dict(kwargs, endpoint_override=self.endpoint_url)
+
+    def _reauthenticate(self, auth):
+        if (getattr(auth, 'auth_ref', None) is None or
+                not hasattr(auth, 'get_auth_ref')):
+            self.invalidate()
+            self.get_token()
+            return
+        # The new token replaces the old one in a single step: invalidating
+        # the plugin would leave other threads a window without a token.
+        auth.auth_ref = auth.get_auth_ref(self.session)
+
     def _check_uri_length(self, url):
         uri_len = len(self.endpoint_url) + len(url)
         if uri_len > MAX_URI_LEN:
@@ -341,13 +804,49 @@ class SessionClient(adapter.Adapter):
     def do_request(self, url, method, **kwargs):
         kwargs.setdefault('authenticated', True)
         self._check_uri_length(url)
+        pool = self._get_endpoint_pool()
+        if pool is not None and 'endpoint_override' not in kwargs:
+            return pool.request(
+                method, lambda endpoint: self.request(
+                    url, method, endpoint_override=endpoint, **kwargs))
         return self.request(url, method, **kwargs)
 
+    def _get_endpoint_pool(self):
+        if not self.endpoint_selection or self.endpoint_override:
+            return self.endpoint_pool
+        # The pool follows the endpoints of the catalog of the current
+        # token.
+        auth = self.auth or self.session.auth
+        auth_ref = auth.get_access(self.session)
+        if self.endpoint_pool is None or auth_ref is not self._pool_auth_ref:
+            urls = auth_ref.service_catalog.get_urls(
+                service_type=self.service_type, interface=self.interface,
+                region_name=self.region_name)
+            if self.endpoint_pool is None:
+                self.endpoint_pool = EndpointPool(
+                    urls, selection=self.endpoint_selection,
+                    eject_time=self.endpoint_eject_time)
+            else:
+                self.endpoint_pool.update(urls)
+            self._pool_auth_ref = auth_ref
+        return self.endpoint_pool
+
     @property
     def endpoint_url(self):
         # NOTE(jamielennox): This is used purely by the CLI and should be
         # removed when the CLI gets smarter.
-        return self.get_endpoint()
+        auth = self.auth or self.session.auth
+        auth_ref = getattr(auth, 'auth_ref', None)
+        if auth_ref is None:
+            # Authenticates first, unless the plugin has no access info.
+            endpoint = self.get_endpoint()
+            self._endpoint_cache.set(
+                getattr(auth, 'auth_ref', None), self.service_type,
+                self.interface, self.region_name, endpoint)
+            return endpoint
+        return self._endpoint_cache.get(
+            auth_ref, self.service_type, self.interface, self.region_name,
+            self.get_endpoint)
 
     @property
     def auth_token(self):
@@ -359,6 +858,8 @@ class SessionClient(adapter.Adapter):
         # NOTE(jamielennox): This is used purely by the CLI and should be
         # removed when the CLI gets smarter.
         self.get_token()
+        if self.token_cache:
+            self._save_token_cache(self.auth or self.session.auth)
 
     def get_auth_info(self):
         auth_info = {'auth_token': self.auth_token,
@@ -406,17 +907,38 @@ def construct_http_client(username=None,
                           service_type='network',
                           session=None,
                           global_request_id=None,
+                          token_refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN,
                           **kwargs):
 
+    cache = kwargs.pop('token_cache', None)
+    endpoint_urls = kwargs.pop('endpoint_urls', None)
+    endpoint_selection = kwargs.pop('endpoint_selection', None)
+    endpoint_eject_time = kwargs.pop('endpoint_eject_time', 30)
     if session:
+        for pool_kwarg in POOL_KWARGS:
+            kwargs.pop(pool_kwarg, None)
         kwargs.setdefault('user_agent', USER_AGENT)
         kwargs.setdefault('interface', endpoint_type)
-        return SessionClient(session=session,
-                             service_type=service_type,
-                             region_name=region_name,
-                             global_request_id=global_request_id,
-                             **kwargs)
+        httpclient = SessionClient(session=session,
+                                   service_type=service_type,
+                                   region_name=region_name,
+                                   global_request_id=global_request_id,
+                                   **kwargs)
+        if cache:
+            httpclient.token_cache = cache
+            auth = httpclient.auth or session.auth
+            if auth is not None and cache.load_plugin(auth, region_name):
+                httpclient._saved_auth_ref = auth.auth_ref
+        httpclient.endpoint_selection = endpoint_selection
+        httpclient.endpoint_eject_time = endpoint_eject_time
+        if endpoint_urls:
+            httpclient.endpoint_pool = EndpointPool(
+                endpoint_urls, selection=endpoint_selection or ROUND_ROBIN,
+                eject_time=endpoint_eject_time)
+        return httpclient
     else:
+        pool_kwargs = dict((k, v) for k, v in kwargs.items()
+                           if k in POOL_KWARGS)
         # FIXME(bklei): username and password are now optional. Need
         # to test that they were provided in this mode.  Should also
         # refactor to use kwargs.
@@ -436,4 +958,10 @@ def construct_http_client(username=None,
                           ca_cert=ca_cert,
                           log_credentials=log_credentials,
                           auth_strategy=auth_strategy,
-                          global_request_id=global_request_id)
+                          global_request_id=global_request_id,
+                          token_cache=cache,
+                          token_refresh_margin=token_refresh_margin,
+                          endpoint_urls=endpoint_urls,
+                          endpoint_selection=endpoint_selection,
+                          endpoint_eject_time=endpoint_eject_time,
+                          **pool_kwargs)
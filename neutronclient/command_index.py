@@ -0,0 +1,302 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# NOTE: This file is generated by tools/generate_command_index.py from the
+# entry points of setup.cfg. Do not edit it.
+# flake8: noqa
+
+"""Classes of the neutron shell commands, by namespace and command name."""
+
+COMMANDS = {
+    'neutron.cli.v2': {
+        'address-scope-create': 'neutronclient.neutron.v2_0.address_scope:CreateAddressScope',
+        'address-scope-delete': 'neutronclient.neutron.v2_0.address_scope:DeleteAddressScope',
+        'address-scope-list': 'neutronclient.neutron.v2_0.address_scope:ListAddressScope',
+        'address-scope-show': 'neutronclient.neutron.v2_0.address_scope:ShowAddressScope',
+        'address-scope-update': 'neutronclient.neutron.v2_0.address_scope:UpdateAddressScope',
+        'agent-delete': 'neutronclient.neutron.v2_0.agent:DeleteAgent',
+        'agent-list': 'neutronclient.neutron.v2_0.agent:ListAgent',
+        'agent-show': 'neutronclient.neutron.v2_0.agent:ShowAgent',
+        'agent-update': 'neutronclient.neutron.v2_0.agent:UpdateAgent',
+        'auto-allocated-topology-delete': 'neutronclient.neutron.v2_0.auto_allocated_topology:DeleteAutoAllocatedTopology',
+        'auto-allocated-topology-show': 'neutronclient.neutron.v2_0.auto_allocated_topology:ShowAutoAllocatedTopology',
+        'availability-zone-list': 'neutronclient.neutron.v2_0.availability_zone:ListAvailabilityZone',
+        'bash-completion': 'neutronclient.shell:BashCompletionCommand',
+        'bgp-dragent-list-hosting-speaker': 'neutronclient.neutron.v2_0.bgp.dragentscheduler:ListDRAgentsHostingBGPSpeaker',
+        'bgp-dragent-speaker-add': 'neutronclient.neutron.v2_0.bgp.dragentscheduler:AddBGPSpeakerToDRAgent',
+        'bgp-dragent-speaker-remove': 'neutronclient.neutron.v2_0.bgp.dragentscheduler:RemoveBGPSpeakerFromDRAgent',
+        'bgp-peer-create': 'neutronclient.neutron.v2_0.bgp.peer:CreatePeer',
+        'bgp-peer-delete': 'neutronclient.neutron.v2_0.bgp.peer:DeletePeer',
+        'bgp-peer-list': 'neutronclient.neutron.v2_0.bgp.peer:ListPeers',
+        'bgp-peer-show': 'neutronclient.neutron.v2_0.bgp.peer:ShowPeer',
+        'bgp-peer-update': 'neutronclient.neutron.v2_0.bgp.peer:UpdatePeer',
+        'bgp-speaker-advertiseroute-list': 'neutronclient.neutron.v2_0.bgp.speaker:ListRoutesAdvertisedBySpeaker',
+        'bgp-speaker-create': 'neutronclient.neutron.v2_0.bgp.speaker:CreateSpeaker',
+        'bgp-speaker-delete': 'neutronclient.neutron.v2_0.bgp.speaker:DeleteSpeaker',
+        'bgp-speaker-list': 'neutronclient.neutron.v2_0.bgp.speaker:ListSpeakers',
+        'bgp-speaker-list-on-dragent': 'neutronclient.neutron.v2_0.bgp.dragentscheduler:ListBGPSpeakersOnDRAgent',
+        'bgp-speaker-network-add': 'neutronclient.neutron.v2_0.bgp.speaker:AddNetworkToSpeaker',
+        'bgp-speaker-network-remove': 'neutronclient.neutron.v2_0.bgp.speaker:RemoveNetworkFromSpeaker',
+        'bgp-speaker-peer-add': 'neutronclient.neutron.v2_0.bgp.speaker:AddPeerToSpeaker',
+        'bgp-speaker-peer-remove': 'neutronclient.neutron.v2_0.bgp.speaker:RemovePeerFromSpeaker',
+        'bgp-speaker-show': 'neutronclient.neutron.v2_0.bgp.speaker:ShowSpeaker',
+        'bgp-speaker-update': 'neutronclient.neutron.v2_0.bgp.speaker:UpdateSpeaker',
+        'bgp-speaker-vpn-add': 'neutronclient.neutron.v2_0.bgp.speaker:AddVpnToSpeaker',
+        'bgp-speaker-vpn-remove': 'neutronclient.neutron.v2_0.bgp.speaker:RemoveVpnFromSpeaker',
+        'dhcp-agent-list-hosting-net': 'neutronclient.neutron.v2_0.agentscheduler:ListDhcpAgentsHostingNetwork',
+        'dhcp-agent-network-add': 'neutronclient.neutron.v2_0.agentscheduler:AddNetworkToDhcpAgent',
+        'dhcp-agent-network-remove': 'neutronclient.neutron.v2_0.agentscheduler:RemoveNetworkFromDhcpAgent',
+        'ext-list': 'neutronclient.neutron.v2_0.extension:ListExt',
+        'ext-show': 'neutronclient.neutron.v2_0.extension:ShowExt',
+        'firewall-create': 'neutronclient.neutron.v2_0.fw.firewall:CreateFirewall',
+        'firewall-delete': 'neutronclient.neutron.v2_0.fw.firewall:DeleteFirewall',
+        'firewall-list': 'neutronclient.neutron.v2_0.fw.firewall:ListFirewall',
+        'firewall-policy-create': 'neutronclient.neutron.v2_0.fw.firewallpolicy:CreateFirewallPolicy',
+        'firewall-policy-delete': 'neutronclient.neutron.v2_0.fw.firewallpolicy:DeleteFirewallPolicy',
+        'firewall-policy-insert-rule': 'neutronclient.neutron.v2_0.fw.firewallpolicy:FirewallPolicyInsertRule',
+        'firewall-policy-list': 'neutronclient.neutron.v2_0.fw.firewallpolicy:ListFirewallPolicy',
+        'firewall-policy-remove-rule': 'neutronclient.neutron.v2_0.fw.firewallpolicy:FirewallPolicyRemoveRule',
+        'firewall-policy-show': 'neutronclient.neutron.v2_0.fw.firewallpolicy:ShowFirewallPolicy',
+        'firewall-policy-update': 'neutronclient.neutron.v2_0.fw.firewallpolicy:UpdateFirewallPolicy',
+        'firewall-rule-create': 'neutronclient.neutron.v2_0.fw.firewallrule:CreateFirewallRule',
+        'firewall-rule-delete': 'neutronclient.neutron.v2_0.fw.firewallrule:DeleteFirewallRule',
+        'firewall-rule-list': 'neutronclient.neutron.v2_0.fw.firewallrule:ListFirewallRule',
+        'firewall-rule-show': 'neutronclient.neutron.v2_0.fw.firewallrule:ShowFirewallRule',
+        'firewall-rule-update': 'neutronclient.neutron.v2_0.fw.firewallrule:UpdateFirewallRule',
+        'firewall-show': 'neutronclient.neutron.v2_0.fw.firewall:ShowFirewall',
+        'firewall-update': 'neutronclient.neutron.v2_0.fw.firewall:UpdateFirewall',
+        'flavor-associate': 'neutronclient.neutron.v2_0.flavor.flavor:AssociateFlavor',
+        'flavor-create': 'neutronclient.neutron.v2_0.flavor.flavor:CreateFlavor',
+        'flavor-delete': 'neutronclient.neutron.v2_0.flavor.flavor:DeleteFlavor',
+        'flavor-disassociate': 'neutronclient.neutron.v2_0.flavor.flavor:DisassociateFlavor',
+        'flavor-list': 'neutronclient.neutron.v2_0.flavor.flavor:ListFlavor',
+        'flavor-profile-create': 'neutronclient.neutron.v2_0.flavor.flavor_profile:CreateFlavorProfile',
+        'flavor-profile-delete': 'neutronclient.neutron.v2_0.flavor.flavor_profile:DeleteFlavorProfile',
+        'flavor-profile-list': 'neutronclient.neutron.v2_0.flavor.flavor_profile:ListFlavorProfile',
+        'flavor-profile-show': 'neutronclient.neutron.v2_0.flavor.flavor_profile:ShowFlavorProfile',
+        'flavor-profile-update': 'neutronclient.neutron.v2_0.flavor.flavor_profile:UpdateFlavorProfile',
+        'flavor-show': 'neutronclient.neutron.v2_0.flavor.flavor:ShowFlavor',
+        'flavor-update': 'neutronclient.neutron.v2_0.flavor.flavor:UpdateFlavor',
+        'floatingip-associate': 'neutronclient.neutron.v2_0.floatingip:AssociateFloatingIP',
+        'floatingip-create': 'neutronclient.neutron.v2_0.floatingip:CreateFloatingIP',
+        'floatingip-delete': 'neutronclient.neutron.v2_0.floatingip:DeleteFloatingIP',
+        'floatingip-disassociate': 'neutronclient.neutron.v2_0.floatingip:DisassociateFloatingIP',
+        'floatingip-list': 'neutronclient.neutron.v2_0.floatingip:ListFloatingIP',
+        'floatingip-show': 'neutronclient.neutron.v2_0.floatingip:ShowFloatingIP',
+        'host-bind-interface': 'neutronclient.neutron.v2_0.host:BindInterface',
+        'host-create': 'neutronclient.neutron.v2_0.host:CreateHost',
+        'host-delete': 'neutronclient.neutron.v2_0.host:DeleteHost',
+        'host-list': 'neutronclient.neutron.v2_0.host:ListHost',
+        'host-show': 'neutronclient.neutron.v2_0.host:ShowHost',
+        'host-unbind-interface': 'neutronclient.neutron.v2_0.host:UnbindInterface',
+        'host-update': 'neutronclient.neutron.v2_0.host:UpdateHost',
+        'ipsec-site-connection-create': 'neutronclient.neutron.v2_0.vpn.ipsec_site_connection:CreateIPsecSiteConnection',
+        'ipsec-site-connection-delete': 'neutronclient.neutron.v2_0.vpn.ipsec_site_connection:DeleteIPsecSiteConnection',
+        'ipsec-site-connection-list': 'neutronclient.neutron.v2_0.vpn.ipsec_site_connection:ListIPsecSiteConnection',
+        'ipsec-site-connection-show': 'neutronclient.neutron.v2_0.vpn.ipsec_site_connection:ShowIPsecSiteConnection',
+        'ipsec-site-connection-update': 'neutronclient.neutron.v2_0.vpn.ipsec_site_connection:UpdateIPsecSiteConnection',
+        'l3-agent-list-hosting-router': 'neutronclient.neutron.v2_0.agentscheduler:ListL3AgentsHostingRouter',
+        'l3-agent-router-add': 'neutronclient.neutron.v2_0.agentscheduler:AddRouterToL3Agent',
+        'l3-agent-router-remove': 'neutronclient.neutron.v2_0.agentscheduler:RemoveRouterFromL3Agent',
+        'lb-agent-hosting-pool': 'neutronclient.neutron.v2_0.agentscheduler:GetLbaasAgentHostingPool',
+        'lb-healthmonitor-associate': 'neutronclient.neutron.v2_0.lb.healthmonitor:AssociateHealthMonitor',
+        'lb-healthmonitor-create': 'neutronclient.neutron.v2_0.lb.healthmonitor:CreateHealthMonitor',
+        'lb-healthmonitor-delete': 'neutronclient.neutron.v2_0.lb.healthmonitor:DeleteHealthMonitor',
+        'lb-healthmonitor-disassociate': 'neutronclient.neutron.v2_0.lb.healthmonitor:DisassociateHealthMonitor',
+        'lb-healthmonitor-list': 'neutronclient.neutron.v2_0.lb.healthmonitor:ListHealthMonitor',
+        'lb-healthmonitor-show': 'neutronclient.neutron.v2_0.lb.healthmonitor:ShowHealthMonitor',
+        'lb-healthmonitor-update': 'neutronclient.neutron.v2_0.lb.healthmonitor:UpdateHealthMonitor',
+        'lb-member-create': 'neutronclient.neutron.v2_0.lb.member:CreateMember',
+        'lb-member-delete': 'neutronclient.neutron.v2_0.lb.member:DeleteMember',
+        'lb-member-list': 'neutronclient.neutron.v2_0.lb.member:ListMember',
+        'lb-member-show': 'neutronclient.neutron.v2_0.lb.member:ShowMember',
+        'lb-member-update': 'neutronclient.neutron.v2_0.lb.member:UpdateMember',
+        'lb-pool-create': 'neutronclient.neutron.v2_0.lb.pool:CreatePool',
+        'lb-pool-delete': 'neutronclient.neutron.v2_0.lb.pool:DeletePool',
+        'lb-pool-list': 'neutronclient.neutron.v2_0.lb.pool:ListPool',
+        'lb-pool-list-on-agent': 'neutronclient.neutron.v2_0.agentscheduler:ListPoolsOnLbaasAgent',
+        'lb-pool-show': 'neutronclient.neutron.v2_0.lb.pool:ShowPool',
+        'lb-pool-stats': 'neutronclient.neutron.v2_0.lb.pool:RetrievePoolStats',
+        'lb-pool-update': 'neutronclient.neutron.v2_0.lb.pool:UpdatePool',
+        'lb-vip-create': 'neutronclient.neutron.v2_0.lb.vip:CreateVip',
+        'lb-vip-delete': 'neutronclient.neutron.v2_0.lb.vip:DeleteVip',
+        'lb-vip-list': 'neutronclient.neutron.v2_0.lb.vip:ListVip',
+        'lb-vip-show': 'neutronclient.neutron.v2_0.lb.vip:ShowVip',
+        'lb-vip-update': 'neutronclient.neutron.v2_0.lb.vip:UpdateVip',
+        'lbaas-agent-hosting-loadbalancer': 'neutronclient.neutron.v2_0.agentscheduler:GetLbaasAgentHostingLoadBalancer',
+        'lbaas-healthmonitor-create': 'neutronclient.neutron.v2_0.lb.v2.healthmonitor:CreateHealthMonitor',
+        'lbaas-healthmonitor-delete': 'neutronclient.neutron.v2_0.lb.v2.healthmonitor:DeleteHealthMonitor',
+        'lbaas-healthmonitor-list': 'neutronclient.neutron.v2_0.lb.v2.healthmonitor:ListHealthMonitor',
+        'lbaas-healthmonitor-show': 'neutronclient.neutron.v2_0.lb.v2.healthmonitor:ShowHealthMonitor',
+        'lbaas-healthmonitor-update': 'neutronclient.neutron.v2_0.lb.v2.healthmonitor:UpdateHealthMonitor',
+        'lbaas-l7policy-create': 'neutronclient.neutron.v2_0.lb.v2.l7policy:CreateL7Policy',
+        'lbaas-l7policy-delete': 'neutronclient.neutron.v2_0.lb.v2.l7policy:DeleteL7Policy',
+        'lbaas-l7policy-list': 'neutronclient.neutron.v2_0.lb.v2.l7policy:ListL7Policy',
+        'lbaas-l7policy-show': 'neutronclient.neutron.v2_0.lb.v2.l7policy:ShowL7Policy',
+        'lbaas-l7policy-update': 'neutronclient.neutron.v2_0.lb.v2.l7policy:UpdateL7Policy',
+        'lbaas-l7rule-create': 'neutronclient.neutron.v2_0.lb.v2.l7rule:CreateL7Rule',
+        'lbaas-l7rule-delete': 'neutronclient.neutron.v2_0.lb.v2.l7rule:DeleteL7Rule',
+        'lbaas-l7rule-list': 'neutronclient.neutron.v2_0.lb.v2.l7rule:ListL7Rule',
+        'lbaas-l7rule-show': 'neutronclient.neutron.v2_0.lb.v2.l7rule:ShowL7Rule',
+        'lbaas-l7rule-update': 'neutronclient.neutron.v2_0.lb.v2.l7rule:UpdateL7Rule',
+        'lbaas-listener-create': 'neutronclient.neutron.v2_0.lb.v2.listener:CreateListener',
+        'lbaas-listener-delete': 'neutronclient.neutron.v2_0.lb.v2.listener:DeleteListener',
+        'lbaas-listener-list': 'neutronclient.neutron.v2_0.lb.v2.listener:ListListener',
+        'lbaas-listener-show': 'neutronclient.neutron.v2_0.lb.v2.listener:ShowListener',
+        'lbaas-listener-update': 'neutronclient.neutron.v2_0.lb.v2.listener:UpdateListener',
+        'lbaas-loadbalancer-create': 'neutronclient.neutron.v2_0.lb.v2.loadbalancer:CreateLoadBalancer',
+        'lbaas-loadbalancer-delete': 'neutronclient.neutron.v2_0.lb.v2.loadbalancer:DeleteLoadBalancer',
+        'lbaas-loadbalancer-list': 'neutronclient.neutron.v2_0.lb.v2.loadbalancer:ListLoadBalancer',
+        'lbaas-loadbalancer-list-on-agent': 'neutronclient.neutron.v2_0.agentscheduler:ListLoadBalancersOnLbaasAgent',
+        'lbaas-loadbalancer-show': 'neutronclient.neutron.v2_0.lb.v2.loadbalancer:ShowLoadBalancer',
+        'lbaas-loadbalancer-stats': 'neutronclient.neutron.v2_0.lb.v2.loadbalancer:RetrieveLoadBalancerStats',
+        'lbaas-loadbalancer-status': 'neutronclient.neutron.v2_0.lb.v2.loadbalancer:RetrieveLoadBalancerStatus',
+        'lbaas-loadbalancer-update': 'neutronclient.neutron.v2_0.lb.v2.loadbalancer:UpdateLoadBalancer',
+        'lbaas-member-create': 'neutronclient.neutron.v2_0.lb.v2.member:CreateMember',
+        'lbaas-member-delete': 'neutronclient.neutron.v2_0.lb.v2.member:DeleteMember',
+        'lbaas-member-list': 'neutronclient.neutron.v2_0.lb.v2.member:ListMember',
+        'lbaas-member-show': 'neutronclient.neutron.v2_0.lb.v2.member:ShowMember',
+        'lbaas-member-update': 'neutronclient.neutron.v2_0.lb.v2.member:UpdateMember',
+        'lbaas-pool-create': 'neutronclient.neutron.v2_0.lb.v2.pool:CreatePool',
+        'lbaas-pool-delete': 'neutronclient.neutron.v2_0.lb.v2.pool:DeletePool',
+        'lbaas-pool-list': 'neutronclient.neutron.v2_0.lb.v2.pool:ListPool',
+        'lbaas-pool-show': 'neutronclient.neutron.v2_0.lb.v2.pool:ShowPool',
+        'lbaas-pool-update': 'neutronclient.neutron.v2_0.lb.v2.pool:UpdatePool',
+        'meter-label-create': 'neutronclient.neutron.v2_0.metering:CreateMeteringLabel',
+        'meter-label-delete': 'neutronclient.neutron.v2_0.metering:DeleteMeteringLabel',
+        'meter-label-list': 'neutronclient.neutron.v2_0.metering:ListMeteringLabel',
+        'meter-label-rule-create': 'neutronclient.neutron.v2_0.metering:CreateMeteringLabelRule',
+        'meter-label-rule-delete': 'neutronclient.neutron.v2_0.metering:DeleteMeteringLabelRule',
+        'meter-label-rule-list': 'neutronclient.neutron.v2_0.metering:ListMeteringLabelRule',
+        'meter-label-rule-show': 'neutronclient.neutron.v2_0.metering:ShowMeteringLabelRule',
+        'meter-label-show': 'neutronclient.neutron.v2_0.metering:ShowMeteringLabel',
+        'net-create': 'neutronclient.neutron.v2_0.network:CreateNetwork',
+        'net-delete': 'neutronclient.neutron.v2_0.network:DeleteNetwork',
+        'net-external-list': 'neutronclient.neutron.v2_0.network:ListExternalNetwork',
+        'net-ip-availability-list': 'neutronclient.neutron.v2_0.network_ip_availability:ListIpAvailability',
+        'net-ip-availability-show': 'neutronclient.neutron.v2_0.network_ip_availability:ShowIpAvailability',
+        'net-list': 'neutronclient.neutron.v2_0.network:ListNetwork',
+        'net-list-on-dhcp-agent': 'neutronclient.neutron.v2_0.agentscheduler:ListNetworksOnDhcpAgent',
+        'net-list-on-providernet': 'neutronclient.neutron.v2_0.providernet:ListNetworksOnProviderNet',
+        'net-show': 'neutronclient.neutron.v2_0.network:ShowNetwork',
+        'net-update': 'neutronclient.neutron.v2_0.network:UpdateNetwork',
+        'port-create': 'neutronclient.neutron.v2_0.port:CreatePort',
+        'port-delete': 'neutronclient.neutron.v2_0.port:DeletePort',
+        'port-list': 'neutronclient.neutron.v2_0.port:ListPort',
+        'port-show': 'neutronclient.neutron.v2_0.port:ShowPort',
+        'port-update': 'neutronclient.neutron.v2_0.port:UpdatePort',
+        'portforwarding-create': 'neutronclient.neutron.v2_0.portforwarding:CreatePortForwarding',
+        'portforwarding-delete': 'neutronclient.neutron.v2_0.portforwarding:DeletePortForwarding',
+        'portforwarding-list': 'neutronclient.neutron.v2_0.portforwarding:ListPortForwarding',
+        'portforwarding-show': 'neutronclient.neutron.v2_0.portforwarding:ShowPortForwarding',
+        'portforwarding-update': 'neutronclient.neutron.v2_0.portforwarding:UpdatePortForwarding',
+        'providernet-connectivity-test-list': 'neutronclient.neutron.v2_0.providernet:ListProvidernetConnectivityTests',
+        'providernet-connectivity-test-schedule': 'neutronclient.neutron.v2_0.providernet:CreateProvidernetConnectivityTests',
+        'providernet-create': 'neutronclient.neutron.v2_0.providernet:CreateProviderNet',
+        'providernet-delete': 'neutronclient.neutron.v2_0.providernet:DeleteProviderNet',
+        'providernet-list': 'neutronclient.neutron.v2_0.providernet:ListProviderNet',
+        'providernet-range-create': 'neutronclient.neutron.v2_0.providernet:CreateProviderNetRange',
+        'providernet-range-delete': 'neutronclient.neutron.v2_0.providernet:DeleteProviderNetRange',
+        'providernet-range-list': 'neutronclient.neutron.v2_0.providernet:ListProviderNetRange',
+        'providernet-range-show': 'neutronclient.neutron.v2_0.providernet:ShowProviderNetRange',
+        'providernet-range-update': 'neutronclient.neutron.v2_0.providernet:UpdateProviderNetRange',
+        'providernet-show': 'neutronclient.neutron.v2_0.providernet:ShowProviderNet',
+        'providernet-type-list': 'neutronclient.neutron.v2_0.providernet:ListProviderNetType',
+        'providernet-update': 'neutronclient.neutron.v2_0.providernet:UpdateProviderNet',
+        'purge': 'neutronclient.neutron.v2_0.purge:Purge',
+        'qos-available-rule-types': 'neutronclient.neutron.v2_0.qos.rule:ListQoSRuleTypes',
+        'qos-bandwidth-limit-rule-create': 'neutronclient.neutron.v2_0.qos.bandwidth_limit_rule:CreateQoSBandwidthLimitRule',
+        'qos-bandwidth-limit-rule-delete': 'neutronclient.neutron.v2_0.qos.bandwidth_limit_rule:DeleteQoSBandwidthLimitRule',
+        'qos-bandwidth-limit-rule-list': 'neutronclient.neutron.v2_0.qos.bandwidth_limit_rule:ListQoSBandwidthLimitRules',
+        'qos-bandwidth-limit-rule-show': 'neutronclient.neutron.v2_0.qos.bandwidth_limit_rule:ShowQoSBandwidthLimitRule',
+        'qos-bandwidth-limit-rule-update': 'neutronclient.neutron.v2_0.qos.bandwidth_limit_rule:UpdateQoSBandwidthLimitRule',
+        'qos-dscp-marking-rule-create': 'neutronclient.neutron.v2_0.qos.dscp_marking_rule:CreateQoSDscpMarkingRule',
+        'qos-dscp-marking-rule-delete': 'neutronclient.neutron.v2_0.qos.dscp_marking_rule:DeleteQoSDscpMarkingRule',
+        'qos-dscp-marking-rule-list': 'neutronclient.neutron.v2_0.qos.dscp_marking_rule:ListQoSDscpMarkingRules',
+        'qos-dscp-marking-rule-show': 'neutronclient.neutron.v2_0.qos.dscp_marking_rule:ShowQoSDscpMarkingRule',
+        'qos-dscp-marking-rule-update': 'neutronclient.neutron.v2_0.qos.dscp_marking_rule:UpdateQoSDscpMarkingRule',
+        'qos-minimum-bandwidth-rule-create': 'neutronclient.neutron.v2_0.qos.minimum_bandwidth_rule:CreateQoSMinimumBandwidthRule',
+        'qos-minimum-bandwidth-rule-delete': 'neutronclient.neutron.v2_0.qos.minimum_bandwidth_rule:DeleteQoSMinimumBandwidthRule',
+        'qos-minimum-bandwidth-rule-list': 'neutronclient.neutron.v2_0.qos.minimum_bandwidth_rule:ListQoSMinimumBandwidthRules',
+        'qos-minimum-bandwidth-rule-show': 'neutronclient.neutron.v2_0.qos.minimum_bandwidth_rule:ShowQoSMinimumBandwidthRule',
+        'qos-minimum-bandwidth-rule-update': 'neutronclient.neutron.v2_0.qos.minimum_bandwidth_rule:UpdateQoSMinimumBandwidthRule',
+        'qos-policy-create': 'neutronclient.neutron.v2_0.qos.policy:CreateQoSPolicy',
+        'qos-policy-delete': 'neutronclient.neutron.v2_0.qos.policy:DeleteQoSPolicy',
+        'qos-policy-list': 'neutronclient.neutron.v2_0.qos.policy:ListQoSPolicy',
+        'qos-policy-show': 'neutronclient.neutron.v2_0.qos.policy:ShowQoSPolicy',
+        'qos-policy-update': 'neutronclient.neutron.v2_0.qos.policy:UpdateQoSPolicy',
+        'quota-default-show': 'neutronclient.neutron.v2_0.quota:ShowQuotaDefault',
+        'quota-delete': 'neutronclient.neutron.v2_0.quota:DeleteQuota',
+        'quota-list': 'neutronclient.neutron.v2_0.quota:ListQuota',
+        'quota-show': 'neutronclient.neutron.v2_0.quota:ShowQuota',
+        'quota-update': 'neutronclient.neutron.v2_0.quota:UpdateQuota',
+        'rbac-create': 'neutronclient.neutron.v2_0.rbac:CreateRBACPolicy',
+        'rbac-delete': 'neutronclient.neutron.v2_0.rbac:DeleteRBACPolicy',
+        'rbac-list': 'neutronclient.neutron.v2_0.rbac:ListRBACPolicy',
+        'rbac-show': 'neutronclient.neutron.v2_0.rbac:ShowRBACPolicy',
+        'rbac-update': 'neutronclient.neutron.v2_0.rbac:UpdateRBACPolicy',
+        'router-create': 'neutronclient.neutron.v2_0.router:CreateRouter',
+        'router-delete': 'neutronclient.neutron.v2_0.router:DeleteRouter',
+        'router-gateway-clear': 'neutronclient.neutron.v2_0.router:RemoveGatewayRouter',
+        'router-gateway-set': 'neutronclient.neutron.v2_0.router:SetGatewayRouter',
+        'router-interface-add': 'neutronclient.neutron.v2_0.router:AddInterfaceRouter',
+        'router-interface-delete': 'neutronclient.neutron.v2_0.router:RemoveInterfaceRouter',
+        'router-list': 'neutronclient.neutron.v2_0.router:ListRouter',
+        'router-list-on-l3-agent': 'neutronclient.neutron.v2_0.agentscheduler:ListRoutersOnL3Agent',
+        'router-port-list': 'neutronclient.neutron.v2_0.port:ListRouterPort',
+        'router-show': 'neutronclient.neutron.v2_0.router:ShowRouter',
+        'router-update': 'neutronclient.neutron.v2_0.router:UpdateRouter',
+        'security-group-create': 'neutronclient.neutron.v2_0.securitygroup:CreateSecurityGroup',
+        'security-group-delete': 'neutronclient.neutron.v2_0.securitygroup:DeleteSecurityGroup',
+        'security-group-list': 'neutronclient.neutron.v2_0.securitygroup:ListSecurityGroup',
+        'security-group-rule-create': 'neutronclient.neutron.v2_0.securitygroup:CreateSecurityGroupRule',
+        'security-group-rule-delete': 'neutronclient.neutron.v2_0.securitygroup:DeleteSecurityGroupRule',
+        'security-group-rule-list': 'neutronclient.neutron.v2_0.securitygroup:ListSecurityGroupRule',
+        'security-group-rule-show': 'neutronclient.neutron.v2_0.securitygroup:ShowSecurityGroupRule',
+        'security-group-show': 'neutronclient.neutron.v2_0.securitygroup:ShowSecurityGroup',
+        'security-group-update': 'neutronclient.neutron.v2_0.securitygroup:UpdateSecurityGroup',
+        'service-provider-list': 'neutronclient.neutron.v2_0.servicetype:ListServiceProvider',
+        'subnet-create': 'neutronclient.neutron.v2_0.subnet:CreateSubnet',
+        'subnet-delete': 'neutronclient.neutron.v2_0.subnet:DeleteSubnet',
+        'subnet-list': 'neutronclient.neutron.v2_0.subnet:ListSubnet',
+        'subnet-show': 'neutronclient.neutron.v2_0.subnet:ShowSubnet',
+        'subnet-update': 'neutronclient.neutron.v2_0.subnet:UpdateSubnet',
+        'subnetpool-create': 'neutronclient.neutron.v2_0.subnetpool:CreateSubnetPool',
+        'subnetpool-delete': 'neutronclient.neutron.v2_0.subnetpool:DeleteSubnetPool',
+        'subnetpool-list': 'neutronclient.neutron.v2_0.subnetpool:ListSubnetPool',
+        'subnetpool-show': 'neutronclient.neutron.v2_0.subnetpool:ShowSubnetPool',
+        'subnetpool-update': 'neutronclient.neutron.v2_0.subnetpool:UpdateSubnetPool',
+        'tag-add': 'neutronclient.neutron.v2_0.tag:AddTag',
+        'tag-remove': 'neutronclient.neutron.v2_0.tag:RemoveTag',
+        'tag-replace': 'neutronclient.neutron.v2_0.tag:ReplaceTag',
+        'vpn-endpoint-group-create': 'neutronclient.neutron.v2_0.vpn.endpoint_group:CreateEndpointGroup',
+        'vpn-endpoint-group-delete': 'neutronclient.neutron.v2_0.vpn.endpoint_group:DeleteEndpointGroup',
+        'vpn-endpoint-group-list': 'neutronclient.neutron.v2_0.vpn.endpoint_group:ListEndpointGroup',
+        'vpn-endpoint-group-show': 'neutronclient.neutron.v2_0.vpn.endpoint_group:ShowEndpointGroup',
+        'vpn-endpoint-group-update': 'neutronclient.neutron.v2_0.vpn.endpoint_group:UpdateEndpointGroup',
+        'vpn-ikepolicy-create': 'neutronclient.neutron.v2_0.vpn.ikepolicy:CreateIKEPolicy',
+        'vpn-ikepolicy-delete': 'neutronclient.neutron.v2_0.vpn.ikepolicy:DeleteIKEPolicy',
+        'vpn-ikepolicy-list': 'neutronclient.neutron.v2_0.vpn.ikepolicy:ListIKEPolicy',
+        'vpn-ikepolicy-show': 'neutronclient.neutron.v2_0.vpn.ikepolicy:ShowIKEPolicy',
+        'vpn-ikepolicy-update': 'neutronclient.neutron.v2_0.vpn.ikepolicy:UpdateIKEPolicy',
+        'vpn-ipsecpolicy-create': 'neutronclient.neutron.v2_0.vpn.ipsecpolicy:CreateIPsecPolicy',
+        'vpn-ipsecpolicy-delete': 'neutronclient.neutron.v2_0.vpn.ipsecpolicy:DeleteIPsecPolicy',
+        'vpn-ipsecpolicy-list': 'neutronclient.neutron.v2_0.vpn.ipsecpolicy:ListIPsecPolicy',
+        'vpn-ipsecpolicy-show': 'neutronclient.neutron.v2_0.vpn.ipsecpolicy:ShowIPsecPolicy',
+        'vpn-ipsecpolicy-update': 'neutronclient.neutron.v2_0.vpn.ipsecpolicy:UpdateIPsecPolicy',
+        'vpn-service-create': 'neutronclient.neutron.v2_0.vpn.vpnservice:CreateVPNService',
+        'vpn-service-delete': 'neutronclient.neutron.v2_0.vpn.vpnservice:DeleteVPNService',
+        'vpn-service-list': 'neutronclient.neutron.v2_0.vpn.vpnservice:ListVPNService',
+        'vpn-service-show': 'neutronclient.neutron.v2_0.vpn.vpnservice:ShowVPNService',
+        'vpn-service-update': 'neutronclient.neutron.v2_0.vpn.vpnservice:UpdateVPNService',
+    },
+}
@@ -0,0 +1,148 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""Concurrent execution of independent client calls."""
+
+from neutronclient._i18n import _
+from neutronclient.common import utils
+
+DEFAULT_MAX_WORKERS = 10
+
+
+class BatchCall(object):
+    """A call queued in a batch, and its outcome once the batch has run."""
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.done = False
+        self._result = None
+        self._exception = None
+
+    def __call__(self):
+        return self.func(*self.args, **self.kwargs)
+
+    def _set_outcome(self, outcome):
+        if isinstance(outcome, Exception):
+            self._exception = outcome
+        else:
+            self._result = outcome
+        self.done = True
+
+    def _check_done(self):
+        if not self.done:
+            raise RuntimeError(_("The batch has not been run"))
+
+    @property
+    def exception(self):
+        """The exception raised by the call, or None."""
+        self._check_done()
+        return self._exception
+
+    def result(self):
+        """Return the result of the call, or raise its exception."""
+        self._check_done()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    @property
+    def request_ids(self):
+        outcome = self._exception or self._result
+        return list(getattr(outcome, 'request_ids', None) or [])
+
+
+class Batch(object):
+    """Calls of a client queued to be run concurrently.
+
+    Client methods called on a batch are not run right away: each call
+    returns a :class:`BatchCall`, and the queued calls are run on up to
+    ``max_workers`` threads when the ``with`` block using the batch exits,
+    or when ``run`` is called. An exception raised by a call does not stop
+    the others; it is raised by the ``result`` method of its call and
+    listed in ``errors``.
+
+    Example::
+
+        with neutron.batch(max_workers=20) as batch:
+            ports = [batch.show_port(port_id) for port_id in port_ids]
+            subnet = batch.show_subnet(subnet_id)
+        for port in ports:
+            print(port.result()['port']['name'])
+
+    :param client: The client whose methods are called.
+    :param integer max_workers: Maximum number of calls run at once.
+                                (default: 10)
+    """
+
+    def __init__(self, client, max_workers=DEFAULT_MAX_WORKERS):
+        self.client = client
+        self.max_workers = max_workers
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.run()
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            return self.submit(method, *args, **kwargs)
+        return queue
+
+    def submit(self, func, *args, **kwargs):
+        """Queue a call to ``func`` with the given arguments."""
+        call = BatchCall(func, args, kwargs)
+        self.calls.append(call)
+        return call
+
+    def run(self):
+        """Run the calls not run yet and return the results of all of them.
+
+        Results are in the order the calls were queued; the exception
+        raised by a call is returned in place of its result.
+        """
+        pending = [call for call in self.calls if not call.done]
+        outcomes = utils.map_concurrently(lambda call: call(), pending,
+                                          max_workers=self.max_workers,
+                                          return_exceptions=True)
+        for call, outcome in zip(pending, outcomes):
+            call._set_outcome(outcome)
+        return self.results
+
+    @property
+    def results(self):
+        """Results of the calls, or their exceptions, in order."""
+        return [call.exception or call._result for call in self.calls]
+
+    @property
+    def errors(self):
+        """``(index, exception)`` of each failed call."""
+        return [(index, call.exception)
+                for index, call in enumerate(self.calls)
+                if call.exception is not None]
+
+    @property
+    def request_ids(self):
+        """Request IDs of all the calls, in order."""
+        request_ids = []
+        for call in self.calls:
+            request_ids.extend(call.request_ids)
+        return request_ids
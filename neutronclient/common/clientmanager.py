@@ -69,6 +69,8 @@ class ClientManager(object):
                  raise_errors=True,
                  session=None,
                  auth=None,
+                 token_cache=None,
+                 id_cache=False,
                  ):
         self._token = token
         self._url = url
@@ -93,6 +95,8 @@ class ClientManager(object):
         self._raise_errors = raise_errors
         self._session = session
         self._auth = auth
+        self._token_cache = token_cache
+        self._id_cache = id_cache
         return
 
     def initialize(self):
@@ -113,7 +117,8 @@ class ClientManager(object):
                 timeout=self._timeout,
                 session=self._session,
                 auth=self._auth,
-                log_credentials=self._log_credentials)
+                log_credentials=self._log_credentials,
+                token_cache=self._token_cache)
             httpclient.authenticate()
             # Populate other password flow attributes
             self._token = httpclient.auth_token
@@ -14,6 +14,11 @@
 # limitations under the License.
 
 
+HEX_ELEM = '[0-9A-Fa-f]'
+UUID_PATTERN = '-'.join([HEX_ELEM + '{8}', HEX_ELEM + '{4}',
+                         HEX_ELEM + '{4}', HEX_ELEM + '{4}',
+                         HEX_ELEM + '{12}'])
+
 TYPE_BOOL = "bool"
 TYPE_INT = "int"
 TYPE_LONG = "long"
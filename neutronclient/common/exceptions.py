@@ -74,9 +74,12 @@ class NeutronClientException(NeutronException):
     status_code = 0
     req_ids_msg = _("Neutron server returns request_ids: %s")
     request_ids = []
+    # Value of the Retry-After header of the response, if any.
+    retry_after = None
 
     def __init__(self, message=None, **kwargs):
         self.request_ids = kwargs.get('request_ids')
+        self.retry_after = kwargs.get('retry_after')
         if 'status_code' in kwargs:
             self.status_code = kwargs['status_code']
         if self.request_ids:
@@ -118,6 +121,10 @@ class InternalServerError(NeutronClientException):
     status_code = 500
 
 
+class TooManyRequests(NeutronClientException):
+    status_code = 429
+
+
 class ServiceUnavailable(NeutronClientException):
     status_code = 503
 
@@ -128,6 +135,7 @@ HTTP_EXCEPTION_MAP = {
     403: Forbidden,
     404: NotFound,
     409: Conflict,
+    429: TooManyRequests,
     500: InternalServerError,
     503: ServiceUnavailable,
 }
@@ -217,6 +225,21 @@ class RequestURITooLong(NeutronClientException):
         super(RequestURITooLong, self).__init__(**kwargs)
 
 
+class BulkCreateFailed(NeutronClientException):
+    """Raised when requests of a bulk creation failed.
+
+    ``created`` lists the resources created by the other requests, in the
+    order of the items, and ``failures`` holds an ``(index, items,
+    exception)`` tuple per failed request, ``index`` being the position of
+    its first item.
+    """
+
+    def __init__(self, message=None, **kwargs):
+        self.created = kwargs.pop('created', [])
+        self.failures = kwargs.pop('failures', [])
+        super(BulkCreateFailed, self).__init__(message, **kwargs)
+
+
 class ConnectionFailed(NeutronClientException):
     message = _("Connection to neutron failed: %(reason)s")
 
@@ -0,0 +1,112 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""Client-side cache of the resolution of resource names to IDs."""
+
+import collections
+import threading
+
+from neutronclient.common import utils
+
+DEFAULT_TTL = 30
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class IdCache(object):
+    """Cache of the resolution of resource names or IDs to IDs.
+
+    Entries are keyed by everything the resolution depends on: the resource
+    type, the name or ID, the project and the parent resource. They expire
+    after ``ttl`` seconds and the least recently used ones are evicted
+    beyond ``max_entries``. The entries resolving to a resource are dropped
+    when the client updates or deletes it.
+
+    Resources renamed, created or deleted by other clients are only seen
+    once entries expire. A cache must not be shared by clients using
+    different credentials.
+
+    :param float ttl: Seconds entries are kept. (default: 30)
+    :param integer max_entries: Maximum number of entries. (default: 1000)
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # Maps keys to (resource ID, expiration time).
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        # Incremented by each invalidation, so that the resolutions which
+        # started before it are not cached.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def stats(self):
+        """Counters of the cache activity."""
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'invalidations': self.invalidations,
+                    'entries': len(self._entries)}
+
+    def get(self, key):
+        """Return the cached ID of ``key`` or None."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[1] <= utils.monotonic_time():
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self.hits += 1
+            return entry[0]
+
+    def begin(self):
+        """Return the token to pass to ``set`` before resolving."""
+        with self._lock:
+            return self._generation
+
+    def set(self, key, resource_id, token):
+        """Cache the ID ``key`` resolved to.
+
+        :param token: The value returned by ``begin`` before resolving.
+        """
+        if not self.ttl:
+            return
+        with self._lock:
+            if token != self._generation:
+                return
+            self._entries.pop(key, None)
+            self._entries[key] = (resource_id,
+                                  utils.monotonic_time() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path=None):
+        """Drop the entries of the resources in ``path``, or all of them.
+
+        :param path: A request path, e.g. ``/ports/<id>``; the entries
+                     resolving to any of its segments are dropped.
+        """
+        with self._lock:
+            self._generation += 1
+            if path is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                return
+            segments = set(path.split('?', 1)[0].strip('/').split('/'))
+            for key, entry in list(self._entries.items()):
+                if entry[0] in segments:
+                    del self._entries[key]
+                    self.invalidations += 1
@@ -0,0 +1,227 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""Client-side cache of single resources read from the Neutron server."""
+
+import collections
+import copy
+import threading
+
+from neutronclient.common import utils
+
+DEFAULT_TTL = 30
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def _segments(path):
+    return path.split('?', 1)[0].strip('/').split('/')
+
+
+def _is_prefix(shorter, longer):
+    return longer[:len(shorter)] == shorter
+
+
+def get_single_resource(body):
+    """Return ``(resource_type, resource)`` for a show response, or None.
+
+    Show responses hold a single member, named after the resource type,
+    whose value is the resource.
+    """
+    if isinstance(body, dict) and len(body) == 1:
+        resource_type, resource = next(iter(body.items()))
+        if isinstance(resource, dict):
+            return resource_type, resource
+    return None
+
+
+class _Entry(object):
+
+    def __init__(self, path, value, resource_type, resource, expires):
+        self.segments = _segments(path)
+        self.value = value
+        self.resource_id = resource.get('id')
+        self.revision = resource.get('revision_number')
+        self.resource_type = resource_type
+        self.expires = expires
+
+
+class ResourceCache(object):
+    """Read-through cache of the responses to show requests.
+
+    Entries are keyed by request path and query parameters, so that a
+    resource shown with ``fields`` is cached apart from the full one. They
+    expire after the TTL of their resource type and the least recently used
+    ones are evicted beyond ``max_entries``.
+
+    Entries are dropped when the client sends a PUT or DELETE request on
+    their path, a parent of it or a child of it, e.g. updating a router or
+    adding an interface to it drops the cached router, or a POST request on
+    a child of their path. Resources seen in other responses, such as
+    lists, with a higher ``revision_number`` than a cached copy make that
+    copy stale, and a response older than the last write is never cached.
+
+    Changes made by other clients are only seen once entries expire. A
+    cache must not be shared by clients using different credentials.
+
+    :param float ttl: Seconds entries are kept. (default: 30)
+    :param integer max_entries: Maximum number of entries. (default: 1000)
+    :param policies: Dict mapping resource types, e.g. ``'port'``, to their
+                     own TTL; a TTL of 0 disables caching of that type.
+                     (optional)
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES,
+                 policies=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.policies = dict(policies or {})
+        self._entries = collections.OrderedDict()
+        # Keys of the entries of each resource ID.
+        self._keys = collections.defaultdict(set)
+        self._lock = threading.Lock()
+        # Incremented by each write, so that the responses to reads which
+        # started before it are not cached.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def stats(self):
+        """Counters of the cache activity.
+
+        ``evictions`` counts entries dropped to respect ``max_entries``,
+        ``expirations`` those which outlived their TTL and
+        ``invalidations`` those dropped after a write or because a newer
+        revision was seen.
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'expirations': self.expirations,
+                    'invalidations': self.invalidations,
+                    'entries': len(self._entries)}
+
+    def _add(self, key, entry):
+        self._remove(key)
+        self._entries[key] = entry
+        self._keys[entry.resource_id].add(key)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            keys = self._keys[entry.resource_id]
+            keys.discard(key)
+            if not keys:
+                del self._keys[entry.resource_id]
+        return entry
+
+    def _drop_older(self, resource_id, revision):
+        if resource_id is None or revision is None:
+            return
+        for key in list(self._keys.get(resource_id, ())):
+            entry = self._entries[key]
+            if entry.revision is not None and entry.revision < revision:
+                self._remove(key)
+                self.invalidations += 1
+
+    def get_ttl(self, resource_type):
+        return self.policies.get(resource_type, self.ttl)
+
+    def get(self, key):
+        """Return a copy of the cached value of ``key`` or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= utils.monotonic_time():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._add(key, entry)
+            self.hits += 1
+        return copy.deepcopy(entry.value)
+
+    def begin(self):
+        """Return the token to pass to ``set`` for a read starting now."""
+        with self._lock:
+            return self._generation
+
+    def set(self, key, path, value, token):
+        """Cache the response to a GET request if it shows a resource.
+
+        :param key: The cache key of the request.
+        :param path: The request path, without query parameters.
+        :param value: The deserialized response.
+        :param token: The value returned by ``begin`` before the request.
+        """
+        single = get_single_resource(value)
+        if single is None:
+            self.observe(value)
+            return
+        resource_type, resource = single
+        ttl = self.get_ttl(resource_type)
+        if not ttl:
+            return
+        entry = _Entry(path, copy.deepcopy(value), resource_type, resource,
+                       utils.monotonic_time() + ttl)
+        with self._lock:
+            if token != self._generation:
+                return
+            self._drop_older(entry.resource_id, entry.revision)
+            self._add(key, entry)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def observe(self, body):
+        """Drop the entries older than the resources of a response."""
+        if not isinstance(body, dict):
+            return
+        revisions = {}
+        for value in body.values():
+            resources = value if isinstance(value, list) else [value]
+            for resource in resources:
+                if (isinstance(resource, dict) and
+                        resource.get('revision_number') is not None):
+                    revisions[resource.get('id')] = resource[
+                        'revision_number']
+        if not revisions:
+            return
+        with self._lock:
+            for resource_id, revision in revisions.items():
+                self._drop_older(resource_id, revision)
+
+    def invalidate(self, path=None, children=True):
+        """Drop the entries related to ``path``, or all of them.
+
+        :param children: Also drop the entries of the paths below ``path``,
+                         not only those of ``path`` and its parents.
+        """
+        with self._lock:
+            self._generation += 1
+            if path is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._keys.clear()
+                return
+            segments = _segments(path)
+            for key, entry in list(self._entries.items()):
+                if (_is_prefix(entry.segments, segments) or
+                        children and _is_prefix(segments, entry.segments)):
+                    self._remove(key)
+                    self.invalidations += 1
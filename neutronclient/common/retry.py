@@ -0,0 +1,147 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""Retry policies for requests to the Neutron server."""
+
+import email.utils
+import math
+import random
+import time
+
+from keystoneauth1 import exceptions as ksa_exc
+
+from neutronclient.common import exceptions
+
+# Neutron answers these while its API workers are saturated or restarting.
+RETRIABLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value):
+    """Return the delay in seconds requested by a Retry-After header.
+
+    Both the delta-seconds and the HTTP-date forms are accepted. None is
+    returned for missing or invalid values, including infinite ones.
+    """
+    if value is None:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        pass
+    else:
+        if math.isinf(delay) or math.isnan(delay):
+            return None
+        return max(0.0, delay)
+    date = email.utils.parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0.0, email.utils.mktime_tz(date) - time.time())
+
+
+def is_connection_error(exc):
+    return isinstance(exc, (exceptions.ConnectionFailed,
+                            ksa_exc.ConnectionError))
+
+
+class RetryPolicy(object):
+    """Decide whether and when a failed request is sent again.
+
+    The delay before retry ``n`` (starting at 0) is
+    ``backoff * backoff_factor ** n``, capped by ``max_backoff``. With
+    ``jitter`` the actual delay is drawn uniformly between 0 and that
+    value, so that many clients failing at once do not retry in lockstep.
+    A Retry-After header sent by the server takes precedence when it asks
+    for a longer delay, up to ``max_backoff`` as well.
+
+    POST requests are not idempotent: retrying one after a timeout or a
+    5xx response may create the resource twice. They are therefore only
+    retried with ``retry_post``.
+
+    :param integer max_retries: Maximum number of retries. (default: 3)
+    :param float backoff: Delay before the first retry, in seconds.
+                          (default: 0.5)
+    :param float backoff_factor: Growth factor of the delay between
+                                 consecutive retries. (default: 2)
+    :param float max_backoff: Upper bound of the delay, including the one
+                              requested by Retry-After, None for no bound.
+                              (default: 30)
+    :param bool jitter: Randomize delays. (default: True)
+    :param status_codes: HTTP status codes of the responses to retry.
+                         (default: 429 and 503)
+    :param bool retry_connection_errors: Retry requests which could not
+                                         reach the server. (default: True)
+    :param bool retry_post: Also retry POST requests. (default: False)
+    :param bool respect_retry_after: Honour Retry-After headers.
+                                     (default: True)
+    :param float time_budget: Maximum number of seconds spent on a call,
+                              retries included; a retry which would end
+                              its delay past the budget is not attempted.
+                              None for no limit. (default: None)
+    """
+
+    def __init__(self, max_retries=3, backoff=0.5, backoff_factor=2.0,
+                 max_backoff=30.0, jitter=True,
+                 status_codes=RETRIABLE_STATUS_CODES,
+                 retry_connection_errors=True, retry_post=False,
+                 respect_retry_after=True, time_budget=None):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes)
+        self.retry_connection_errors = retry_connection_errors
+        self.retry_post = retry_post
+        self.respect_retry_after = respect_retry_after
+        self.time_budget = time_budget
+
+    def allows_method(self, method):
+        return self.retry_post or method.upper() != 'POST'
+
+    def is_retriable(self, method, exc):
+        if not self.allows_method(method):
+            return False
+        if is_connection_error(exc):
+            return self.retry_connection_errors
+        return getattr(exc, 'status_code', None) in self.status_codes
+
+    def get_delay(self, retry, exc=None):
+        """Return the delay in seconds before retry number ``retry``."""
+        delay = self.backoff * self.backoff_factor ** retry
+        if self.max_backoff is not None:
+            delay = min(delay, self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(getattr(exc, 'retry_after', None))
+            if retry_after is not None:
+                if self.max_backoff is not None:
+                    retry_after = min(retry_after, self.max_backoff)
+                delay = max(delay, retry_after)
+        return delay
+
+    def next_delay(self, method, retry, exc, elapsed=0):
+        """Return the delay before retrying after ``exc``, or None.
+
+        :param method: HTTP method of the failed request.
+        :param retry: Number of retries already made.
+        :param exc: The exception raised by the last attempt.
+        :param elapsed: Seconds spent on the call so far.
+        """
+        if retry >= self.max_retries or not self.is_retriable(method, exc):
+            return None
+        delay = self.get_delay(retry, exc)
+        if (self.time_budget is not None and
+                elapsed + delay > self.time_budget):
+            return None
+        return delay
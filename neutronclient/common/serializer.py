@@ -13,7 +13,14 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import codecs
+import json
+import logging
+import os
+import re
+
 from oslo_serialization import jsonutils
+from oslo_utils import importutils
 import six
 
 from neutronclient._i18n import _
@@ -23,6 +30,123 @@ from neutronclient.common import exceptions as exception
 if six.PY3:
     long = int
 
+_logger = logging.getLogger(__name__)
+
+JSON_CODEC_ENV = 'NEUTRONCLIENT_JSON_CODEC'
+DEFAULT_JSON_CODEC = 'json'
+
+
+class JSONCodec(object):
+    """Standard library JSON backend, through oslo.serialization."""
+
+    def dumps(self, data, default=None):
+        return jsonutils.dumps(data, default=default)
+
+    def loads(self, datastring):
+        return jsonutils.loads(datastring)
+
+
+class SimpleJSONCodec(JSONCodec):
+
+    def __init__(self):
+        self.simplejson = importutils.import_module('simplejson')
+
+    def dumps(self, data, default=None):
+        return self.simplejson.dumps(data, default=default)
+
+    def loads(self, datastring):
+        return self.simplejson.loads(datastring)
+
+
+class UJSONCodec(JSONCodec):
+
+    def __init__(self):
+        self.ujson = importutils.import_module('ujson')
+        try:
+            self.ujson.dumps({}, default=six.text_type)
+        except TypeError:
+            # ujson < 5.0 cannot fall back to a default function for
+            # objects it does not know how to encode.
+            raise ImportError(_("ujson >= 5.0 is required"))
+
+    def dumps(self, data, default=None):
+        return self.ujson.dumps(data, default=default,
+                                escape_forward_slashes=False)
+
+    def loads(self, datastring):
+        return self.ujson.loads(datastring)
+
+
+class ORJSONCodec(JSONCodec):
+
+    def __init__(self):
+        self.orjson = importutils.import_module('orjson')
+
+    def dumps(self, data, default=None):
+        # orjson produces UTF-8 bytes, while request bodies are ASCII text
+        # everywhere else in the client.
+        result = self.orjson.dumps(
+            data, default=default,
+            option=self.orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        try:
+            result.encode('ascii')
+        except UnicodeEncodeError:
+            return super(ORJSONCodec, self).dumps(data, default=default)
+        return result
+
+    def loads(self, datastring):
+        return self.orjson.loads(datastring)
+
+
+JSON_CODECS = {
+    'json': JSONCodec,
+    'simplejson': SimpleJSONCodec,
+    'ujson': UJSONCodec,
+    'orjson': ORJSONCodec,
+}
+
+_codec_instances = {}
+
+
+def register_json_codec(name, codec_class):
+    """Make a JSON backend selectable under ``name``.
+
+    ``codec_class`` is instantiated without arguments and should raise
+    ImportError when the backend is not available.
+    """
+    JSON_CODECS[name] = codec_class
+    _codec_instances.pop(name, None)
+
+
+def get_json_codec(names=None):
+    """Return the first available JSON backend.
+
+    :param names: a codec name, a comma separated string of names or a list
+                  of names tried in order. Defaults to the value of the
+                  NEUTRONCLIENT_JSON_CODEC environment variable, then to the
+                  standard library backend, which is also the last resort
+                  when none of the requested backends can be loaded.
+    """
+    if not names:
+        names = os.environ.get(JSON_CODEC_ENV) or DEFAULT_JSON_CODEC
+    if isinstance(names, six.string_types):
+        names = names.split(',')
+    for name in [n.strip() for n in names] + [DEFAULT_JSON_CODEC]:
+        if name in _codec_instances:
+            return _codec_instances[name]
+        codec_class = JSON_CODECS.get(name)
+        if codec_class is None:
+            _logger.warning("Unknown JSON codec '%s' ignored", name)
+            continue
+        try:
+            codec = codec_class()
+        except ImportError as e:
+            _logger.debug("JSON codec '%(name)s' is unavailable: %(err)s",
+                          {'name': name, 'err': e})
+            continue
+        _codec_instances[name] = codec
+        return codec
+
 
 class ActionDispatcher(object):
     """Maps method name to local methods through action name."""
@@ -50,10 +174,13 @@ class DictSerializer(ActionDispatcher):
 class JSONDictSerializer(DictSerializer):
     """Default JSON request body serialization."""
 
+    def __init__(self, codec=None):
+        self.codec = codec or get_json_codec(DEFAULT_JSON_CODEC)
+
     def default(self, data):
         def sanitizer(obj):
             return six.text_type(obj)
-        return jsonutils.dumps(data, default=sanitizer)
+        return self.codec.dumps(data, default=sanitizer)
 
 
 class TextDeserializer(ActionDispatcher):
@@ -68,9 +195,12 @@ class TextDeserializer(ActionDispatcher):
 
 class JSONDeserializer(TextDeserializer):
 
+    def __init__(self, codec=None):
+        self.codec = codec or get_json_codec(DEFAULT_JSON_CODEC)
+
     def _from_json(self, datastring):
         try:
-            return jsonutils.loads(datastring)
+            return self.codec.loads(datastring)
         except ValueError:
             msg = _("Cannot understand JSON")
             raise exception.MalformedResponseBody(reason=msg)
@@ -79,26 +209,127 @@ class JSONDeserializer(TextDeserializer):
         return {'body': self._from_json(datastring)}
 
 
+class JSONCollectionStreamDeserializer(object):
+    """Incrementally decode a ``{"<collection>": [...], ...}`` document.
+
+    Resources of ``collection`` are yielded one at a time as soon as their
+    JSON text has been received, so the whole response body never has to be
+    held in memory. Every other top-level member (such as
+    ``<collection>_links``) is decoded as a whole and stored in ``extra``.
+    """
+
+    _WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.extra = {}
+        self._decoder = json.JSONDecoder()
+
+    def iter_resources(self, chunks):
+        """Yield collection members decoded from an iterable of bytes."""
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buf = u''
+        self._pos = 0
+        self._eof = False
+
+        self._expect(u'{')
+        while True:
+            char = self._peek()
+            if char == u'}':
+                return
+            if char == u',':
+                self._pos += 1
+                continue
+            key = self._decode_value()
+            self._expect(u':')
+            if key == self.collection and self._peek() == u'[':
+                self._pos += 1
+                for resource in self._iter_array():
+                    yield resource
+            else:
+                self.extra[key] = self._decode_value()
+
+    def _iter_array(self):
+        while True:
+            char = self._peek()
+            if char == u']':
+                self._pos += 1
+                return
+            if char == u',':
+                self._pos += 1
+                continue
+            yield self._decode_value()
+
+    def _fill(self):
+        """Read one more chunk, dropping the text already consumed."""
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = (self._buf[self._pos:] +
+                             self._text_decoder.decode(chunk))
+                self._pos = 0
+                return True
+        self._eof = True
+        return False
+
+    def _malformed(self):
+        msg = _("Cannot understand JSON")
+        return exception.MalformedResponseBody(reason=msg)
+
+    def _peek(self):
+        while True:
+            self._pos = self._WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise self._malformed()
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise self._malformed()
+        self._pos += 1
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                value, end = None, None
+            # A value ending exactly at the end of the buffer (e.g. a
+            # number) may continue in the next chunk.
+            if end is not None and (end < len(self._buf) or self._eof):
+                self._pos = end
+                return value
+            if not self._fill() and end is None:
+                raise self._malformed()
+
+
 # NOTE(maru): this class is duplicated from neutron.wsgi
 class Serializer(object):
     """Serializes and deserializes dictionaries to certain MIME types."""
 
-    def __init__(self, metadata=None):
+    def __init__(self, metadata=None, codec=None):
         """Create a serializer based on the given WSGI environment.
 
         'metadata' is an optional dict mapping MIME types to information
         needed to serialize a dictionary to that type.
 
+        'codec' selects the JSON backend, see get_json_codec().
+
         """
         self.metadata = metadata or {}
-
-    def _get_serialize_handler(self, content_type):
-        handlers = {
-            'application/json': JSONDictSerializer(),
+        self.codec = get_json_codec(codec)
+        self._serialize_handlers = {
+            'application/json': JSONDictSerializer(self.codec),
+        }
+        self._deserialize_handlers = {
+            'application/json': JSONDeserializer(self.codec),
         }
 
+    def _get_serialize_handler(self, content_type):
         try:
-            return handlers[content_type]
+            return self._serialize_handlers[content_type]
         except Exception:
             raise exception.InvalidContentType(content_type=content_type)
 
@@ -115,11 +346,7 @@ class Serializer(object):
             datastring)
 
     def get_deserialize_handler(self, content_type):
-        handlers = {
-            'application/json': JSONDeserializer(),
-        }
-
         try:
-            return handlers[content_type]
+            return self._deserialize_handlers[content_type]
         except Exception:
             raise exception.InvalidContentType(content_type=content_type)
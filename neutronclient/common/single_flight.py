@@ -0,0 +1,91 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""Coalescing of identical concurrent read requests."""
+
+import copy
+import sys
+import threading
+
+import six
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exc_info = None
+
+
+class SingleFlight(object):
+    """Share the outcome of a call among the callers asking for it at once.
+
+    The first caller for a key runs the call; callers arriving with the
+    same key before it completes wait for it and receive the same result,
+    or the same exception. Each caller, the first included, gets its own
+    copy of the result, so that none of them can alter what the others see.
+    Nothing is kept once the call completes: a later caller runs it again.
+
+    A SingleFlight is thread-safe and may be shared by several clients.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    @property
+    def stats(self):
+        """Counters of the calls made through this object.
+
+        ``requests`` counts all calls, ``coalesced`` those which waited for
+        the outcome of an identical call instead of being run.
+        """
+        with self._lock:
+            return {'requests': self.requests,
+                    'coalesced': self.coalesced,
+                    'in_flight': len(self._calls)}
+
+    def do(self, key, func, copy_result=copy.deepcopy):
+        """Return a copy of the result of ``func()``, shared for ``key``.
+
+        :param key: Hashable identifying calls which return the same result.
+        :param func: Callable without arguments running the call.
+        :param copy_result: Callable returning a copy of a result.
+        """
+        with self._lock:
+            self.requests += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if leader:
+            try:
+                call.result = func()
+            except BaseException:
+                # Waiters must not take a leader killed by, for instance,
+                # GreenletExit or KeyboardInterrupt for a None result.
+                call.exc_info = sys.exc_info()
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+        if call.exc_info is not None:
+            six.reraise(*call.exc_info)
+        return copy_result(call.result)
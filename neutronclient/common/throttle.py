@@ -0,0 +1,139 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""Client-side rate limiting of requests to the Neutron server."""
+
+import threading
+import time
+
+from neutronclient._i18n import _
+from neutronclient.common import utils
+
+# Key of the throttle applying to the methods without their own one.
+ALL_METHODS = '*'
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket.
+
+    Tokens are added at ``rate`` per second up to ``burst``. Callers which
+    find the bucket empty reserve the next token and sleep until it is
+    available, so waiting callers are served in arrival order.
+
+    :param float rate: Tokens added per second.
+    :param integer burst: Maximum number of tokens, i.e. of requests which
+                          can be sent at once after an idle period.
+                          (default: 1)
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError(_("rate must be positive"))
+        self.rate = float(rate)
+        self.burst = burst or 1
+        self._tokens = float(self.burst)
+        self._last = utils.monotonic_time()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = utils.monotonic_time()
+            self._tokens = min(self.burst,
+                               self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Wait for a token and return the seconds spent waiting."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class Throttle(object):
+    """Limit the rate and the concurrency of requests.
+
+    A throttle is a context manager wrapping one request. It is thread-safe
+    and may be shared by several clients to enforce a common limit.
+
+    :param float rate: Maximum number of requests started per second, None
+                       for no limit. (default: None)
+    :param integer burst: Number of requests which may exceed the rate after
+                          an idle period. (default: 1)
+    :param integer max_in_flight: Maximum number of requests awaiting their
+                                  response at the same time, None for no
+                                  limit. (default: None)
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.max_in_flight = max_in_flight
+        self._semaphore = (threading.Semaphore(max_in_flight)
+                           if max_in_flight else None)
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.delayed_requests = 0
+        self.rate_wait_time = 0.0
+        self.concurrency_wait_time = 0.0
+
+    @property
+    def stats(self):
+        """Counters of the requests which went through this throttle.
+
+        ``rate_wait_time`` and ``concurrency_wait_time`` are the total
+        seconds requests waited for the rate limit and for a free in-flight
+        slot respectively.
+        """
+        with self._stats_lock:
+            return {'requests': self.requests,
+                    'delayed_requests': self.delayed_requests,
+                    'rate_wait_time': self.rate_wait_time,
+                    'concurrency_wait_time': self.concurrency_wait_time}
+
+    def __enter__(self):
+        rate_wait = self.bucket.acquire() if self.bucket else 0.0
+        concurrency_wait = 0.0
+        if self._semaphore is not None and not self._semaphore.acquire(False):
+            start = utils.monotonic_time()
+            self._semaphore.acquire()
+            concurrency_wait = utils.monotonic_time() - start
+        with self._stats_lock:
+            self.requests += 1
+            if rate_wait or concurrency_wait:
+                self.delayed_requests += 1
+            self.rate_wait_time += rate_wait
+            self.concurrency_wait_time += concurrency_wait
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+def get_throttle(throttles, method):
+    """Return the throttle of ``method`` from a client configuration.
+
+    :param throttles: None, a Throttle applying to every method, or a dict
+                      mapping HTTP methods (or ALL_METHODS) to throttles.
+    """
+    if throttles is None or isinstance(throttles, Throttle):
+        return throttles
+    throttle = throttles.get(method.upper())
+    if throttle is None:
+        throttle = throttles.get(ALL_METHODS)
+    return throttle
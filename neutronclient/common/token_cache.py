@@ -0,0 +1,202 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""On-disk cache of keystone tokens and service catalogs.
+
+Every cached token lives in its own file, named after a hash of the
+credentials and region it was obtained for, so that neither the token nor
+the credentials can be read from a directory listing. The directory is
+only accessible to its owner and files are created with mode 0600; files
+which are not owned by the current user or which are accessible to other
+users are ignored.
+"""
+
+import errno
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+
+from keystoneauth1 import access
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join('~', '.cache', 'neutronclient', 'tokens')
+# Tokens expiring within this many seconds are not reused. This matches
+# the margin keystoneauth uses before fetching a new token.
+EXPIRY_MARGIN = 120
+
+
+def _cache_key(elements):
+    hasher = hashlib.sha256()
+    for key, value in sorted(elements.items()):
+        if value is not None:
+            hasher.update(('%s=%s\n' % (key, value)).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def plugin_cache_key(auth, region_name=None):
+    """Return the cache key of a keystoneauth identity plugin.
+
+    None is returned for plugins which cannot be cached, for instance
+    token-based ones.
+    """
+    try:
+        cache_id = auth.get_cache_id()
+    except AttributeError:
+        return None
+    if cache_id is None:
+        return None
+    return _cache_key({'auth': cache_id, 'region_name': region_name})
+
+
+def credentials_cache_key(auth_url, username=None, user_id=None,
+                          project_name=None, project_id=None, password=None,
+                          region_name=None):
+    """Return the cache key of the legacy HTTPClient credentials."""
+    return _cache_key({'auth_url': auth_url,
+                       'username': username,
+                       'user_id': user_id,
+                       'project_name': project_name,
+                       'project_id': project_id,
+                       'password': password,
+                       'region_name': region_name})
+
+
+class TokenCache(object):
+    """Stores authentication state across processes.
+
+    Entries are the ``{'auth_token': ..., 'body': ...}`` documents
+    produced by keystoneauth's ``get_auth_state``, where body is the
+    keystone token response including the service catalog.
+
+    :param cache_dir: Directory holding the cache files.
+                      (default: ~/.cache/neutronclient/tokens)
+    :param integer expiry_margin: Seconds before expiry after which a
+                                  cached token is no longer used.
+                                  (default: 120)
+    """
+
+    def __init__(self, cache_dir=None, expiry_margin=EXPIRY_MARGIN):
+        self.cache_dir = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
+        self.expiry_margin = expiry_margin
+        # Token last read or written for each key, to avoid rewriting
+        # unchanged entries after every request.
+        self._tokens = {}
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _is_private(self, path):
+        st = os.stat(path)
+        if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+            return False
+        return not st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+
+    def _ensure_dir(self):
+        try:
+            os.makedirs(self.cache_dir, 0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        if not self._is_private(self.cache_dir):
+            os.chmod(self.cache_dir, 0o700)
+
+    def get(self, key):
+        """Return the unexpired cached state for ``key`` or None."""
+        path = self._path(key)
+        try:
+            if not self._is_private(path):
+                _logger.warning("Ignoring token cache file %s which is "
+                                "accessible to other users", path)
+                return None
+            with open(path) as f:
+                state = json.load(f)
+            auth_ref = access.create(body=state['body'],
+                                     auth_token=state['auth_token'])
+        except (IOError, OSError) as e:
+            if e.errno != errno.ENOENT:
+                _logger.debug("Cannot read token cache file %(path)s: "
+                              "%(err)s", {'path': path, 'err': e})
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            _logger.debug("Discarding corrupted token cache file %(path)s: "
+                          "%(err)s", {'path': path, 'err': e})
+            self.invalidate(key)
+            return None
+        if (auth_ref.expires is None or
+                auth_ref.will_expire_soon(self.expiry_margin)):
+            self.invalidate(key)
+            return None
+        self._tokens[key] = state['auth_token']
+        return state
+
+    def set(self, key, state):
+        """Atomically write ``state`` for ``key``."""
+        if self._tokens.get(key) == state['auth_token']:
+            return
+        try:
+            self._ensure_dir()
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(state, f)
+                os.rename(tmp_path, self._path(key))
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except (IOError, OSError) as e:
+            # The cache is an optimization only.
+            _logger.debug("Cannot write token cache in %(dir)s: %(err)s",
+                          {'dir': self.cache_dir, 'err': e})
+            return
+        self._tokens[key] = state['auth_token']
+
+    def invalidate(self, key):
+        """Drop the entry for ``key``, e.g. after a 401 response."""
+        self._tokens.pop(key, None)
+        try:
+            os.unlink(self._path(key))
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                _logger.debug("Cannot remove token cache file: %s", e)
+
+    def load_plugin(self, auth, region_name=None):
+        """Install the cached state of a keystoneauth plugin.
+
+        :returns: True when a cached token was installed.
+        """
+        key = plugin_cache_key(auth, region_name)
+        if key is None or auth.auth_ref is not None:
+            return False
+        state = self.get(key)
+        if state is None:
+            return False
+        auth.set_auth_state(json.dumps(state))
+        return True
+
+    def save_plugin(self, auth, region_name=None):
+        """Persist the current state of a keystoneauth plugin, if any."""
+        key = plugin_cache_key(auth, region_name)
+        if key is None:
+            return
+        state = auth.get_auth_state()
+        if state:
+            self.set(key, json.loads(state))
+
+    def invalidate_plugin(self, auth, region_name=None):
+        key = plugin_cache_key(auth, region_name)
+        if key is not None:
+            self.invalidate(key)
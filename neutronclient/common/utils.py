@@ -23,6 +23,9 @@ import hashlib
 import logging
 import os
 import re
+import sys
+import threading
+import time
 
 from datetime import datetime
 
@@ -38,6 +41,10 @@ from neutronclient.common import exceptions
 
 SENSITIVE_HEADERS = ('X-Auth-Token',)
 
+# Clock for measuring durations, unaffected by changes of the system time
+# where the interpreter provides one.
+monotonic_time = getattr(time, 'monotonic', time.time)
+
 
 def env(*vars, **kwargs):
     """Returns the first environment variable set.
@@ -270,3 +277,114 @@ def parse_date(string_data):
         return datestring
 
     return re.sub(pattern, convert_date, string_data)
+
+
+def map_concurrently(func, items, max_workers=1, return_exceptions=False):
+    """Call ``func`` on each of ``items`` from up to ``max_workers`` threads.
+
+    Results are returned in the order of ``items``. An exception raised by a
+    call is returned in place of its result with ``return_exceptions``;
+    otherwise, once all the calls completed, the exception of the first
+    failed item is re-raised. ``items`` may be an iterator, which is then
+    consumed as the calls progress.
+    """
+    workers = max_workers or 1
+    if isinstance(items, (list, tuple)):
+        workers = min(workers, len(items))
+    if workers <= 1:
+        if not return_exceptions:
+            return [func(item) for item in items]
+        results = []
+        for item in items:
+            try:
+                results.append(func(item))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    results = {}
+    errors = {}
+    # Exception raised while iterating over items.
+    items_error = []
+    pending = enumerate(items)
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            with lock:
+                if items_error:
+                    return
+                try:
+                    index, item = next(pending)
+                except StopIteration:
+                    return
+                except Exception:
+                    items_error.append(sys.exc_info())
+                    return
+            try:
+                results[index] = func(item)
+            except Exception:
+                errors[index] = sys.exc_info()
+
+    threads = [threading.Thread(target=work) for i in range(workers)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if items_error:
+        six.reraise(*items_error[0])
+    ordered = []
+    for index in range(len(results) + len(errors)):
+        if index not in errors:
+            ordered.append(results[index])
+        elif return_exceptions:
+            ordered.append(errors[index][1])
+        else:
+            six.reraise(*errors[index])
+    return ordered
+
+
+def prefetch(iterable, depth=1):
+    """Iterate over ``iterable`` from a background thread.
+
+    Up to ``depth`` items are produced ahead of the consumer, in order. An
+    exception raised by ``iterable`` is re-raised once the items produced
+    before it have been consumed. Closing the returned generator stops the
+    background thread after the item it is producing.
+    """
+    items = six.moves.queue.Queue(maxsize=max(depth, 1))
+    stop = threading.Event()
+    end = object()
+
+    def produce():
+        try:
+            for item in iterable:
+                items.put((item, None))
+                if stop.is_set():
+                    return
+        except Exception:
+            items.put((end, sys.exc_info()))
+        else:
+            items.put((end, None))
+
+    thread = threading.Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, exc_info = items.get()
+            if exc_info is not None:
+                six.reraise(*exc_info)
+            if item is end:
+                return
+            yield item
+    finally:
+        stop.set()
+        # Makes room for the item being produced, after which the thread
+        # sees the stop event.
+        while True:
+            try:
+                items.get_nowait()
+            except six.moves.queue.Empty:
+                break
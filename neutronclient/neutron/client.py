@@ -48,7 +48,9 @@ def make_client(instance):
                             retries=instance._retries,
                             raise_errors=instance._raise_errors,
                             session=instance._session,
-                            auth=instance._auth)
+                            auth=instance._auth,
+                            token_cache=instance._token_cache,
+                            id_cache=instance._id_cache)
     return client
 
 
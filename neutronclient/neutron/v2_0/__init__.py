@@ -20,6 +20,8 @@ import abc
 import argparse
 import functools
 import logging
+import re
+import sys
 
 from cliff import command
 from cliff import lister
@@ -28,8 +30,10 @@ from oslo_serialization import jsonutils
 import six
 
 from neutronclient._i18n import _
+from neutronclient.common import constants
 from neutronclient.common import exceptions
 from neutronclient.common import utils
+from neutronclient.common import validators
 
 HYPHEN_OPTS = ['tags_any', 'not_tags', 'not_tags_any']
 
@@ -61,6 +65,43 @@ def find_resourceid_by_name_or_id(client, resource, name_or_id,
                                        parent_id, fields='id')['id']
 
 
+def find_resourceids_by_name_or_id(client, resource, names_or_ids,
+                                   project_id=None, cmd_resource=None,
+                                   parent_id=None):
+    return [info['id'] for info in client.find_resources(
+        resource, names_or_ids, project_id, cmd_resource, parent_id,
+        fields='id')]
+
+
+def call_with_resourceid(client, resource, name_or_id, func,
+                         allow_names=True, cmd_resource=None,
+                         parent_id=None):
+    """Call ``func`` with the ID of the resource given by name or ID.
+
+    A UUID is most likely the ID of the resource, so ``func`` is called
+    with it right away and the UUID is only looked up, as a name, when
+    the call fails with a 404. Other values are looked up first.
+    """
+    def find():
+        if allow_names:
+            return find_resourceid_by_name_or_id(
+                client, resource, name_or_id, cmd_resource=cmd_resource,
+                parent_id=parent_id)
+        return find_resourceid_by_id(client, resource, name_or_id,
+                                     cmd_resource, parent_id)
+
+    if not re.match(constants.UUID_PATTERN + '$', name_or_id):
+        return func(find())
+    try:
+        return func(name_or_id)
+    except exceptions.NotFound:
+        exc_info = sys.exc_info()
+        _id = find()
+        if _id == name_or_id:
+            six.reraise(*exc_info)
+        return func(_id)
+
+
 def add_show_list_common_argument(parser):
     parser.add_argument(
         '-D', '--show-details',
@@ -457,20 +498,19 @@ class UpdateCommand(NeutronCommand):
             raise exceptions.CommandError(
                 _("Must specify new values to update %s") %
                 self.cmd_resource)
-        if self.allow_names:
-            _id = find_resourceid_by_name_or_id(
-                neutron_client, self.resource, parsed_args.id,
-                cmd_resource=self.cmd_resource, parent_id=self.parent_id)
-        else:
-            _id = find_resourceid_by_id(
-                neutron_client, self.resource, parsed_args.id,
-                self.cmd_resource, self.parent_id)
         obj_updater = getattr(neutron_client,
                               "update_%s" % self.cmd_resource)
-        if self.parent_id:
-            obj_updater(_id, self.parent_id, body)
-        else:
-            obj_updater(_id, body)
+
+        def update(_id):
+            if self.parent_id:
+                obj_updater(_id, self.parent_id, body)
+            else:
+                obj_updater(_id, body)
+
+        call_with_resourceid(neutron_client, self.resource, parsed_args.id,
+                             update, allow_names=self.allow_names,
+                             cmd_resource=self.cmd_resource,
+                             parent_id=self.parent_id)
         print((_('Updated %(resource)s: %(id)s') %
                {'id': parsed_args.id, 'resource': self.resource}),
               file=self.app.stdout)
@@ -493,21 +533,34 @@ class DeleteCommand(NeutronCommand):
             help_str = _('ID(s) or name(s) of %s to delete.')
         else:
             help_str = _('ID(s) of %s to delete.')
+        if self.bulk_delete:
+            help_str += _(' Use - to read them from standard input, one '
+                          'per line.')
         parser.add_argument(
             'id', metavar=self.resource.upper(),
             nargs='+' if self.bulk_delete else 1,
             help=help_str % self.help_resource)
+        if self.bulk_delete:
+            parser.add_argument(
+                '--concurrency', metavar='N', type=int, default=1,
+                help=_('Number of %s deleted at once. '
+                       '(Default: 1)') % self.help_resource)
         self.add_known_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
+        if self.bulk_delete:
+            validators.validate_int_range(parsed_args, 'concurrency',
+                                          min_value=1)
         self.set_extra_attrs(parsed_args)
         neutron_client = self.get_client()
         obj_deleter = getattr(neutron_client,
                               "delete_%s" % self.cmd_resource)
 
         if self.bulk_delete:
-            self._bulk_delete(obj_deleter, neutron_client, parsed_args.id)
+            self._bulk_delete(obj_deleter, neutron_client,
+                              self._read_ids(parsed_args.id),
+                              concurrency=parsed_args.concurrency)
         else:
             self.delete_item(obj_deleter, neutron_client, parsed_args.id)
             print((_('Deleted %(resource)s: %(id)s')
@@ -516,23 +569,58 @@ class DeleteCommand(NeutronCommand):
                   file=self.app.stdout)
         return
 
-    def _bulk_delete(self, obj_deleter, neutron_client, parsed_args_ids):
+    def _read_ids(self, parsed_args_ids):
+        """Yield the IDs to delete, reading '-' lines from stdin."""
+        for item_id in parsed_args_ids:
+            if item_id != '-':
+                yield item_id
+                continue
+            for line in self.app.stdin:
+                line = line.strip()
+                if line:
+                    yield line
+
+    def _bulk_delete(self, obj_deleter, neutron_client, parsed_args_ids,
+                     concurrency=1):
         successful_delete = []
         non_existent = []
         multiple_ids = []
-        for item_id in parsed_args_ids:
+        # No deletion is started after an unexpected error, which is raised
+        # once the deletions already done are reported.
+        failures = []
+
+        def delete(item_id):
             try:
                 self.delete_item(obj_deleter, neutron_client, item_id)
+            except (exceptions.NotFound,
+                    exceptions.NeutronClientNoUniqueMatch) as e:
+                return item_id, e
+            except Exception as e:
+                failures.append(sys.exc_info())
+                return item_id, e
+            return item_id, None
+
+        def item_ids():
+            for item_id in parsed_args_ids:
+                if failures:
+                    return
+                yield item_id
+
+        for item_id, error in utils.map_concurrently(
+                delete, item_ids(), max_workers=concurrency):
+            if error is None:
                 successful_delete.append(item_id)
-            except exceptions.NotFound:
+            elif isinstance(error, exceptions.NotFound):
                 non_existent.append(item_id)
-            except exceptions.NeutronClientNoUniqueMatch:
+            elif isinstance(error, exceptions.NeutronClientNoUniqueMatch):
                 multiple_ids.append(item_id)
         if successful_delete:
             print((_('Deleted %(resource)s(s): %(id)s'))
                   % {'id': ", ".join(successful_delete),
                      'resource': self.cmd_resource},
                   file=self.app.stdout)
+        if failures:
+            six.reraise(*failures[0])
         if non_existent or multiple_ids:
             err_msgs = []
             if non_existent:
@@ -549,20 +637,18 @@ class DeleteCommand(NeutronCommand):
             raise exceptions.NeutronCLIError(message='\n'.join(err_msgs))
 
     def delete_item(self, obj_deleter, neutron_client, item_id):
-        if self.allow_names:
-            params = {'cmd_resource': self.cmd_resource,
-                      'parent_id': self.parent_id}
-            _id = find_resourceid_by_name_or_id(neutron_client,
-                                                self.resource,
-                                                item_id,
-                                                **params)
-        else:
-            _id = item_id
+        def delete(_id):
+            if self.parent_id:
+                obj_deleter(_id, self.parent_id)
+            else:
+                obj_deleter(_id)
 
-        if self.parent_id:
-            obj_deleter(_id, self.parent_id)
+        if self.allow_names:
+            call_with_resourceid(neutron_client, self.resource, item_id,
+                                 delete, cmd_resource=self.cmd_resource,
+                                 parent_id=self.parent_id)
         else:
-            obj_deleter(_id)
+            delete(item_id)
         return
 
 
@@ -591,6 +677,21 @@ class ListCommand(NeutronCommand, lister.Lister):
     # For more details, see ListNetworks.filter_attrs.
     filter_attrs = []
 
+    # Maps the columns which are not fields of the resource, or which are
+    # computed from other fields by a formatter or by extend_list, to the
+    # fields they are computed from. Other columns need the field of the
+    # same name.
+    column_fields = {}
+    # The fields extend_list needs whatever the columns shown. When a
+    # command overrides extend_list, setup_columns, call_server,
+    # retrieve_list or take_action without defining it in the same class or
+    # a subclass, the fields returned by the server are not limited to the
+    # columns.
+    extend_list_fields = None
+    # Whether the fields returned by the server are limited to the columns
+    # shown. Disabled for the APIs not known to support it.
+    list_fields_support = True
+
     default_attr_defs = {
         'name': {
             'help': _("Filter %s according to their name."),
@@ -645,11 +746,54 @@ class ListCommand(NeutronCommand, lister.Lister):
                 add_arg_func = group_parser.add_argument
             add_arg_func(option_name, help=help_msg, **params)
 
+    def _overrides_list_fields(self, name):
+        """Whether ``name`` is overridden below extend_list_fields."""
+        mro = type(self).__mro__
+
+        def defined_in(attr):
+            return next(i for i, cls in enumerate(mro) if attr in vars(cls))
+        return defined_in(name) < defined_in('extend_list_fields')
+
+    def get_column_fields(self, column):
+        """Return the fields of the resource needed to show a column."""
+        if column in self.column_fields:
+            return list(self.column_fields[column])
+        return [column.lower().replace(' ', '_')]
+
+    def get_list_fields(self, parsed_args):
+        """Return the fields needed to show the columns, or None for all.
+
+        The columns are those given with -c or else list_columns, to which
+        tenant_id may be added for admins.
+        """
+        if not self.list_fields_support or any(
+                self._overrides_list_fields(name)
+                for name in ('extend_list', 'setup_columns', 'call_server',
+                             'retrieve_list', 'take_action')):
+            return None
+        extend_list_fields = self.extend_list_fields or []
+        columns = getattr(parsed_args, 'columns', None)
+        if not columns:
+            if not self.list_columns:
+                return None
+            columns = list(self.list_columns) + ['tenant_id']
+        fields = ['id']
+        for column in list(columns) + list(extend_list_fields):
+            for field in self.get_column_fields(column):
+                if field not in fields:
+                    fields.append(field)
+        return fields
+
     def args2search_opts(self, parsed_args):
         search_opts = {}
         fields = parsed_args.fields
         if parsed_args.fields:
             search_opts.update({'fields': fields})
+        elif not parsed_args.show_details:
+            # Only ask the server for the fields which are shown.
+            fields = self.get_list_fields(parsed_args)
+            if fields:
+                search_opts['fields'] = fields
         if parsed_args.show_details:
             search_opts.update({'verbose': 'True'})
         filter_attrs = [field if isinstance(field, str) else field['name']
@@ -799,20 +943,19 @@ class ShowCommand(NeutronCommand, show.ShowOne):
             params = {'verbose': 'True'}
         if parsed_args.fields:
             params = {'fields': parsed_args.fields}
-        if self.allow_names:
-            _id = find_resourceid_by_name_or_id(neutron_client,
-                                                self.resource,
-                                                parsed_args.id,
-                                                cmd_resource=self.cmd_resource,
-                                                parent_id=self.parent_id)
-        else:
-            _id = parsed_args.id
-
         obj_shower = getattr(neutron_client, "show_%s" % self.cmd_resource)
-        if self.parent_id:
-            data = obj_shower(_id, self.parent_id, **params)
+
+        def show(_id):
+            if self.parent_id:
+                return obj_shower(_id, self.parent_id, **params)
+            return obj_shower(_id, **params)
+
+        if self.allow_names:
+            data = call_with_resourceid(
+                neutron_client, self.resource, parsed_args.id, show,
+                cmd_resource=self.cmd_resource, parent_id=self.parent_id)
         else:
-            data = obj_shower(_id, **params)
+            data = show(parsed_args.id)
         self.cleanup_output_data(data)
         if parsed_args.formatter == 'table':
             self.format_output_data(data)
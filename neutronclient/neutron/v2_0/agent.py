@@ -32,6 +32,7 @@ class ListAgent(neutronV20.ListCommand):
     list_columns = ['id', 'agent_type', 'host', 'availability_zone', 'alive',
                     'admin_state_up', 'binary']
     _formatters = {'heartbeat_timestamp': _format_timestamp}
+    extend_list_fields = []
     sorting_support = True
 
     def extend_list(self, data, parsed_args):
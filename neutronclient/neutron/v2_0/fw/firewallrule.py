@@ -82,6 +82,10 @@ class ListFirewallRule(neutronv20.ListCommand):
 
     resource = 'firewall_rule'
     list_columns = ['id', 'name', 'firewall_policy_id', 'summary', 'enabled']
+    column_fields = {'summary': ['protocol', 'source_ip_address',
+                                 'source_port', 'destination_ip_address',
+                                 'destination_port', 'action']}
+    extend_list_fields = []
     pagination_support = True
     sorting_support = True
 
@@ -40,6 +40,7 @@ class ListHost(neutronV20.ListCommand):
     log = logging.getLogger(__name__ + '.ListHost')
     list_columns = ['id', 'name', 'availability',
                     'agents', 'subnets', 'routers', 'ports']
+    list_fields_support = False
     _formatters = {'agents': _format_agents_brief}
 
 
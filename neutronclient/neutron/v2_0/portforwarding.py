@@ -76,6 +76,7 @@ class ListPortForwarding(neutronV20.ListCommand):
     log = logging.getLogger(__name__ + '.ListPortForwarding')
     list_columns = ['id', 'router_id', 'inside_addr', 'inside_port',
                     'outside_port', 'protocol']
+    list_fields_support = False
 
 
 class ShowPortForwarding(neutronV20.ShowCommand):
@@ -40,6 +40,7 @@ class ListProviderNetType(neutronV20.ListCommand):
     resource = 'providernet_type'
     log = logging.getLogger(__name__ + '.ListProviderNetType')
     list_columns = ['type', 'description']
+    list_fields_support = False
 
 
 def _format_ranges(providernet):
@@ -61,6 +62,7 @@ class ListProviderNet(neutronV20.ListCommand):
     log = logging.getLogger(__name__ + '.ListProviderNet')
     _formatters = {'ranges': _format_ranges, }
     list_columns = ['id', 'name', 'type', 'mtu', 'ranges']
+    list_fields_support = False
 
 
 class ShowProviderNet(neutronV20.ShowCommand):
@@ -139,6 +141,7 @@ class ListProviderNetRange(neutronV20.ListCommand):
     log = logging.getLogger(__name__ + '.ListProviderNetRange')
     list_columns = ['id', 'name', 'providernet', 'type',
                     'minimum', 'maximum', 'attributes']
+    list_fields_support = False
     sorting_support = True
 
     def extend_list(self, data, parsed_args):
@@ -306,6 +309,7 @@ class ListNetworksOnProviderNet(neutronV20.ListCommand):
     list_columns = ['id', 'name', 'vlan_id',
                     'providernet_type', 'segmentation_id',
                     'providernet_attributes']
+    list_fields_support = False
     _formatters = {'segmentation_id': _format_segmentation_id}
     sorting_support = True
     resource = 'network'
@@ -345,6 +349,7 @@ class ListProvidernetConnectivityTests(neutronV20.ListCommand):
     log = logging.getLogger(__name__ + '.ListProviderConnectivityTests')
     list_columns = ['providernet_id', 'providernet_name', 'type', 'host_name',
                     'segmentation_ids', 'status', 'message']
+    list_fields_support = False
     sorting_support = True
 
     @staticmethod
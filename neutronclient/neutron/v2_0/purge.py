@@ -13,45 +13,47 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 #
+import collections
 import sys
+import threading
 
 from neutronclient._i18n import _
+from neutronclient.common import utils
+from neutronclient.common import validators
 from neutronclient.neutron import v2_0 as neutronV20
 
+ROUTER_INTERFACE_OWNERS = ['network:router_interface',
+                           'network:router_interface_distributed']
+
 
 class Purge(neutronV20.NeutronCommand):
-    """Delete all resources that belong to a given tenant."""
+    """Delete all resources that belong to given tenants."""
 
     def _pluralize(self, string):
         return string + 's'
 
-    def _get_resources(self, neutron_client, resource_types, tenant_id):
+    def _get_resources(self, neutron_client, resource_types, tenant_ids):
         resources = []
         for resource_type in resource_types:
-            resources.append([])
             resource_type_plural = self._pluralize(resource_type)
-            opts = {'fields': ['id', 'tenant_id']}
+            # Only the attributes needed to delete the resources are
+            # returned, for the resources of the given tenants.
+            opts = {'fields': ['id'], 'tenant_id': list(tenant_ids)}
             if resource_type_plural == 'ports':
                 opts['fields'].append('device_id')
                 opts['fields'].append('device_owner')
             function = getattr(neutron_client, 'list_%s' %
                                resource_type_plural)
-            if callable(function):
-                returned_resources = function(**opts).get(resource_type_plural,
-                                                          [])
-                for resource in returned_resources:
-                    if resource['tenant_id'] == tenant_id:
-                        index = resource_types.index(resource_type)
-                        resources[index].append(resource)
-                        self.total_resources += 1
+            returned_resources = function(**opts).get(resource_type_plural,
+                                                      [])
+            resources.append(returned_resources)
+            self.total_resources += len(returned_resources)
         return resources
 
     def _delete_resource(self, neutron_client, resource_type, resource):
         resource_id = resource['id']
         if resource_type == 'port':
-            router_interface_owners = ['network:router_interface',
-                                       'network:router_interface_distributed']
-            if resource.get('device_owner', '') in router_interface_owners:
+            if resource.get('device_owner', '') in ROUTER_INTERFACE_OWNERS:
                 body = {'port_id': resource_id}
                 neutron_client.remove_interface_router(resource['device_id'],
                                                        body)
@@ -60,33 +62,49 @@ class Purge(neutronV20.NeutronCommand):
         if callable(function):
             function(resource_id)
 
+    def _report_progress(self, deleted):
+        with self._progress_lock:
+            if deleted:
+                self.deleted_resources += 1
+            else:
+                self.total_resources -= 1
+            percent_complete = 100
+            if self.total_resources > 0:
+                percent_complete = (self.deleted_resources /
+                                    float(self.total_resources)) * 100
+            sys.stdout.write("\rPurging resources: %d%% complete." %
+                             percent_complete)
+            sys.stdout.flush()
+
     def _purge_resources(self, neutron_client, resource_types,
-                         tenant_resources):
-        deleted = {}
-        failed = {}
+                         tenant_resources, concurrency=1):
+        # Ordered, so that the message lists the types in deletion order.
+        deleted = collections.OrderedDict()
+        failed = collections.OrderedDict()
         failures = False
-        for resources in tenant_resources:
-            index = tenant_resources.index(resources)
-            resource_type = resource_types[index]
-            failed[resource_type] = 0
-            deleted[resource_type] = 0
-            for resource in resources:
-                try:
-                    self._delete_resource(neutron_client, resource_type,
-                                          resource)
-                    deleted[resource_type] += 1
-                    self.deleted_resources += 1
-                except Exception:
-                    failures = True
-                    failed[resource_type] += 1
-                    self.total_resources -= 1
-                percent_complete = 100
-                if self.total_resources > 0:
-                    percent_complete = (self.deleted_resources /
-                                        float(self.total_resources)) * 100
-                sys.stdout.write("\rPurging resources: %d%% complete." %
-                                 percent_complete)
-                sys.stdout.flush()
+        self._progress_lock = threading.Lock()
+
+        def delete(resource_type, resource):
+            try:
+                self._delete_resource(neutron_client, resource_type,
+                                      resource)
+            except Exception:
+                self._report_progress(False)
+                return False
+            self._report_progress(True)
+            return True
+
+        # The resources of a type only depend on those of the previous
+        # types, and are deleted concurrently once those are deleted.
+        for resource_type, resources in zip(resource_types,
+                                            tenant_resources):
+            results = utils.map_concurrently(
+                lambda resource: delete(resource_type, resource),
+                resources, max_workers=concurrency)
+            deleted[resource_type] = results.count(True)
+            failed[resource_type] = results.count(False)
+            if failed[resource_type]:
+                failures = True
         return (deleted, failed, failures)
 
     def _build_message(self, deleted, failed, failures):
@@ -124,11 +142,16 @@ class Purge(neutronV20.NeutronCommand):
     def get_parser(self, prog_name):
         parser = super(Purge, self).get_parser(prog_name)
         parser.add_argument(
-            'tenant', metavar='TENANT',
-            help=_('ID of Tenant owning the resources to be deleted.'))
+            'tenant', metavar='TENANT', nargs='+',
+            help=_('ID(s) of Tenant(s) owning the resources to be deleted.'))
+        parser.add_argument(
+            '--concurrency', metavar='N', type=int, default=10,
+            help=_('Number of resources deleted at once. (Default: 10)'))
         return parser
 
     def take_action(self, parsed_args):
+        validators.validate_int_range(parsed_args, 'concurrency',
+                                      min_value=1)
         neutron_client = self.get_client()
 
         self.any_failures = False
@@ -144,7 +167,7 @@ class Purge(neutronV20.NeutronCommand):
         self.deleted_resources = 0
         resources = self._get_resources(neutron_client, resource_types,
                                         parsed_args.tenant)
-        deleted, failed, failures = self._purge_resources(neutron_client,
-                                                          resource_types,
-                                                          resources)
+        deleted, failed, failures = self._purge_resources(
+            neutron_client, resource_types, resources,
+            concurrency=parsed_args.concurrency)
         print('\n%s' % self._build_message(deleted, failed, failures))
@@ -66,6 +66,33 @@ def get_column_definitions(attr_map, long_listing):
     return headers, columns
 
 
+def get_list_fields(attr_map, long_listing, columns=None, field_deps=None):
+    """Return the API attributes needed to show a listing table.
+
+    :param attr_map: a list of table entry definitions, in the format used
+      by get_column_definitions.
+    :param long_listing: A boolean value which indicates a long listing
+      or not.
+    :param columns: The table headers selected by the user, e.g. with -c.
+      All the headers of the listing are shown when it is empty.
+    :param field_deps: A dictionary mapping the API attribute names of the
+      columns computed by the client to the attributes they are computed
+      from. For example: {'summary': ['protocol', 'action']}
+    :return: A list of API attribute names, always including 'id', which
+      can be passed as fields to a list request.
+    """
+    headers, attrs = get_column_definitions(attr_map, long_listing)
+    if columns:
+        attrs = [attr for attr, hdr in zip(attrs, headers) if hdr in columns]
+    field_deps = field_deps or {}
+    fields = ['id']
+    for attr in attrs:
+        for field in field_deps.get(attr, [attr]):
+            if field not in fields:
+                fields.append(field)
+    return fields
+
+
 def get_columns(item, attr_map=None):
     """Return pair of resource attributes and corresponding display names.
 
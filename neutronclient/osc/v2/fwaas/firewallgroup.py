@@ -253,7 +253,10 @@ class ListFirewallGroup(command.Lister):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.neutronclient
-        obj = client.list_fwaas_firewall_groups()[const.FWGS]
+        obj = client.list_fwaas_firewall_groups(
+            fields=osc_utils.get_list_fields(
+                _attr_map, parsed_args.long,
+                parsed_args.columns))[const.FWGS]
         headers, columns = osc_utils.get_column_definitions(
             _attr_map, long_listing=parsed_args.long)
         return (headers, (utils.get_dict_properties(
@@ -47,6 +47,10 @@ _attr_map = (
     ('shared', 'Shared', osc_utils.LIST_LONG_ONLY),
     ('tenant_id', 'Project', osc_utils.LIST_LONG_ONLY),
 )
+# Attributes the summary column is computed from.
+_summary_fields = {'summary': [
+    'protocol', 'source_ip_address', 'source_port', 'destination_ip_address',
+    'destination_port', 'action']}
 
 
 def _get_common_parser(parser):
@@ -271,7 +275,7 @@ class ListFirewallRule(command.Lister):
     def extend_list(self, data, parsed_args):
         ext_data = copy.deepcopy(data)
         for d in ext_data:
-            protocol = d['protocol'].upper() if d['protocol'] else 'ANY'
+            protocol = d['protocol'].upper() if d.get('protocol') else 'ANY'
             src_ip = 'none specified'
             dst_ip = 'none specified'
             src_port = '(none specified)'
@@ -292,7 +296,10 @@ class ListFirewallRule(command.Lister):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.neutronclient
-        obj = client.list_fwaas_firewall_rules()[const.FWRS]
+        obj = client.list_fwaas_firewall_rules(
+            fields=osc_utils.get_list_fields(
+                _attr_map, parsed_args.long, parsed_args.columns,
+                field_deps=_summary_fields))[const.FWRS]
         obj_extend = self.extend_list(obj, parsed_args)
         headers, columns = osc_utils.get_column_definitions(
             _attr_map, long_listing=parsed_args.long)
@@ -355,6 +355,8 @@ class ListBgpvpn(command.Lister):
             params['tenant_id'] = project_id
         if parsed_args.property:
             params.update(parsed_args.property)
+        params['fields'] = nc_osc_utils.get_list_fields(
+            _attr_map, parsed_args.long, parsed_args.columns)
         objs = client.list_bgpvpns(**params)[constants.BGPVPNS]
         headers, columns = nc_osc_utils.get_column_definitions(
             _attr_map, long_listing=parsed_args.long)
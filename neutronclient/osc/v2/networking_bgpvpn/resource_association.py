@@ -144,8 +144,10 @@ class ListBgpvpnResAssoc(command.Lister):
         list_method = getattr(client,
                               'list_bgpvpn_%s_assocs' % self._assoc_res_name)
         bgpvpn = client.find_resource(constants.BGPVPN, parsed_args.bgpvpn)
-        objs = list_method(bgpvpn['id'],
-                           retrieve_all=True)[self._resource_plural]
+        fields = nc_osc_utils.get_list_fields(
+            self._attr_map, parsed_args.long, parsed_args.columns)
+        objs = list_method(bgpvpn['id'], retrieve_all=True,
+                           fields=fields)[self._resource_plural]
         headers, columns = nc_osc_utils.get_column_definitions(
             self._attr_map, long_listing=parsed_args.long)
         return (headers, (osc_utils.get_dict_properties(
@@ -54,6 +54,12 @@ _attr_map = (
     ('description', 'Description', nc_osc_utils.LIST_LONG_ONLY),
     ('project_id', 'Project', nc_osc_utils.LIST_LONG_ONLY),
 )
+# Attributes the summary column is computed from.
+_summary_fields = {'summary': [
+    'protocol', 'source_ip_prefix', 'source_port_range_min',
+    'source_port_range_max', 'destination_ip_prefix',
+    'destination_port_range_min', 'destination_port_range_max',
+    'logical_source_port', 'logical_destination_port', 'l7_parameters']}
 
 
 class CreateSfcFlowClassifier(command.ShowOne):
@@ -164,7 +170,7 @@ class ListSfcFlowClassifier(command.Lister):
         ext_data = data['flow_classifiers']
         for d in ext_data:
             val = []
-            protocol = d['protocol'].upper() if d['protocol'] else 'any'
+            protocol = d['protocol'].upper() if d.get('protocol') else 'any'
             val.append('protocol: ' + protocol)
             val.append(self._get_protocol_port_details(d, 'source'))
             val.append(self._get_protocol_port_details(d, 'destination'))
@@ -198,7 +204,10 @@ class ListSfcFlowClassifier(command.Lister):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.neutronclient
-        obj = client.list_sfc_flow_classifiers()
+        obj = client.list_sfc_flow_classifiers(
+            fields=nc_osc_utils.get_list_fields(
+                _attr_map, parsed_args.long, parsed_args.columns,
+                field_deps=_summary_fields))
         obj_extend = self.extend_list(obj, parsed_args)
         headers, columns = nc_osc_utils.get_column_definitions(
             _attr_map, long_listing=parsed_args.long)
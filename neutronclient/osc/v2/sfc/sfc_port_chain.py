@@ -129,7 +129,9 @@ class ListSfcPortChain(command.Lister):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.neutronclient
-        data = client.list_sfc_port_chains()
+        data = client.list_sfc_port_chains(
+            fields=nc_osc_utils.get_list_fields(
+                _attr_map, parsed_args.long, parsed_args.columns))
         headers, columns = nc_osc_utils.get_column_definitions(
             _attr_map, long_listing=parsed_args.long)
         return (headers,
@@ -185,13 +187,11 @@ class SetSfcPortChain(command.Command):
         pc_id = _get_id(client, parsed_args.port_chain, resource)
         attrs = _get_common_attrs(self.app.client_manager, parsed_args,
                                   is_create=False)
-        if parsed_args.no_flow_classifier:
+        if parsed_args.no_flow_classifier and not parsed_args.flow_classifiers:
             attrs['flow_classifiers'] = []
         if parsed_args.flow_classifiers:
-            for fc in parsed_args.flow_classifiers:
-                added = [client.find_resource(
-                    'flow_classifier', fc,
-                    cmd_resource='sfc_flow_classifier')['id']]
+            # Resolved by _get_common_attrs.
+            added = attrs['flow_classifiers']
             if parsed_args.no_flow_classifier:
                 existing = []
             else:
@@ -204,23 +204,15 @@ class SetSfcPortChain(command.Command):
                 parsed_args.port_pair_groups):
             message = _('At least one --port-pair-group must be specified.')
             raise exceptions.CommandError(message)
-        if parsed_args.no_port_pair_group and parsed_args.port_pair_groups:
-            new_ppgs = []
-            for ppg in parsed_args.port_pair_groups:
-                new_ppgs.append(client.find_resource(
-                    'port_pair_group', ppg,
-                    cmd_resource='sfc_port_pair_group')['id'])
-            attrs['port_pair_groups'] = new_ppgs
+        # With --no-port-pair-group, the port pair groups resolved by
+        # _get_common_attrs replace the existing ones.
         if (parsed_args.port_pair_groups and
                 not parsed_args.no_port_pair_group):
             existing_ppg = client.find_resource(
                 resource, parsed_args.port_chain,
                 cmd_resource='sfc_port_chain')['port_pair_groups']
-            for ppg in parsed_args.port_pair_groups:
-                existing_ppg.append(client.find_resource(
-                    'port_pair_group', ppg,
-                    cmd_resource='sfc_port_pair_group')['id'])
-                attrs['port_pair_groups'] = sorted(list(set(existing_ppg)))
+            attrs['port_pair_groups'] = sorted(list(
+                set(existing_ppg) | set(attrs['port_pair_groups'])))
         body = {resource: attrs}
         try:
             client.update_sfc_port_chain(pc_id, body)
@@ -289,21 +281,17 @@ class UnsetSfcPortChain(command.Command):
             existing = client.find_resource(
                 resource, parsed_args.port_chain,
                 cmd_resource='sfc_port_chain')['flow_classifiers']
-            for fc in parsed_args.flow_classifiers:
-                removed = [client.find_resource(
-                    'flow_classifier', fc,
-                    cmd_resource='sfc_flow_classifier')['id']]
-                attrs['flow_classifiers'] = list(set(existing) - set(removed))
+            removed = _get_ids(client, parsed_args.flow_classifiers,
+                               'flow_classifier')
+            attrs['flow_classifiers'] = list(set(existing) - set(removed))
         if parsed_args.all_flow_classifier:
             attrs['flow_classifiers'] = []
         if parsed_args.port_pair_groups:
             existing_ppg = client.find_resource(
                 resource, parsed_args.port_chain,
                 cmd_resource='sfc_port_chain')['port_pair_groups']
-            for ppg in parsed_args.port_pair_groups:
-                removed_ppg = [client.find_resource(
-                    'port_pair_group', ppg,
-                    cmd_resource='sfc_port_pair_group')['id']]
+            removed_ppg = _get_ids(client, parsed_args.port_pair_groups,
+                                   'port_pair_group')
             attrs['port_pair_groups'] = list(set(existing_ppg) -
                                              set(removed_ppg))
             if attrs['port_pair_groups'] == []:
@@ -326,13 +314,13 @@ def _get_common_attrs(client_manager, parsed_args, is_create=True):
     if parsed_args.description is not None:
         attrs['description'] = parsed_args.description
     if parsed_args.port_pair_groups:
-        attrs['port_pair_groups'] = [(_get_id(client_manager.neutronclient,
-                                              ppg, 'port_pair_group'))
-                                     for ppg in parsed_args.port_pair_groups]
+        attrs['port_pair_groups'] = _get_ids(client_manager.neutronclient,
+                                             parsed_args.port_pair_groups,
+                                             'port_pair_group')
     if parsed_args.flow_classifiers:
-        attrs['flow_classifiers'] = [(_get_id(client_manager.neutronclient, fc,
-                                      'flow_classifier'))
-                                     for fc in parsed_args.flow_classifiers]
+        attrs['flow_classifiers'] = _get_ids(client_manager.neutronclient,
+                                             parsed_args.flow_classifiers,
+                                             'flow_classifier')
     if is_create is True:
         _get_attrs(attrs, parsed_args)
     return attrs
@@ -351,3 +339,9 @@ def _get_attrs(attrs, parsed_args):
 
 def _get_id(client, id_or_name, resource):
     return client.find_resource(resource, id_or_name)['id']
+
+
+def _get_ids(client, ids_or_names, resource):
+    return [info['id'] for info in client.find_resources(
+        resource, ids_or_names, cmd_resource='sfc_%s' % resource,
+        fields='id')]
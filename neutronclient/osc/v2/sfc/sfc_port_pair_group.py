@@ -120,7 +120,9 @@ class ListSfcPortPairGroup(command.Lister):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.neutronclient
-        data = client.list_sfc_port_pair_groups()
+        data = client.list_sfc_port_pair_groups(
+            fields=nc_osc_utils.get_list_fields(
+                _attr_map, parsed_args.long, parsed_args.columns))
         headers, columns = nc_osc_utils.get_column_definitions(
             _attr_map, long_listing=parsed_args.long)
         return (headers,
@@ -353,12 +353,14 @@ def _get_attrs_for_trunk(client_manager, parsed_args):
 
 def _format_subports(client_manager, subports):
     attrs = []
+    # The ports of all the subports are resolved at once.
+    port_ids = iter(_get_ids(client_manager.neutronclient,
+                             [subport['port'] for subport in subports
+                              if subport.get('port')], 'port'))
     for subport in subports:
         subport_attrs = {}
         if subport.get('port'):
-            port_id = _get_id(client_manager.neutronclient,
-                              subport['port'], 'port')
-            subport_attrs['port_id'] = port_id
+            subport_attrs['port_id'] = next(port_ids)
         if subport.get('segmentation-id'):
             try:
                 subport_attrs['segmentation_id'] = int(
@@ -380,14 +382,18 @@ def _get_attrs_for_subports(client_manager, parsed_args):
                                             parsed_args.set_subports)
     if ('unset_subports' in parsed_args and
             parsed_args.unset_subports is not None):
-        subports_list = []
-        for subport in parsed_args.unset_subports:
-            port_id = _get_id(client_manager.neutronclient,
-                              subport, 'port')
-            subports_list.append({'port_id': port_id})
-        attrs[SUB_PORTS] = subports_list
+        port_ids = _get_ids(client_manager.neutronclient,
+                            parsed_args.unset_subports, 'port')
+        attrs[SUB_PORTS] = [{'port_id': port_id} for port_id in port_ids]
     return attrs
 
 
 def _get_id(client, id_or_name, resource):
     return client.find_resource(resource, str(id_or_name))['id']
+
+
+def _get_ids(client, ids_or_names, resource):
+    if not ids_or_names:
+        return []
+    return [info['id'] for info in client.find_resources(
+        resource, ids_or_names, fields='id')]
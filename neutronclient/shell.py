@@ -30,16 +30,22 @@ import sys
 from keystoneauth1 import session
 import os_client_config
 from oslo_utils import encodeutils
+from oslo_utils import importutils
 from oslo_utils import netutils
+from oslo_utils import strutils
+import pkg_resources
+from six.moves import collections_abc
 
 from cliff import app
 from cliff import command
 from cliff import commandmanager
 
 from neutronclient._i18n import _
+from neutronclient import command_index
 from neutronclient.common import clientmanager
 from neutronclient.common import exceptions as exc
 from neutronclient.common import extension as client_extension
+from neutronclient.common import token_cache
 from neutronclient.neutron.v2_0 import subnet
 from neutronclient.version import __version__
 
@@ -49,6 +55,8 @@ NEUTRON_API_VERSION = '2.0'
 
 NAMESPACE_MAP = {NEUTRON_API_VERSION: 'neutron.cli.v2'}
 
+LOG = logging.getLogger(__name__)
+
 
 def run_command(cmd, cmd_parser, sub_argv):
     _argv = sub_argv
@@ -106,12 +114,125 @@ def check_non_negative_int(value):
 COMMANDS = {}
 
 
+class _CommandsDict(collections_abc.MutableMapping):
+    """Command classes by name, imported when they are looked up.
+
+    Importing all the command modules is a large share of the start-up
+    time of the shell, so the classes of the commands are only imported
+    when they are accessed.
+    """
+
+    def __init__(self, command_manager):
+        self.command_manager = command_manager
+
+    def __getitem__(self, name):
+        if name not in self.command_manager.commands:
+            raise KeyError(name)
+        return self.command_manager.find_command([name])[0]
+
+    def __contains__(self, name):
+        return name in self.command_manager.commands
+
+    def __setitem__(self, name, command_class):
+        self.command_manager.add_command(name, command_class)
+
+    def __delitem__(self, name):
+        del self.command_manager.commands[name]
+
+    def __iter__(self):
+        return iter(self.command_manager.commands)
+
+    def __len__(self):
+        return len(self.command_manager.commands)
+
+
 # NOTE(amotoki): This is only to provide compatibility
 # to existing neutron CLI extensions. See bug 1706573 for detail.
 def _set_commands_dict_for_compat(apiversion, command_manager):
     global COMMANDS
-    COMMANDS = {apiversion: dict((cmd, command_manager.find_command([cmd])[0])
-                                 for cmd in command_manager.commands)}
+    COMMANDS = {apiversion: _CommandsDict(command_manager)}
+
+
+def _is_module_ignored(module_name, ignored_modules):
+    # Like in cliff>=4, ignoring a package ignores its modules too.
+    while module_name:
+        if module_name in ignored_modules:
+            return True
+        module_name = module_name.rpartition('.')[0]
+    return False
+
+
+def _load_command(name, entry_point):
+    """Return the class of a command, or None if it cannot be imported.
+
+    A command which is broken, e.g. by a missing dependency, is skipped by
+    the help and the bash completion instead of failing them.
+    """
+    try:
+        # NOTE: resolve() does not check the requirements of the
+        # distribution, which load() of pkg_resources does.
+        return getattr(entry_point, 'resolve', entry_point.load)()
+    except Exception as e:
+        LOG.warning(_("Cannot load the %(name)s command: %(error)s"),
+                    {'name': name, 'error': e})
+        return None
+
+
+class _IndexedCommand(object):
+    """Command of the index, whose class is imported when it is loaded."""
+
+    def __init__(self, name, target):
+        self.name = name
+        self.target = target
+        self.module_name = target.split(':', 1)[0]
+
+    def load(self):
+        try:
+            return importutils.import_class(self.target.replace(':', '.'))
+        except Exception as e:
+            # NOTE: The import of the module may fail with any exception,
+            # e.g. a SyntaxError.
+            raise exc.CommandError(
+                _("Cannot load the %(name)s command from %(target)s: "
+                  "%(error)s") %
+                {'name': self.name, 'target': self.target, 'error': e})
+
+    resolve = load
+
+
+class CommandManager(commandmanager.CommandManager):
+    """Command manager importing the command classes on demand.
+
+    cliff>=3 imports the modules of all the commands of a namespace when it
+    loads them. This one only reads the entry points, and the class of a
+    command is imported when the command is found. The commands of the
+    namespaces of neutronclient.command_index, which is generated from
+    setup.cfg, are read from the index instead of scanning the entry points
+    of the installed distributions.
+    """
+
+    def load_commands(self, namespace):
+        # NOTE: cliff>=3 lists the loaded namespaces in group_list.
+        if hasattr(self, 'group_list'):
+            self.group_list.append(namespace)
+        # NOTE: cliff>=4 takes the modules whose commands are skipped.
+        ignored_modules = getattr(self, 'ignored_modules', ())
+        for entry_point in self._find_entry_points(namespace):
+            if _is_module_ignored(entry_point.module_name, ignored_modules):
+                LOG.debug('extension found in ignored module %r: skipping',
+                          entry_point.module_name)
+                continue
+            name = entry_point.name
+            if self.convert_underscores:
+                name = name.replace('_', ' ')
+            self.commands[name] = entry_point
+
+    def _find_entry_points(self, namespace):
+        commands = command_index.COMMANDS.get(namespace)
+        if commands is None:
+            return pkg_resources.iter_entry_points(namespace)
+        return [_IndexedCommand(name, target)
+                for name, target in commands.items()]
 
 
 class BashCompletionCommand(command.Command):
@@ -138,7 +259,9 @@ class HelpAction(argparse.Action):
         app.stdout.write(_('\nCommands for API v%s:\n') % app.api_version)
         command_manager = app.command_manager
         for name, ep in sorted(command_manager):
-            factory = ep.load()
+            factory = _load_command(name, ep)
+            if factory is None:
+                continue
             cmd = factory(self, None)
             one_liner = cmd.get_description().split('\n')[0]
             outputs.append((name, one_liner))
@@ -165,7 +288,7 @@ class NeutronShell(app.App):
         super(NeutronShell, self).__init__(
             description=description,
             version=VERSION,
-            command_manager=commandmanager.CommandManager(namespace), )
+            command_manager=CommandManager(namespace), )
 
         self._register_extensions(VERSION)
 
@@ -432,6 +555,33 @@ class NeutronShell(app.App):
                    "not be verified against any certificate authorities. "
                    "This option should be used with caution."))
 
+        parser.add_argument(
+            '--token-cache',
+            action='store_true',
+            default=strutils.bool_from_string(
+                env('NEUTRONCLIENT_TOKEN_CACHE', default=False)),
+            help=_("Reuse the keystone token and service catalog obtained "
+                   "by a previous invocation with the same credentials and "
+                   "region, until the token expires. Defaults to "
+                   "env[NEUTRONCLIENT_TOKEN_CACHE]."))
+
+        parser.add_argument(
+            '--token-cache-dir', metavar='<directory>',
+            default=env('NEUTRONCLIENT_TOKEN_CACHE_DIR',
+                        default=token_cache.DEFAULT_CACHE_DIR),
+            help=_("Directory of the token cache, only readable by its "
+                   "owner. Defaults to env[NEUTRONCLIENT_TOKEN_CACHE_DIR] "
+                   "or ~/.cache/neutronclient/tokens."))
+
+        parser.add_argument(
+            '--id-cache',
+            action='store_true',
+            default=strutils.bool_from_string(
+                env('NEUTRONCLIENT_ID_CACHE', default=False)),
+            help=_("Look up the ID of a resource name or ID given several "
+                   "times to a command only once. Defaults to "
+                   "env[NEUTRONCLIENT_ID_CACHE]."))
+
     def _bash_completion(self):
         """Prints all of the commands and options for bash-completion."""
         commands = set()
@@ -439,8 +589,10 @@ class NeutronShell(app.App):
         for option, _action in self.parser._option_string_actions.items():
             options.add(option)
         for _name, _command in self.command_manager:
+            cmd_factory = _load_command(_name, _command)
+            if cmd_factory is None:
+                continue
             commands.add(_name)
-            cmd_factory = _command.load()
             cmd = cmd_factory(self, None)
             cmd_parser = cmd.get_parser('')
             for option, _action in cmd_parser._option_string_actions.items():
@@ -571,6 +723,9 @@ class NeutronShell(app.App):
         interface = self.options.os_endpoint_type or self.endpoint_type
         if interface.endswith('URL'):
             interface = interface[:-3]
+        cache = None
+        if auth and self.options.token_cache:
+            cache = token_cache.TokenCache(self.options.token_cache_dir)
         self.client_manager = clientmanager.ClientManager(
             retries=self.options.retries,
             raise_errors=False,
@@ -584,7 +739,9 @@ class NeutronShell(app.App):
             endpoint_type=interface,
             auth=auth,
             insecure=not verify,
-            log_credentials=True)
+            log_credentials=True,
+            token_cache=cache,
+            id_cache=self.options.id_cache)
         return
 
     def initialize_app(self, argv):
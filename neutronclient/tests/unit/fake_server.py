@@ -0,0 +1,160 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""A local, in-process HTTP server standing in for neutron-server."""
+
+import socket
+import threading
+
+import fixtures
+from oslo_serialization import jsonutils
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+import six.moves.urllib.parse as urlparse
+
+
+class _ThreadedHTTPServer(socketserver.ThreadingMixIn,
+                          BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeNeutronServer(fixtures.Fixture):
+    """Serve canned responses over HTTP/1.1 keep-alive connections.
+
+    Responses are looked up in ``responses`` by ``(method, path)``, where
+    path excludes the query string. A value is either a
+    ``(status_code, body)`` or ``(status_code, body, headers)`` tuple, with
+    a dict body serialized to JSON, or a callable taking
+    ``(method, path, query, body)`` and returning such a tuple. Unknown
+    paths answer ``200 {}``.
+
+    ``connections`` counts accepted TCP connections and ``requests``
+    records every ``(method, path_with_query)`` served, with the request
+    headers, with lower case names, at the same index of
+    ``request_headers``. Callables can read
+    the headers of the request they answer from ``current_headers``. The
+    n-th request is answered with the ``X-OpenStack-Request-ID`` header
+    ``req-<n>``.
+
+    ``stop`` also closes the established connections, so a test can kill
+    a server while clients still hold kept-alive connections to it.
+    """
+
+    def __init__(self, responses=None):
+        super(FakeNeutronServer, self).__init__()
+        self.responses = responses if responses is not None else {}
+        self.connections = 0
+        self.requests = []
+        self.request_headers = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sockets = set()
+        self.stopped = False
+
+    def setUp(self):
+        super(FakeNeutronServer, self).setUp()
+        self.httpd = _ThreadedHTTPServer(('127.0.0.1', 0),
+                                         self._make_handler())
+        self.port = self.httpd.server_address[1]
+        self.url = 'http://127.0.0.1:%d' % self.port
+        thread = threading.Thread(target=self.httpd.serve_forever,
+                                  kwargs={'poll_interval': 0.05})
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.stop)
+
+    def stop(self):
+        if self.stopped:
+            return
+        self.stopped = True
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        with self._lock:
+            sockets, self._sockets = self._sockets, set()
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+
+    def _record_connection(self, sock):
+        with self._lock:
+            self.connections += 1
+            self._sockets.add(sock)
+
+    def _forget_connection(self, sock):
+        with self._lock:
+            self._sockets.discard(sock)
+
+    @property
+    def current_headers(self):
+        return self._local.headers
+
+    def _dispatch(self, method, raw_path, body, headers):
+        self._local.headers = headers
+        with self._lock:
+            self.requests.append((method, raw_path))
+            self.request_headers.append(headers)
+            request_id = 'req-%d' % len(self.requests)
+        parsed = urlparse.urlparse(raw_path)
+        query = urlparse.parse_qs(parsed.query)
+        response = self.responses.get((method, parsed.path), (200, {}))
+        if callable(response):
+            response = response(method, parsed.path, query, body)
+        status_code, resp_body = response[:2]
+        headers = dict(response[2]) if len(response) > 2 else {}
+        headers['X-OpenStack-Request-ID'] = request_id
+        if isinstance(resp_body, dict):
+            resp_body = jsonutils.dumps(resp_body)
+        return status_code, headers, (resp_body or '').encode('utf-8')
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately; without this the
+            # kept-alive connection stalls on delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+                server._record_connection(self.connection)
+
+            def finish(self):
+                try:
+                    BaseHTTPServer.BaseHTTPRequestHandler.finish(self)
+                finally:
+                    server._forget_connection(self.connection)
+
+            def log_message(self, *args):
+                pass
+
+            def _respond(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else None
+                headers = dict((name.lower(), value)
+                               for name, value in self.headers.items())
+                status_code, headers, data = server._dispatch(
+                    self.command, self.path, body, headers)
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'application/json')
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+        return Handler
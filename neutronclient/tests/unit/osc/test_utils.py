@@ -43,6 +43,22 @@ class TestUtils(testtools.TestCase):
         self.assertEqual(['id', 'tenant_id', 'name'], columns)
         self.assertEqual(['ID', 'Project', 'Name'], headers)
 
+    def test_get_list_fields(self):
+        attr_map = (
+            ('name', 'Name', utils.LIST_BOTH),
+            ('tenant_id', 'Project', utils.LIST_LONG_ONLY),
+            ('summary', 'Summary', utils.LIST_SHORT_ONLY),
+        )
+        field_deps = {'summary': ['protocol', 'name']}
+        self.assertEqual(['id', 'name', 'protocol'],
+                         utils.get_list_fields(attr_map, False,
+                                               field_deps=field_deps))
+        self.assertEqual(['id', 'name', 'tenant_id'],
+                         utils.get_list_fields(attr_map, True,
+                                               field_deps=field_deps))
+        self.assertEqual(['id', 'tenant_id'],
+                         utils.get_list_fields(attr_map, True, ['Project']))
+
     def test_get_columns(self):
         item = {
             'id': 'test-id',
@@ -30,7 +30,7 @@ class TestListFWaaS(test_fakes.TestNeutronClientOSCV2):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(fields=self.list_fields)
         self.assertEqual(list(self.list_headers), headers)
         self.assertEqual([self.list_data], list(data))
 
@@ -40,7 +40,7 @@ class TestListFWaaS(test_fakes.TestNeutronClientOSCV2):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(fields=self.long_fields)
         self.assertEqual(list(self.headers), headers)
         self.assertListItemEqual([self.data], list(data))
 
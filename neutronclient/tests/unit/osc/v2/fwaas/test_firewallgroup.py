@@ -334,6 +334,11 @@ class TestListFirewallGroup(TestFirewallGroup, common.TestListFWaaS):
             return_value={self.res_plural: [_fwg]})
         self.mocked = self.neutronclient.list_fwaas_firewall_groups
         self.cmd = firewallgroup.ListFirewallGroup(self.app, self.namespace)
+        self.list_fields = ['id', 'name', 'ingress_firewall_policy_id',
+                            'egress_firewall_policy_id']
+        self.long_fields = self.list_fields + [
+            'description', 'status', 'ports', 'admin_state_up', 'shared',
+            'tenant_id']
 
 
 class TestShowFirewallGroup(TestFirewallGroup, common.TestShowFWaaS):
@@ -312,6 +312,9 @@ class TestListFirewallPolicy(TestFirewallPolicy, common.TestListFWaaS):
             return_value={'firewall_policies': [_fwp]})
         self.mocked = self.neutronclient.list_fwaas_firewall_policies
         self.cmd = firewallpolicy.ListFirewallPolicy(self.app, self.namespace)
+        self.list_fields = ['id', 'name', 'firewall_rules']
+        self.long_fields = self.list_fields + [
+            'description', 'audited', 'shared', 'tenant_id']
 
 
 class TestShowFirewallPolicy(TestFirewallPolicy, common.TestShowFWaaS):
@@ -329,7 +329,11 @@ class TestListFirewallRule(TestFirewallRule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(fields=[
+            'id', 'name', 'enabled', 'description', 'ip_version', 'action',
+            'protocol', 'source_ip_address', 'source_port',
+            'destination_ip_address', 'destination_port', 'shared',
+            'tenant_id'])
         self.assertEqual(list(self.headers), headers)
         self.assertListItemEqual([self.data], list(data))
 
@@ -339,10 +343,21 @@ class TestListFirewallRule(TestFirewallRule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         headers, data = self.cmd.take_action(parsed_args)
 
-        self.mocked.assert_called_once_with()
+        self.mocked.assert_called_once_with(fields=[
+            'id', 'name', 'enabled', 'protocol', 'source_ip_address',
+            'source_port', 'destination_ip_address', 'destination_port',
+            'action'])
         self.assertEqual(list(self.short_header), headers)
         self.assertListItemEqual([self.short_data], list(data))
 
+    def test_list_with_columns(self):
+        arglist = ['-c', 'ID', '-c', 'Enabled']
+        verifylist = [('columns', ['ID', 'Enabled'])]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.mocked.assert_called_once_with(fields=['id', 'enabled'])
+
 
 class TestShowFirewallRule(TestFirewallRule, common.TestShowFWaaS):
 
@@ -455,7 +455,7 @@ class TestListBgpvpn(fakes.TestNeutronClientBgpvpn):
         headers, data = self.cmd.take_action(parsed_args)
 
         self.neutronclient.list_bgpvpns.assert_called_once_with(
-            tenant_id=project_id)
+            tenant_id=project_id, fields=['id', 'name', 'type'])
         self.assertEqual(headers, list(headers_short))
         self.assertListItemEqual(
             list(data),
@@ -486,7 +486,8 @@ class TestListBgpvpn(fakes.TestNeutronClientBgpvpn):
 
         self.neutronclient.list_bgpvpns.assert_called_once_with(
             name=name,
-            type=layer_type)
+            type=layer_type,
+            fields=['id', 'name', 'type'])
         self.assertEqual(headers, list(headers_short))
         self.assertListItemEqual(list(data),
                                  [_get_data(returned_bgpvpn, columns_short)])
@@ -204,7 +204,8 @@ class TestListResAssoc(fakes.TestNeutronClientBgpvpn):
         headers, data = self.cmd.take_action(parsed_args)
 
         self.neutronclient.list_bgpvpn_fake_resource_assocs.\
-            assert_called_once_with(fake_bgpvpn['id'], retrieve_all=True)
+            assert_called_once_with(fake_bgpvpn['id'], retrieve_all=True,
+                                    fields=list(columns_short))
         self.assertEqual(headers, list(headers_short))
         self.assertEqual(
             list(data),
@@ -233,7 +234,8 @@ class TestListResAssoc(fakes.TestNeutronClientBgpvpn):
         headers, data = self.cmd.take_action(parsed_args)
 
         self.neutronclient.list_bgpvpn_fake_resource_assocs.\
-            assert_called_once_with(fake_bgpvpn['id'], retrieve_all=True)
+            assert_called_once_with(fake_bgpvpn['id'], retrieve_all=True,
+                                    fields=list(columns_long))
         self.assertEqual(headers, list(headers_long))
         self.assertEqual(
             list(data),
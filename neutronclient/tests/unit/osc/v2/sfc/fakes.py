@@ -34,6 +34,9 @@ class TestNeutronClientOSCV2(utils.TestCommand):
             side_effect=lambda resource, name_or_id, project_id=None,
             cmd_resource=None, parent_id=None, fields=None:
             {'id': name_or_id})
+        self.neutronclient.find_resources = mock.Mock(
+            side_effect=lambda resource, names_or_ids, **kwargs:
+            [{'id': name_or_id} for name_or_id in names_or_ids])
 
 
 class FakeSfcPortPair(object):
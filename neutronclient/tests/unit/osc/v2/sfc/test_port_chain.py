@@ -269,19 +269,9 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
     def test_set_flow_classifier(self):
         target = self.resource['id']
         fc1 = 'flow_classifier1'
-
-        def _mock_flow_classifier(*args, **kwargs):
-
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    'flow_classifier', fc1, cmd_resource='sfc_flow_classifier')
-                return {'id': args[1]}
-
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'flow_classifiers': self.pc_fcs}
-        self.neutronclient.find_resource.side_effect = _mock_flow_classifier
+        self.neutronclient.find_resource.side_effect = None
+        self.neutronclient.find_resource.return_value = {
+            'flow_classifiers': self.pc_fcs}
         arglist = [
             target,
             '--flow-classifier', fc1,
@@ -294,7 +284,11 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'flow_classifiers': sorted(self.pc_fcs + [fc1])}
         self.mocked.assert_called_once_with(target, {self.res: expect})
-        self.assertEqual(2, self.neutronclient.find_resource.call_count)
+        self.neutronclient.find_resource.assert_called_once_with(
+            self.res, target, cmd_resource='sfc_port_chain')
+        self.neutronclient.find_resources.assert_called_once_with(
+            'flow_classifier', [fc1], cmd_resource='sfc_flow_classifier',
+            fields='id')
         self.assertIsNone(result)
 
     def test_set_no_flow_classifier(self):
@@ -320,26 +314,9 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         existing_ppgs = copy.deepcopy(self.pc_ppgs)
         ppg1 = 'port_pair_group1'
         ppg2 = 'port_pair_group2'
-
-        def _mock_flow_classifier(*args, **kwargs):
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'port_pair_groups': self.pc_ppgs}
-
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg1,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-
-            if self.neutronclient.find_resource.call_count == 3:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg2,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-
-        self.neutronclient.find_resource.side_effect = _mock_flow_classifier
+        self.neutronclient.find_resource.side_effect = None
+        self.neutronclient.find_resource.return_value = {
+            'port_pair_groups': self.pc_ppgs}
         arglist = [
             target,
             '--port-pair-group', ppg1,
@@ -353,28 +330,17 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'port_pair_groups': sorted(existing_ppgs + [ppg1, ppg2])}
         self.mocked.assert_called_once_with(target, {self.res: expect})
-        self.assertEqual(3, self.neutronclient.find_resource.call_count)
+        self.neutronclient.find_resource.assert_called_once_with(
+            self.res, target, cmd_resource='sfc_port_chain')
+        self.neutronclient.find_resources.assert_called_once_with(
+            'port_pair_group', [ppg1, ppg2],
+            cmd_resource='sfc_port_pair_group', fields='id')
         self.assertIsNone(result)
 
     def test_set_no_port_pair_group(self):
         target = self.resource['id']
         ppg1 = 'port_pair_group1'
         ppg2 = 'port_pair_group2'
-
-        def _mock_port_pair_group(*args, **kwargs):
-
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg1,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg2,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-
-        self.neutronclient.find_resource.side_effect = _mock_port_pair_group
         arglist = [
             target,
             '--no-port-pair-group',
@@ -390,7 +356,10 @@ class TestSetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'port_pair_groups': [ppg1, ppg2]}
         self.mocked.assert_called_once_with(target, {self.res: expect})
-        self.assertEqual(2, self.neutronclient.find_resource.call_count)
+        self.assertEqual(0, self.neutronclient.find_resource.call_count)
+        self.neutronclient.find_resources.assert_called_once_with(
+            'port_pair_group', [ppg1, ppg2],
+            cmd_resource='sfc_port_pair_group', fields='id')
         self.assertIsNone(result)
 
     def test_set_only_no_port_pair_group(self):
@@ -482,24 +451,9 @@ class TestUnsetSfcPortChain(fakes.TestNeutronClientOSCV2):
     def test_unset_port_pair_group(self):
         target = self.resource['id']
         ppg1 = 'port_pair_group1'
-
-        def _mock_port_pair_group(*args, **kwargs):
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'port_pair_groups': self.pc_ppgs}
-
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    'port_pair_group', ppg1,
-                    cmd_resource='sfc_port_pair_group')
-                return {'id': args[1]}
-            if self.neutronclient.find_resource.call_count == 3:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'id': args[1]}
-        self.neutronclient.find_resource.side_effect = _mock_port_pair_group
-
+        self.neutronclient.find_resource.side_effect = None
+        self.neutronclient.find_resource.return_value = {
+            'port_pair_groups': self.pc_ppgs}
         arglist = [
             target,
             '--port-pair-group', ppg1,
@@ -512,24 +466,39 @@ class TestUnsetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'port_pair_groups': sorted(self.pc_ppgs)}
         self.mocked.assert_called_once_with(target, {self.res: expect})
+        self.neutronclient.find_resources.assert_called_once_with(
+            'port_pair_group', [ppg1], cmd_resource='sfc_port_pair_group',
+            fields='id')
+        self.assertIsNone(result)
+
+    def test_unset_several_port_pair_groups(self):
+        target = self.resource['id']
+        ppg1 = 'port_pair_group1'
+        ppg2 = 'port_pair_group2'
+        self.neutronclient.find_resource.side_effect = None
+        self.neutronclient.find_resource.return_value = {
+            'port_pair_groups': self.pc_ppgs + [ppg1, ppg2]}
+        arglist = [
+            target,
+            '--port-pair-group', ppg1,
+            '--port-pair-group', ppg2,
+        ]
+        verifylist = [
+            (self.res, target),
+            ('port_pair_groups', [ppg1, ppg2])
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        result = self.cmd.take_action(parsed_args)
+        expect = {'port_pair_groups': sorted(self.pc_ppgs)}
+        self.mocked.assert_called_once_with(target, {self.res: expect})
         self.assertIsNone(result)
 
     def test_unset_flow_classifier(self):
         target = self.resource['id']
         fc1 = 'flow_classifier1'
-
-        def _mock_flow_classifier(*args, **kwargs):
-            if self.neutronclient.find_resource.call_count == 1:
-                self.neutronclient.find_resource.assert_called_with(
-                    self.res, target, cmd_resource='sfc_port_chain')
-                return {'flow_classifiers': self.pc_fcs}
-
-            if self.neutronclient.find_resource.call_count == 2:
-                self.neutronclient.find_resource.assert_called_with(
-                    'flow_classifier', fc1, cmd_resource='sfc_flow_classifier')
-                return {'id': args[1]}
-        self.neutronclient.find_resource.side_effect = _mock_flow_classifier
-
+        self.neutronclient.find_resource.side_effect = None
+        self.neutronclient.find_resource.return_value = {
+            'flow_classifiers': self.pc_fcs}
         arglist = [
             target,
             '--flow-classifier', fc1,
@@ -542,6 +511,9 @@ class TestUnsetSfcPortChain(fakes.TestNeutronClientOSCV2):
         result = self.cmd.take_action(parsed_args)
         expect = {'flow_classifiers': sorted(self.pc_fcs)}
         self.mocked.assert_called_once_with(target, {self.res: expect})
+        self.neutronclient.find_resources.assert_called_once_with(
+            'flow_classifier', [fc1], cmd_resource='sfc_flow_classifier',
+            fields='id')
         self.assertIsNone(result)
 
     def test_unset_all_flow_classifier(self):
@@ -33,6 +33,10 @@ def _get_id(client, id_or_name, resource):
     return id_or_name
 
 
+def _get_ids(client, ids_or_names, resource):
+    return list(ids_or_names)
+
+
 class TestCreateNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
     # The new trunk created
     _trunk = fakes.FakeTrunk.create_one_trunk()
@@ -64,6 +68,8 @@ class TestCreateNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
         super(TestCreateNetworkTrunk, self).setUp()
         mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_id',
                    new=_get_id).start()
+        mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_ids',
+                   new=_get_ids).start()
         self.neutronclient.create_trunk = mock.Mock(
             return_value={trunk.TRUNK: self._trunk})
         self.data = self.get_data()
@@ -224,6 +230,8 @@ class TestDeleteNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
 
         mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_id',
                    new=_get_id).start()
+        mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_ids',
+                   new=_get_ids).start()
         self.neutronclient.delete_trunk = mock.Mock(return_value=None)
 
         # Get the command object to test
@@ -316,6 +324,8 @@ class TestShowNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
 
         mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_id',
                    new=_get_id).start()
+        mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_ids',
+                   new=_get_ids).start()
         self.neutronclient.show_trunk = mock.Mock(
             return_value={trunk.TRUNK: self._trunk})
 
@@ -389,6 +399,8 @@ class TestListNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
         super(TestListNetworkTrunk, self).setUp()
         mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_id',
                    new=_get_id).start()
+        mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_ids',
+                   new=_get_ids).start()
         self.neutronclient.list_trunks = mock.Mock(
             return_value={trunk.TRUNKS: self._trunks})
 
@@ -451,6 +463,8 @@ class TestSetNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
         super(TestSetNetworkTrunk, self).setUp()
         mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_id',
                    new=_get_id).start()
+        mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_ids',
+                   new=_get_ids).start()
         self.neutronclient.update_trunk = mock.Mock(
             return_value={trunk.TRUNK: self._trunk})
         self.neutronclient.trunk_add_subports = mock.Mock(
@@ -680,6 +694,8 @@ class TestListNetworkSubport(test_fakes.TestNeutronClientOSCV2):
         super(TestListNetworkSubport, self).setUp()
         mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_id',
                    new=_get_id).start()
+        mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_ids',
+                   new=_get_ids).start()
         self.neutronclient.trunk_get_subports = mock.Mock(
             return_value={trunk.SUB_PORTS: self._subports})
 
@@ -731,6 +747,8 @@ class TestUnsetNetworkTrunk(test_fakes.TestNeutronClientOSCV2):
 
         mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_id',
                    new=_get_id).start()
+        mock.patch('neutronclient.osc.v2.trunk.network_trunk._get_ids',
+                   new=_get_ids).start()
         self.neutronclient.trunk_remove_subports = mock.Mock(
             return_value=None)
 
@@ -0,0 +1,106 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import six
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.tests.unit import fake_server
+
+if six.PY3:
+    import asyncio
+
+    from neutronclient.v2_0 import async_client
+
+TOKEN = 'testtoken'
+NET_ID = 'a8e4e5a2-a6ed-4c6a-8b2c-1a2b3c4d5e6f'
+
+
+def _paginated_ports(method, path, query, body):
+    if 'marker' in query:
+        return 200, {'ports': [{'id': 'p3'}]}
+    return 200, {'ports': [{'id': 'p1'}, {'id': 'p2'}],
+                 'ports_links': [{'rel': 'next',
+                                  'href': 'http://h/v2.0/ports?marker=p2'}]}
+
+
+class ThreadedAsyncClientTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ThreadedAsyncClientTest, self).setUp()
+        if six.PY2:
+            self.skipTest('asyncio requires Python 3')
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/networks'): (200, {'networks': [{'id': NET_ID}]}),
+            ('GET', '/v2.0/networks/%s' % NET_ID): (
+                200, {'network': {'id': NET_ID, 'name': 'net1'}}),
+            ('POST', '/v2.0/networks'): (
+                201, {'network': {'id': NET_ID, 'name': 'net1'}}),
+            ('GET', '/v2.0/ports'): _paginated_ports,
+            ('DELETE', '/v2.0/networks/missing'): (
+                404, {'NeutronError': {'type': 'NetworkNotFound',
+                                       'message': 'not found',
+                                       'detail': ''}}),
+        }))
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.client = async_client.ThreadedAsyncClient(
+            loop=self.loop, token=TOKEN, endpoint_url=self.server.url)
+        self.addCleanup(self.client.close)
+
+    def _run(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    def test_list(self):
+        result = self._run(self.client.list_networks())
+        self.assertEqual([{'id': NET_ID}], result['networks'])
+
+    def test_show(self):
+        result = self._run(self.client.show_network(NET_ID))
+        self.assertEqual('net1', result['network']['name'])
+
+    def test_create(self):
+        body = {'network': {'name': 'net1'}}
+        result = self._run(self.client.create_network(body=body))
+        self.assertEqual(NET_ID, result['network']['id'])
+
+    def test_concurrent_calls(self):
+        calls = [self.client.show_network(NET_ID) for i in range(5)]
+        results = self._run(asyncio.gather(*calls))
+        self.assertEqual(5, len(results))
+        self.assertEqual(5, len(self.server.requests))
+
+    def test_error_is_mapped(self):
+        self.assertRaises(exceptions.NetworkNotFoundClient, self._run,
+                          self.client.delete_network('missing'))
+
+    def test_async_pagination(self):
+        ports = self.client.list_ports(retrieve_all=False)
+        self.assertIs(ports, ports.__aiter__())
+        pages = []
+        while True:
+            try:
+                pages.append(self._run(ports.__anext__()))
+            except StopAsyncIteration:  # noqa
+                break
+        self.assertEqual([['p1', 'p2'], ['p3']],
+                         [[p['id'] for p in page['ports']] for page in pages])
+
+    def test_extension_hooks_are_wrapped(self):
+        result = self._run(self.client.show_ext('/networks/%s', NET_ID))
+        self.assertEqual('net1', result['network']['name'])
+
+    def test_sync_helpers_are_not_wrapped(self):
+        self.assertEqual('networks',
+                         self.client.get_resource_plural('network'))
+        self.assertEqual('/networks', self.client.networks_path)
@@ -0,0 +1,129 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import threading
+
+import testtools
+
+from neutronclient.common import batch
+from neutronclient.common import exceptions
+from neutronclient.tests.unit import fake_server
+from neutronclient.v2_0 import client
+
+
+class BatchTest(testtools.TestCase):
+
+    def _double(self, value):
+        if value < 0:
+            raise ValueError(value)
+        return value * 2
+
+    def test_results_are_ordered(self):
+        with batch.Batch(self, max_workers=4) as calls:
+            queued = [calls.submit(self._double, i) for i in range(20)]
+        self.assertEqual([i * 2 for i in range(20)], calls.results)
+        self.assertEqual([i * 2 for i in range(20)],
+                         [call.result() for call in queued])
+        self.assertEqual([], calls.errors)
+
+    def test_errors_are_collected(self):
+        with batch.Batch(self) as calls:
+            calls.submit(self._double, 1)
+            failed = calls.submit(self._double, -1)
+            calls.submit(self._double, 2)
+        self.assertEqual(2, calls.results[0])
+        self.assertIsInstance(calls.results[1], ValueError)
+        self.assertEqual(4, calls.results[2])
+        self.assertEqual([(1, failed.exception)], calls.errors)
+        self.assertRaises(ValueError, failed.result)
+
+    def test_not_run_when_block_fails(self):
+        def fail():
+            with batch.Batch(self) as calls:
+                calls.submit(self.fail, 'Should not be run')
+                raise KeyError()
+        self.assertRaises(KeyError, fail)
+
+    def test_result_before_run(self):
+        calls = batch.Batch(self)
+        call = calls.submit(self._double, 1)
+        self.assertRaises(RuntimeError, call.result)
+        self.assertEqual([2], calls.run())
+        self.assertEqual(2, call.result())
+
+    def test_client_methods(self):
+        calls = batch.Batch(self)
+        call = calls._double(3)
+        self.assertIsInstance(call, batch.BatchCall)
+        calls.run()
+        self.assertEqual(6, call.result())
+        self.assertRaises(AttributeError, getattr, calls, 'missing')
+
+
+class ClientBatchTest(testtools.TestCase):
+
+    workers = 4
+
+    def setUp(self):
+        super(ClientBatchTest, self).setUp()
+        self.barrier = threading.Semaphore(0)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/ports/p%d' % i): self._show('port', 'p%d' % i)
+            for i in range(8)}))
+        self.server.responses[('GET', '/v2.0/subnets/s1')] = self._show(
+            'subnet', 's1')
+        self.server.responses[('GET', '/v2.0/ports/missing')] = (
+            404, {'NeutronError': {'type': 'PortNotFound',
+                                   'message': 'Not found', 'detail': ''}})
+        self.neutron = client.Client(token='token',
+                                     endpoint_url=self.server.url)
+
+    def _show(self, resource, resource_id):
+        def show(method, path, query, body):
+            with self.lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+                if self.running == self.workers:
+                    for i in range(self.workers):
+                        self.barrier.release()
+            # Makes sure the calls are run concurrently.
+            self.barrier.acquire()
+            with self.lock:
+                self.running -= 1
+            return 200, {resource: {'id': resource_id}}
+        return show
+
+    def test_concurrent_calls(self):
+        with self.neutron.batch(max_workers=self.workers) as calls:
+            ports = [calls.show_port('p%d' % i) for i in range(7)]
+            subnet = calls.show_subnet('s1')
+        self.assertEqual(['p%d' % i for i in range(7)],
+                         [port.result()['port']['id'] for port in ports])
+        self.assertEqual('s1', subnet.result()['subnet']['id'])
+        self.assertEqual(self.workers, self.max_running)
+        self.assertEqual(8, len(calls.request_ids))
+        self.assertEqual(sorted(calls.request_ids),
+                         sorted('req-%d' % (i + 1) for i in range(8)))
+
+    def test_failed_call(self):
+        self.workers = 1
+        calls = self.neutron.batch()
+        calls.show_port('p1')
+        missing = calls.show_port('missing')
+        calls.run()
+        self.assertIsInstance(missing.exception, exceptions.NotFound)
+        self.assertEqual(1, len(calls.errors))
+        self.assertEqual(2, len(calls.request_ids))
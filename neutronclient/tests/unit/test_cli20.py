@@ -18,22 +18,28 @@ import contextlib
 import itertools
 import json
 import sys
+import time
 
+import fixtures
 import mock
 from mox3 import mox
 from oslo_utils import encodeutils
+from oslo_utils import uuidutils
 from oslotest import base
 import requests
 import six
 import six.moves.urllib.parse as urlparse
 import yaml
 
+from neutronclient import client as http_client
 from neutronclient.common import constants
 from neutronclient.common import exceptions
+from neutronclient.common import serializer
 from neutronclient.common import utils
 from neutronclient.neutron import v2_0 as neutronV2_0
 from neutronclient.neutron.v2_0 import network
 from neutronclient import shell
+from neutronclient.tests.unit import fake_server
 from neutronclient.v2_0 import client
 
 API_VERSION = "2.0"
@@ -61,6 +67,9 @@ class FakeStdout(object):
     def write(self, text):
         self.content.append(text)
 
+    def flush(self):
+        pass
+
     def make_string(self):
         result = ''
         for line in self.content:
@@ -84,8 +93,9 @@ class MyResp(requests.Response):
 
 
 class MyApp(object):
-    def __init__(self, _stdout):
+    def __init__(self, _stdout, _stdin=None):
         self.stdout = _stdout
+        self.stdin = _stdin or sys.stdin
 
 
 def end_url(path, query=None):
@@ -181,6 +191,10 @@ class CLITestV20Base(base.BaseTestCase):
                          cmd_resource=None, parent_id=None):
         return name_or_id
 
+    def _find_resourceids(self, client, resource, names_or_ids,
+                          cmd_resource=None, parent_id=None):
+        return list(names_or_ids)
+
     def setUp(self, plurals=None):
         """Prepare the test environment."""
         super(CLITestV20Base, self).setUp()
@@ -198,6 +212,8 @@ class CLITestV20Base(base.BaseTestCase):
                    new=self._find_resourceid).start()
         mock.patch('neutronclient.neutron.v2_0.find_resourceid_by_id',
                    new=self._find_resourceid).start()
+        mock.patch('neutronclient.neutron.v2_0.find_resourceids_by_name_or_id',
+                   new=self._find_resourceids).start()
 
         self.client = client.Client(token=TOKEN, endpoint_url=self.endurl)
 
@@ -288,8 +304,9 @@ class CLITestV20Base(base.BaseTestCase):
         path = getattr(self.client, cmd_resources + "_path")
         if parent_id:
             path = path % parent_id
+        query = self._add_list_fields(cmd, list(args), '')
         self.client.httpclient.request(
-            end_url(path), 'GET',
+            MyUrlComparator(end_url(path, query), self.client), 'GET',
             body=None,
             headers=mox.ContainsKeyValue(
                 'X-Auth-Token', TOKEN)).AndReturn((MyResp(200), resstr))
@@ -382,6 +399,8 @@ class CLITestV20Base(base.BaseTestCase):
         if output_format:
             args.append('-f')
             args.append(output_format)
+        if not (fields_1 or fields_2 or detail):
+            query = self._add_list_fields(cmd, args, query)
         self.client.httpclient.request(
             MyUrlComparator(end_url(path, query),
                             self.client),
@@ -399,6 +418,13 @@ class CLITestV20Base(base.BaseTestCase):
             self.assertIn('myid1', _str)
         return _str
 
+    def _add_list_fields(self, cmd, args, query):
+        """Add the fields a list command requests to show its columns."""
+        parsed_args = cmd.get_parser('list').parse_known_args(args)[0]
+        for field in cmd.get_list_fields(parsed_args) or []:
+            query = (query + '&' if query else '') + 'fields=' + field
+        return query
+
     def _test_list_resources_with_pagination(self, resources, cmd,
                                              base_args=None,
                                              cmd_resources=None,
@@ -412,6 +438,8 @@ class CLITestV20Base(base.BaseTestCase):
         path = getattr(self.client, cmd_resources + "_path")
         if parent_id:
             path = path % parent_id
+        args = base_args if base_args is not None else []
+        query = self._add_list_fields(cmd, args, query)
         fake_query = "marker=myid2&limit=2"
         reses1 = {resources: [{'id': 'myid1', },
                               {'id': 'myid2', }],
@@ -422,7 +450,7 @@ class CLITestV20Base(base.BaseTestCase):
         resstr1 = self.client.serialize(reses1)
         resstr2 = self.client.serialize(reses2)
         self.client.httpclient.request(
-            end_url(path, query), 'GET',
+            MyUrlComparator(end_url(path, query), self.client), 'GET',
             body=None,
             headers=mox.ContainsKeyValue(
                 'X-Auth-Token', TOKEN)).AndReturn((MyResp(200), resstr1))
@@ -434,7 +462,6 @@ class CLITestV20Base(base.BaseTestCase):
                 'X-Auth-Token', TOKEN)).AndReturn((MyResp(200), resstr2))
         self.mox.ReplayAll()
         cmd_parser = cmd.get_parser("list_" + cmd_resources)
-        args = base_args if base_args is not None else []
         shell.run_command(cmd, cmd_parser, args)
         self.mox.VerifyAll()
         self.mox.UnsetStubs()
@@ -1026,6 +1053,314 @@ class GeneratorWithMetaTest(base.BaseTestCase):
         self.assertEqual([REQUEST_ID], obj.request_ids)
 
 
+class StreamedListTest(base.BaseTestCase):
+
+    ports = [{'id': 'myid%d' % i, 'name': u'p\u00e9rt%d' % i,
+              'fixed_ips': [{'ip_address': '10.0.0.%d' % i}]}
+             for i in range(5)]
+
+    def _paginate(self, method, path, query, body):
+        start = int(query.get('marker', ['0'])[0])
+        res = {'ports': self.ports[start:start + 3]}
+        if start == 0:
+            res['ports_links'] = [{'rel': 'next',
+                                   'href': 'http://h/v2.0/ports?marker=3'}]
+        return 200, res
+
+    def setUp(self):
+        super(StreamedListTest, self).setUp()
+        self.server = self.useFixture(fake_server.FakeNeutronServer(
+            {('GET', '/v2.0/ports'): self._paginate,
+             ('GET', '/v2.0/bad'): (200, '{"ports": [{"id": ')}))
+        self.client = client.Client(token=TOKEN,
+                                    endpoint_url=self.server.url)
+
+    def test_decode_byte_by_byte(self):
+        body = {'ports': self.ports, 'ports_links': [{'rel': 'next'}],
+                'count': 12345}
+        data = json.dumps(body).encode('utf-8')
+        decoder = serializer.JSONCollectionStreamDeserializer('ports')
+        chunks = [data[i:i + 1] for i in range(len(data))]
+        self.assertEqual(self.ports, list(decoder.iter_resources(chunks)))
+        self.assertEqual({'ports_links': [{'rel': 'next'}], 'count': 12345},
+                         decoder.extra)
+
+    def test_decode_truncated_body(self):
+        decoder = serializer.JSONCollectionStreamDeserializer('ports')
+        self.assertRaises(exceptions.MalformedResponseBody, list,
+                          decoder.iter_resources([b'{"ports": [{"id": ']))
+
+    def test_list_retrieve_all(self):
+        result = self.client.list('ports', '/ports', stream=True)
+        self.assertEqual({'ports': self.ports}, result)
+        self.assertEqual(['req-1', 'req-2'], result.request_ids)
+
+    def test_list_generator_yields_resources(self):
+        result = self.client.list_ports(retrieve_all=False, stream=True)
+        self.assertEqual(self.ports[0], next(result))
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual(['req-1'], result.request_ids)
+        self.assertEqual(self.ports[1:], list(result))
+        self.assertEqual(['req-1', 'req-2'], result.request_ids)
+
+    def test_list_malformed_body(self):
+        self.assertRaises(exceptions.MalformedResponseBody,
+                          self.client.list, 'ports', '/bad', stream=True)
+
+
+class ChunkedListTest(base.BaseTestCase):
+
+    max_uri_len = 1500
+    # Page size of the server when the request does not set a limit.
+    page_size = 0
+
+    def setUp(self):
+        super(ChunkedListTest, self).setUp()
+        self.ports = [{'id': uuidutils.generate_uuid(),
+                       'device_id': 'dev%d' % (i % 2)} for i in range(200)]
+        self.server = self.useFixture(fake_server.FakeNeutronServer(
+            {('GET', '/v2.0/ports'): self._list_ports}))
+        self.useFixture(fixtures.MockPatchObject(
+            http_client, 'MAX_URI_LEN', self.max_uri_len))
+        self.client = client.Client(token=TOKEN,
+                                    endpoint_url=self.server.url)
+
+    def _list_ports(self, method, path, query, body):
+        ids = set(query.get('id', []))
+        ports = [p for p in self.ports
+                 if p['id'] in ids and
+                 p['device_id'] in query.get('device_id', [p['device_id']])]
+        limit = int(query.get('limit', [self.page_size])[0])
+        if not limit:
+            return 200, {'ports': ports}
+        marker = query.get('marker', [None])[0]
+        start = 0
+        if marker:
+            start = [p['id'] for p in ports].index(marker) + 1
+        res = {'ports': ports[start:start + limit]}
+        if start + limit < len(ports):
+            # Like neutron, echo the filters in the link to the next page.
+            params = dict(query, marker=ports[start + limit - 1]['id'])
+            res['ports_links'] = [{
+                'rel': 'next',
+                'href': '%s/v2.0/ports?%s' % (
+                    self.server.url, urlparse.urlencode(params, doseq=1))}]
+        return 200, res
+
+    def _uri_lens(self):
+        return [len(self.server.url + path)
+                for method, path in self.server.requests]
+
+    def test_long_filter_is_split(self):
+        ids = [p['id'] for p in self.ports]
+        res = self.client.list_ports(id=ids)
+        self.assertEqual(self.ports, res['ports'])
+        self.assertGreater(len(self.server.requests), 1)
+        self.assertLessEqual(max(self._uri_lens()), self.max_uri_len)
+        self.assertEqual(['req-%d' % (i + 1)
+                          for i in range(len(self.server.requests))],
+                         res.request_ids)
+
+    def test_short_filter_is_not_split(self):
+        ids = [p['id'] for p in self.ports[:5]]
+        self.assertEqual(self.ports[:5],
+                         self.client.list_ports(id=ids)['ports'])
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_pagination_within_chunks(self):
+        self.page_size = 7
+        ids = [p['id'] for p in self.ports]
+        res = self.client.list_ports(id=ids, device_id=['dev0'])
+        self.assertEqual([p for p in self.ports if p['device_id'] == 'dev0'],
+                         res['ports'])
+        self.assertLessEqual(max(self._uri_lens()), self.max_uri_len)
+        self.assertTrue(any('marker=' in path
+                            for method, path in self.server.requests))
+
+    def test_generator_yields_pages_of_all_chunks(self):
+        ids = [p['id'] for p in self.ports]
+        pages = list(self.client.list_ports(retrieve_all=False, id=ids))
+        self.assertGreater(len(pages), 1)
+        self.assertEqual(self.ports,
+                         [p for page in pages for p in page['ports']])
+
+    def test_parallel_chunks(self):
+        neutron = client.Client(token=TOKEN, endpoint_url=self.server.url,
+                                chunk_workers=4)
+        ids = [p['id'] for p in self.ports]
+        res = neutron.list_ports(id=ids)
+        self.assertEqual(self.ports, res['ports'])
+        self.assertEqual(len(self.server.requests), len(res.request_ids))
+
+    def test_duplicates_are_merged(self):
+        ids = [p['id'] for p in self.ports]
+        res = self.client.list_ports(id=ids + ids[:1])
+        self.assertEqual(self.ports, res['ports'])
+
+    def test_unsplittable_filter(self):
+        fields = ['field%d' % i for i in range(200)]
+        self.assertRaises(exceptions.RequestURITooLong,
+                          self.client.list_ports, fields=fields)
+        self.assertEqual([], self.server.requests)
+
+    def test_sorted_or_paged_list_is_not_split(self):
+        ids = [p['id'] for p in self.ports]
+        for params in ({'sort_key': 'name'}, {'sort_dir': 'desc'},
+                       {'limit': 10}, {'marker': ids[0]},
+                       {'page_reverse': True}):
+            self.assertRaises(exceptions.RequestURITooLong,
+                              self.client.list_ports, id=ids, **params)
+        self.assertEqual([], self.server.requests)
+
+    def test_sorted_list_fitting_in_uri(self):
+        ids = [p['id'] for p in self.ports[:5]]
+        res = self.client.list_ports(id=ids, sort_key='id', limit=10)
+        self.assertEqual(5, len(res['ports']))
+        self.assertEqual(1, len(self.server.requests))
+
+
+class PrefetchListTest(base.BaseTestCase):
+
+    def setUp(self):
+        super(PrefetchListTest, self).setUp()
+        self.pages = 6
+        self.server = self.useFixture(fake_server.FakeNeutronServer(
+            {('GET', '/v2.0/ports'): self._paginate}))
+        self.client = client.Client(token=TOKEN,
+                                    endpoint_url=self.server.url)
+
+    def _paginate(self, method, path, query, body):
+        page = int(query.get('marker', ['0'])[0])
+        if page == 4 and query.get('fail'):
+            return 500, {'NeutronError': {'type': 'Error', 'message': 'Boom',
+                                          'detail': ''}}
+        res = {'ports': [{'id': 'port%d' % page}]}
+        if page + 1 < self.pages:
+            res['ports_links'] = [{
+                'rel': 'next',
+                'href': 'http://h/v2.0/ports?%s' % urlparse.urlencode(
+                    dict(query, marker=page + 1), doseq=1)}]
+        return 200, res
+
+    def _wait_for_requests(self, count):
+        deadline = time.time() + 5
+        while len(self.server.requests) < count:
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.001)
+
+    def test_next_pages_are_fetched_ahead(self):
+        result = self.client.list_ports(retrieve_all=False, prefetch=2)
+        self.assertEqual([{'id': 'port0'}], next(result)['ports'])
+        # Two pages wait to be consumed and the thread fetching a third one
+        # waits for room.
+        self._wait_for_requests(4)
+        time.sleep(0.05)
+        self.assertEqual(4, len(self.server.requests))
+        self.assertEqual(['req-1'], result.request_ids)
+        self.assertEqual([[{'id': 'port%d' % i}]
+                          for i in range(1, self.pages)],
+                         [page['ports'] for page in result])
+        self.assertEqual(['req-%d' % (i + 1) for i in range(self.pages)],
+                         result.request_ids)
+
+    def test_client_default(self):
+        neutron = client.Client(token=TOKEN, endpoint_url=self.server.url,
+                                prefetch_pages=1)
+        result = neutron.list_ports()
+        self.assertEqual([{'id': 'port%d' % i} for i in range(self.pages)],
+                         result['ports'])
+        self.assertEqual(['req-%d' % (i + 1) for i in range(self.pages)],
+                         result.request_ids)
+
+    def test_error_is_raised_after_previous_pages(self):
+        result = self.client.list_ports(retrieve_all=False, prefetch=3,
+                                        fail='1')
+        for i in range(4):
+            self.assertEqual('port%d' % i, next(result)['ports'][0]['id'])
+        self.assertRaises(exceptions.InternalServerError, next, result)
+
+    def test_disabled_by_default(self):
+        result = self.client.list_ports(retrieve_all=False)
+        next(result)
+        time.sleep(0.05)
+        self.assertEqual(1, len(self.server.requests))
+
+
+class BulkCreateTest(base.BaseTestCase):
+
+    def setUp(self):
+        super(BulkCreateTest, self).setUp()
+        self.bodies = []
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('POST', '/v2.0/ports'): self._create('ports'),
+            ('POST', '/v2.0/security-group-rules'): self._create(
+                'security_group_rules')}))
+        self.client = client.Client(token=TOKEN,
+                                    endpoint_url=self.server.url)
+
+    def _create(self, collection):
+        def create(method, path, query, body):
+            items = json.loads(body.decode('utf-8'))[collection]
+            self.bodies.append(body)
+            if any(item.get('name') == 'bad' for item in items):
+                return 400, {'NeutronError': {'type': 'BadRequest',
+                                              'message': 'Bad name',
+                                              'detail': ''}}
+            return 201, {collection: [dict(item, id='id-%s' % item['name'])
+                                      for item in items]}
+        return create
+
+    def _ports(self, count):
+        return [{'name': str(i), 'network_id': 'net'} for i in range(count)]
+
+    def test_batches(self):
+        res = self.client.create_ports_bulk(self._ports(25), batch_size=10)
+        self.assertEqual(['id-%d' % i for i in range(25)],
+                         [port['id'] for port in res['ports']])
+        self.assertEqual([10, 10, 5], [
+            len(json.loads(body.decode('utf-8'))['ports'])
+            for body in self.bodies])
+        self.assertEqual(['req-1', 'req-2', 'req-3'], res.request_ids)
+
+    def test_body_size_limit(self):
+        self.useFixture(fixtures.MockPatchObject(
+            client, 'BULK_CREATE_MAX_BODY', 300))
+        res = self.client.create_ports_bulk(self._ports(30))
+        self.assertEqual(30, len(res['ports']))
+        self.assertGreater(len(self.bodies), 1)
+        for body in self.bodies:
+            self.assertLessEqual(len(body), 300)
+
+    def test_concurrent_batches(self):
+        res = self.client.create_bulk('port', self._ports(50),
+                                      batch_size=5, workers=4)
+        self.assertEqual(['id-%d' % i for i in range(50)],
+                         [port['id'] for port in res['ports']])
+        self.assertEqual(10, len(res.request_ids))
+
+    def test_failed_batches(self):
+        ports = self._ports(9)
+        ports[4]['name'] = 'bad'
+        e = self.assertRaises(exceptions.BulkCreateFailed,
+                              self.client.create_ports_bulk, ports,
+                              batch_size=3, workers=2)
+        self.assertEqual(['id-%d' % i for i in (0, 1, 2, 6, 7, 8)],
+                         [port['id'] for port in e.created])
+        self.assertEqual(1, len(e.failures))
+        index, items, error = e.failures[0]
+        self.assertEqual(3, index)
+        self.assertEqual(ports[3:6], items)
+        self.assertIsInstance(error, exceptions.BadRequest)
+        self.assertEqual(3, len(e.request_ids))
+
+    def test_resource_path(self):
+        rules = [{'name': 'r%d' % i} for i in range(3)]
+        res = self.client.create_security_group_rules_bulk(rules)
+        self.assertEqual(3, len(res['security_group_rules']))
+        self.assertEqual([('POST', '/v2.0/security-group-rules')],
+                         self.server.requests)
+
+
 class CLITestV20OutputFormatter(CLITestV20Base):
 
     def _test_create_resource_with_formatter(self, fmt):
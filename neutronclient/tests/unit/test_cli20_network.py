@@ -15,14 +15,25 @@
 
 import itertools
 import sys
+import threading
+import time
 
+import fixtures
 from mox3 import mox
 from oslo_serialization import jsonutils
+from oslotest import base
+import six
 
+from neutronclient import client
 from neutronclient.common import exceptions
 from neutronclient.neutron.v2_0 import network
 from neutronclient import shell
+from neutronclient.tests.unit import fake_server
 from neutronclient.tests.unit import test_cli20
+from neutronclient.v2_0 import client as v2_0_client
+
+NET_ID = '11111111-2222-3333-4444-555555555555'
+NAMED_ID = '66666666-7777-8888-9999-000000000000'
 
 
 class CLITestV20CreateNetworkJSON(test_cli20.CLITestV20Base):
@@ -167,7 +178,7 @@ class CLITestV20ListNetworkJSON(test_cli20.CLITestV20Base):
         reses = {resources: []}
         resstr = self.client.serialize(reses)
         # url method body
-        query = "id=myfakeid"
+        query = "fields=id&id=myfakeid"
         args = ['-c', 'id', '--', '--id', 'myfakeid']
         path = getattr(self.client, resources + "_path")
         self.client.httpclient.request(
@@ -267,7 +278,9 @@ class CLITestV20ListNetworkJSON(test_cli20.CLITestV20Base):
         self.mox.StubOutWithMock(cmd, 'get_client')
         self.mox.StubOutWithMock(self.client.httpclient, 'request')
         cmd.get_client().MultipleTimes().AndReturn(self.client)
-        setup_list_stub('networks', data, '')
+        setup_list_stub('networks', data,
+                        'fields=id&fields=name&fields=subnets&'
+                        'fields=tenant_id')
         filters = ''
         for n in data:
             for s in n['subnets']:
@@ -363,7 +376,7 @@ class CLITestV20ListNetworkJSON(test_cli20.CLITestV20Base):
         reses = {resources: []}
         resstr = self.client.serialize(reses)
         # url method body
-        query = "router%3Aexternal=True&id=myfakeid"
+        query = "fields=id&router%3Aexternal=True&id=myfakeid"
         args = ['-c', 'id', '--', '--id', 'myfakeid']
         path = getattr(self.client, resources + "_path")
         self.client.httpclient.request(
@@ -419,6 +432,8 @@ class CLITestV20ListNetworkJSON(test_cli20.CLITestV20Base):
                 query += "&fields=" + field
             else:
                 query = "fields=" + field
+        if not (fields_1 or fields_2 or detail):
+            query = self._add_list_fields(cmd, args, query)
         if query:
             query += '&router%3Aexternal=True'
         else:
@@ -587,6 +602,165 @@ class CLITestV20DeleteNetworkJSON(test_cli20.CLITestV20Base):
                           resource, cmd, myid1, args, extra_id=myid2,
                           delete_fail=True)
 
+    def test_bulk_delete_network_from_stdin(self):
+        # Delete net: myid1 - (myid2 myid3 on stdin).
+        resource = 'network'
+        stdin = six.StringIO('myid2\n\nmyid3\n')
+        cmd = network.DeleteNetwork(test_cli20.MyApp(sys.stdout, stdin),
+                                    None)
+        self.mox.StubOutWithMock(cmd, "get_client")
+        self.mox.StubOutWithMock(self.client.httpclient, "request")
+        cmd.get_client().MultipleTimes().AndReturn(self.client)
+        path = self.client.network_path
+        for myid in ('myid1', 'myid2', 'myid3'):
+            self._test_set_path_and_delete(path, None, myid)
+        self.mox.ReplayAll()
+        cmd_parser = cmd.get_parser('delete_' + resource)
+        shell.run_command(cmd, cmd_parser, ['myid1', '-'])
+        self.mox.VerifyAll()
+        self.mox.UnsetStubs()
+        self.assertIn('Deleted network(s): myid1, myid2, myid3',
+                      self.fake_stdout.make_string())
+
+    def test_bulk_delete_network_invalid_concurrency(self):
+        cmd = network.DeleteNetwork(test_cli20.MyApp(sys.stdout), None)
+        cmd_parser = cmd.get_parser('delete_network')
+        self.assertRaises(exceptions.CommandError, shell.run_command, cmd,
+                          cmd_parser, ['--concurrency', '0', 'myid1'])
+
+
+class CLITestV20ConcurrentDeleteNetwork(test_cli20.CLITestV20Base):
+
+    def setUp(self):
+        super(CLITestV20ConcurrentDeleteNetwork, self).setUp()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        responses = dict((('DELETE', '/v2.0/networks/net%d' % i),
+                          self._delete) for i in range(8))
+        responses[('DELETE', '/v2.0/networks/missing')] = (
+            404, {'NeutronError': {'type': 'NetworkNotFound',
+                                   'message': 'Not found', 'detail': ''}})
+        responses[('DELETE', '/v2.0/networks/busy')] = (
+            409, {'NeutronError': {'type': 'NetworkInUse',
+                                   'message': 'In use', 'detail': ''}})
+        self.server = self.useFixture(fake_server.FakeNeutronServer(
+            responses))
+        self.client = v2_0_client.Client(token=test_cli20.TOKEN,
+                                         endpoint_url=self.server.url)
+
+    def _delete(self, method, path, query, body):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.02)
+        with self.lock:
+            self.running -= 1
+        return 204, ''
+
+    def test_concurrent_delete(self):
+        cmd = network.DeleteNetwork(test_cli20.MyApp(sys.stdout), None)
+        self.useFixture(fixtures.MockPatchObject(
+            cmd, 'get_client', return_value=self.client))
+        cmd_parser = cmd.get_parser('delete_network')
+        args = ['--concurrency', '4', 'missing'] + [
+            'net%d' % i for i in range(8)]
+        e = self.assertRaises(exceptions.NeutronCLIError, shell.run_command,
+                              cmd, cmd_parser, args)
+        self.assertIn("Unable to find network(s) with id(s) 'missing'",
+                      str(e))
+        self.assertIn('Deleted network(s): %s' % ', '.join(
+            'net%d' % i for i in range(8)), self.fake_stdout.make_string())
+        self.assertEqual(9, len(self.server.requests))
+        self.assertGreater(self.max_running, 1)
+        self.assertLessEqual(self.max_running, 4)
+
+    def test_concurrent_delete_stops_at_unexpected_error(self):
+        cmd = network.DeleteNetwork(test_cli20.MyApp(sys.stdout), None)
+        self.useFixture(fixtures.MockPatchObject(
+            cmd, 'get_client', return_value=self.client))
+        cmd_parser = cmd.get_parser('delete_network')
+        args = ['--concurrency', '2', 'net0', 'busy'] + [
+            'net%d' % i for i in range(1, 8)]
+        self.assertRaises(exceptions.NetworkInUseClient, shell.run_command,
+                          cmd, cmd_parser, args)
+        self.assertIn('Deleted network(s): net0',
+                      self.fake_stdout.make_string())
+        # The deletions in progress complete, no other one is started.
+        self.assertLessEqual(len(self.server.requests), 3)
+
+
+class CLITestV20NetworkByUUID(base.BaseTestCase):
+
+    def setUp(self):
+        super(CLITestV20NetworkByUUID, self).setUp()
+        not_found = (404, {'NeutronError': {'type': 'NetworkNotFound',
+                                            'message': 'Not found',
+                                            'detail': ''}})
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/networks'): self._list_networks,
+            ('GET', '/v2.0/networks/%s' % NET_ID): self._network,
+            ('PUT', '/v2.0/networks/%s' % NET_ID): self._network,
+            ('DELETE', '/v2.0/networks/%s' % NET_ID): (204, ''),
+            ('GET', '/v2.0/networks/%s' % NAMED_ID): not_found,
+            ('PUT', '/v2.0/networks/%s' % NAMED_ID): not_found,
+            ('DELETE', '/v2.0/networks/%s' % NAMED_ID): not_found,
+        }))
+        self.client = v2_0_client.Client(token=test_cli20.TOKEN,
+                                         endpoint_url=self.server.url)
+
+    def _list_networks(self, method, path, query, body):
+        if (query.get('id') == [NET_ID] or
+                query.get('name') in (['net1'], [NAMED_ID])):
+            return 200, {'networks': [{'id': NET_ID}]}
+        return 200, {'networks': []}
+
+    def _network(self, method, path, query, body):
+        return 200, {'network': {'id': NET_ID, 'name': 'net1'}}
+
+    def _run(self, cmd_class, args):
+        cmd = cmd_class(test_cli20.MyApp(six.StringIO()), None)
+        self.useFixture(fixtures.MockPatchObject(
+            cmd, 'get_client', return_value=self.client))
+        del self.server.requests[:]
+        shell.run_command(cmd, cmd.get_parser('cmd'), args)
+        return [request[0] for request in self.server.requests]
+
+    def test_uuid_single_request(self):
+        self.assertEqual(['GET'], self._run(network.ShowNetwork, [NET_ID]))
+        self.assertEqual(['PUT'], self._run(network.UpdateNetwork,
+                                            [NET_ID, '--name', 'net2']))
+        self.assertEqual(['DELETE'], self._run(network.DeleteNetwork,
+                                               [NET_ID]))
+
+    def test_name_is_looked_up(self):
+        self.assertEqual(['GET', 'GET'],
+                         self._run(network.ShowNetwork, ['net1']))
+        self.assertEqual(['GET', 'PUT'], self._run(network.UpdateNetwork,
+                                                   ['net1', '--name', 'n']))
+        self.assertEqual(['GET', 'DELETE'],
+                         self._run(network.DeleteNetwork, ['net1']))
+
+    def test_uuid_name_falls_back_to_lookup(self):
+        self.assertEqual(['GET', 'GET', 'GET', 'GET'],
+                         self._run(network.ShowNetwork, [NAMED_ID]))
+        self.assertEqual('/v2.0/networks/%s' % NET_ID,
+                         self.server.requests[-1][1])
+        self.assertEqual(['DELETE', 'GET', 'GET', 'DELETE'],
+                         self._run(network.DeleteNetwork, [NAMED_ID]))
+
+    def test_missing_uuid(self):
+        self.server.responses[('GET', '/v2.0/networks')] = (
+            200, {'networks': []})
+        cmd = network.ShowNetwork(test_cli20.MyApp(six.StringIO()), None)
+        self.useFixture(fixtures.MockPatchObject(
+            cmd, 'get_client', return_value=self.client))
+        e = self.assertRaises(exceptions.NotFound, shell.run_command,
+                              cmd, cmd.get_parser('show_network'), [NAMED_ID])
+        self.assertIn("Unable to find network with name or id '%s'" %
+                      NAMED_ID, str(e))
+        self.assertEqual(3, len(self.server.requests))
+
 
 class CLITestV20ExtendListNetworkJSON(test_cli20.CLITestV20Base):
     def _test_extend_list(self, mox_calls):
@@ -637,16 +811,15 @@ class CLITestV20ExtendListNetworkJSON(test_cli20.CLITestV20Base):
             sub_data_lists = [data[:len(data) - 1], data[len(data) - 1:]]
             filters, response = self._build_test_data(data)
 
-            # 1 char of extra URI len will cause a split in 2 requests
-            self.mox.StubOutWithMock(self.client.httpclient,
-                                     "_check_uri_length")
-            self.client.httpclient._check_uri_length(mox.IgnoreArg()).AndRaise(
-                exceptions.RequestURITooLong(excess=1))
+            # 1 char of extra URI len will cause a split in 2 requests,
+            # without sending the oversized one first.
+            url = test_cli20.end_url(path, 'fields=id&fields=cidr' + filters)
+            self.useFixture(fixtures.MockPatchObject(
+                client, 'MAX_URI_LEN',
+                len(url) + v2_0_client.PAGINATION_URI_RESERVE - 1))
 
             for data in sub_data_lists:
                 filters, response = self._build_test_data(data)
-                self.client.httpclient._check_uri_length(
-                    mox.IgnoreArg()).AndReturn(None)
                 self.client.httpclient.request(
                     test_cli20.MyUrlComparator(
                         test_cli20.end_url(
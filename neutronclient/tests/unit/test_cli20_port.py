@@ -17,11 +17,20 @@
 import itertools
 import sys
 
+import fixtures
 from mox3 import mox
+from oslotest import base
 
+from neutronclient.neutron.v2_0 import agentscheduler
+from neutronclient.neutron.v2_0.bgp import speaker
+from neutronclient.neutron.v2_0 import host
+from neutronclient.neutron.v2_0 import network
 from neutronclient.neutron.v2_0 import port
+from neutronclient.neutron.v2_0 import portforwarding
 from neutronclient import shell
+from neutronclient.tests.unit import fake_server
 from neutronclient.tests.unit import test_cli20
+from neutronclient.v2_0 import client
 
 
 class CLITestV20PortJSON(test_cli20.CLITestV20Base):
@@ -501,6 +510,8 @@ class CLITestV20PortJSON(test_cli20.CLITestV20Base):
                 query = "tag=" + tag
         if detail:
             query = query and query + '&verbose=True' or 'verbose=True'
+        if not (fields_1 or fields_2 or detail):
+            query = self._add_list_fields(cmd, args, query)
         query = query and query + '&device_id=%s' or 'device_id=%s'
         path = getattr(self.client, resources + "_path")
         self.client.httpclient.request(
@@ -772,3 +783,100 @@ class CLITestV20PortJSON(test_cli20.CLITestV20Base):
         myid = 'myid'
         args = [myid]
         self._test_delete_resource(resource, cmd, myid, args)
+
+
+class CLITestV20ListPortFields(base.BaseTestCase):
+
+    def setUp(self):
+        super(CLITestV20ListPortFields, self).setUp()
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/ports'): (200, {'ports': [
+                {'id': 'myid1', 'mac_address': 'fa:16:3e:00:00:01'}]})}))
+        self.cmd = port.ListPort(test_cli20.MyApp(sys.stdout), None)
+        self.useFixture(fixtures.MockPatchObject(
+            self.cmd, 'get_client', return_value=client.Client(
+                token=test_cli20.TOKEN, endpoint_url=self.server.url)))
+
+    def _list(self, args):
+        parsed_args = self.cmd.get_parser('list_ports').parse_args(args)
+        columns, rows = self.cmd.take_action(parsed_args)
+        return columns, list(rows), self.server.requests[-1][1]
+
+    def test_shown_columns_only(self):
+        columns, rows, path = self._list(['-c', 'id', '-c', 'mac_address'])
+        self.assertEqual('/v2.0/ports?fields=id&fields=mac_address', path)
+        self.assertEqual(['id', 'mac_address'], columns)
+        self.assertEqual([('myid1', 'fa:16:3e:00:00:01')], rows)
+
+    def test_list_columns(self):
+        path = self._list([])[2]
+        self.assertEqual('/v2.0/ports?fields=id&fields=name&'
+                         'fields=mac_address&fields=fixed_ips&'
+                         'fields=tenant_id', path)
+
+    def test_given_fields(self):
+        path = self._list(['-c', 'id', '-F', 'id', '-F', 'binding:profile'])[2]
+        self.assertEqual('/v2.0/ports?fields=id&fields=binding%3Aprofile',
+                         path)
+
+    def test_show_details(self):
+        path = self._list(['-c', 'id', '-D'])[2]
+        self.assertEqual('/v2.0/ports?verbose=True', path)
+
+    def _get_list_fields(self, cmd_class, args):
+        cmd = cmd_class(test_cli20.MyApp(sys.stdout), None)
+        parsed_args = cmd.get_parser('list').parse_known_args(args)[0]
+        return cmd.get_list_fields(parsed_args)
+
+    def test_extend_list_without_fields(self):
+        class ListPortExtended(port.ListPort):
+            def extend_list(self, data, parsed_args):
+                pass
+
+        class ListPortExtendedWithFields(ListPortExtended):
+            extend_list_fields = ['mac_address']
+
+        self.assertIsNone(self._get_list_fields(ListPortExtended,
+                                                ['-c', 'id']))
+        self.assertEqual(['id', 'mac_address'],
+                         self._get_list_fields(ListPortExtendedWithFields,
+                                               ['-c', 'id']))
+
+    def test_overridden_requests_without_fields(self):
+        # These commands send their own list requests, whose API may not
+        # support selecting fields.
+        for cmd_class in (agentscheduler.ListDhcpAgentsHostingNetwork,
+                          agentscheduler.ListL3AgentsHostingRouter,
+                          agentscheduler.ListNetworksOnDhcpAgent,
+                          agentscheduler.ListRoutersOnL3Agent,
+                          speaker.ListRoutesAdvertisedBySpeaker,
+                          port.ListRouterPort):
+            self.assertIsNone(self._get_list_fields(cmd_class, ['x']),
+                              cmd_class.__name__)
+        self.assertEqual(['id', 'name', 'subnets', 'tenant_id'],
+                         self._get_list_fields(network.ListExternalNetwork,
+                                               []))
+
+    def test_unsupported_api_without_fields(self):
+        self.assertIsNone(self._get_list_fields(host.ListHost, []))
+        self.assertIsNone(self._get_list_fields(
+            portforwarding.ListPortForwarding, []))
+
+    def test_routes_advertised_by_speaker(self):
+        self.server.responses.update({
+            ('GET', '/v2.0/bgp-speakers'): (
+                200, {'bgp_speakers': [{'id': 'speaker1'}]}),
+            ('GET', '/v2.0/bgp-speakers/speaker1/get_advertised_routes'): (
+                200, {'advertised_routes': [{'destination': '10.0.0.0/24',
+                                             'next_hop': '172.24.4.10'}]})})
+        cmd = speaker.ListRoutesAdvertisedBySpeaker(
+            test_cli20.MyApp(sys.stdout), None)
+        self.useFixture(fixtures.MockPatchObject(
+            cmd, 'get_client', return_value=client.Client(
+                token=test_cli20.TOKEN, endpoint_url=self.server.url)))
+        parsed_args = cmd.get_parser('list').parse_args(['speaker1'])
+        columns, rows = cmd.take_action(parsed_args)
+        self.assertEqual(['destination', 'next_hop'], list(columns))
+        self.assertEqual([('10.0.0.0/24', '172.24.4.10')], list(rows))
+        self.assertEqual('/v2.0/bgp-speakers/speaker1/get_advertised_routes',
+                         self.server.requests[-1][1])
@@ -15,8 +15,13 @@
 #
 
 import sys
+import threading
 
+import mock
+
+from neutronclient.common import exceptions
 from neutronclient.neutron.v2_0 import purge
+from neutronclient import shell
 from neutronclient.tests.unit import test_cli20
 
 
@@ -98,3 +103,67 @@ class CLITestV20Purge(test_cli20.CLITestV20Base):
         # and all are not deleteable
         deleted = self._generate_resources_dict()
         self._verify_result(my_purge, deleted, failed)
+
+
+class CLITestV20PurgeResources(test_cli20.CLITestV20Base):
+
+    def setUp(self):
+        super(CLITestV20PurgeResources, self).setUp()
+        self.resources = {
+            'floatingips': [{'id': 'fip%d' % i} for i in range(4)],
+            'ports': [{'id': 'port1', 'device_id': 'vm1',
+                       'device_owner': 'compute:nova'},
+                      {'id': 'port2', 'device_id': 'router1',
+                       'device_owner': 'network:router_interface'}],
+            'routers': [{'id': 'router1'}],
+            'networks': [{'id': 'net1'}, {'id': 'net2'}],
+            'security_groups': [{'id': 'sg1'}],
+        }
+        self.calls = []
+        self.lock = threading.Lock()
+        self.neutron = mock.Mock()
+        for collection, resources in self.resources.items():
+            getattr(self.neutron, 'list_%s' % collection).return_value = {
+                collection: resources}
+            delete = 'delete_%s' % collection[:-1]
+            getattr(self.neutron, delete).side_effect = self._recorder(delete)
+        self.neutron.remove_interface_router.side_effect = self._recorder(
+            'remove_interface_router')
+
+    def _recorder(self, name):
+        def record(resource_id, body=None):
+            with self.lock:
+                self.calls.append((name, resource_id))
+            if resource_id == 'net2':
+                raise exceptions.Conflict()
+        return record
+
+    def _run_purge(self, args):
+        cmd = purge.Purge(test_cli20.MyApp(sys.stdout), None)
+        with mock.patch.object(cmd, 'get_client',
+                               return_value=self.neutron):
+            shell.run_command(cmd, cmd.get_parser('purge'), args)
+        return self.fake_stdout.make_string()
+
+    def test_resources_are_filtered_by_server(self):
+        self._run_purge(['tenant1', 'tenant2'])
+        self.neutron.list_ports.assert_called_once_with(
+            fields=['id', 'device_id', 'device_owner'],
+            tenant_id=['tenant1', 'tenant2'])
+        self.neutron.list_networks.assert_called_once_with(
+            fields=['id'], tenant_id=['tenant1', 'tenant2'])
+
+    def test_tiers_are_deleted_in_order(self):
+        output = self._run_purge(['--concurrency', '3', 'tenant1'])
+        tiers = ['delete_floatingip', 'delete_port', 'delete_router',
+                 'delete_network', 'delete_security_group']
+        order = [tiers.index(name.replace('remove_interface_router',
+                                          'delete_port'))
+                 for name, resource_id in self.calls]
+        self.assertEqual(sorted(order), order)
+        self.assertIn(('remove_interface_router', 'router1'), self.calls)
+        self.assertNotIn(('delete_port', 'port2'), self.calls)
+        self.assertEqual(10, len(self.calls))
+        self.assertIn('Deleted 4 floatingips, 2 ports, 1 router, '
+                      '1 network, 1 security_group.', output)
+        self.assertIn('could not be deleted: 1 network.', output)
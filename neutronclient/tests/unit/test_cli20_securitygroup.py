@@ -16,14 +16,16 @@
 
 import sys
 
+import fixtures
 from mox3 import mox
 from oslo_utils import uuidutils
 import six
 
-from neutronclient.common import exceptions
+from neutronclient import client
 from neutronclient.common import utils
 from neutronclient.neutron.v2_0 import securitygroup
 from neutronclient.tests.unit import test_cli20
+from neutronclient.v2_0 import client as v2_0_client
 
 
 class CLITestV20SecurityGroupsJSON(test_cli20.CLITestV20Base):
@@ -296,16 +298,16 @@ class CLITestV20SecurityGroupsJSON(test_cli20.CLITestV20Base):
 
     def test_extend_list_exceed_max_uri_len(self):
         def mox_calls(path, data):
-            # 1 char of extra URI len will cause a split in 2 requests
-            self.mox.StubOutWithMock(self.client.httpclient,
-                                     '_check_uri_length')
-            self.client.httpclient._check_uri_length(mox.IgnoreArg()).AndRaise(
-                exceptions.RequestURITooLong(excess=1))
+            # 1 char of extra URI len will cause a split in 2 requests,
+            # without sending the oversized one first.
+            url = test_cli20.end_url(
+                path, self._build_test_data(data)[0]['filter'])
+            self.useFixture(fixtures.MockPatchObject(
+                client, 'MAX_URI_LEN',
+                len(url) + v2_0_client.PAGINATION_URI_RESERVE - 1))
             responses = self._build_test_data(data, excess=1)
 
             for item in responses:
-                self.client.httpclient._check_uri_length(
-                    mox.IgnoreArg()).AndReturn(None)
                 self.client.httpclient.request(
                     test_cli20.MyUrlComparator(
                         test_cli20.end_url(path, item['filter']), self.client),
@@ -421,7 +423,8 @@ class CLITestV20SecurityGroupsJSON(test_cli20.CLITestV20Base):
             self.assertEqual(exp, res)
 
     def _test_list_security_group_rules_extend_sg_name(
-            self, expected_mode=None, args=(), conv=True, query_field=False):
+            self, expected_mode=None, args=(), conv=True, query_field=False,
+            list_fields=None):
         if query_field:
             field_filters = ['id', 'security_group_id',
                              'remote_ip_prefix', 'remote_group_id']
@@ -456,27 +459,33 @@ class CLITestV20SecurityGroupsJSON(test_cli20.CLITestV20Base):
                                  ('ruleid3', 'group2', 'group2 (group)')]}
 
         self._test_list_security_group_rules_extend(
-            data, expected, args=args, conv=conv, query_fields=field_filters)
+            data, expected, args=args, conv=conv,
+            query_fields=field_filters or list_fields)
 
     def test_list_security_group_rules_extend_remote_sg_name(self):
         args = '-c id -c security_group -c remote'.split()
-        self._test_list_security_group_rules_extend_sg_name(args=args)
+        self._test_list_security_group_rules_extend_sg_name(
+            args=args, list_fields=['id', 'security_group_id',
+                                    'remote_ip_prefix', 'remote_group_id'])
 
     def test_list_security_group_rules_extend_sg_name_noconv(self):
         args = '--no-nameconv -c id -c security_group_id -c remote_group_id'
         args = args.split()
         self._test_list_security_group_rules_extend_sg_name(
-            expected_mode='noconv', args=args, conv=False)
+            expected_mode='noconv', args=args, conv=False,
+            list_fields=['id', 'security_group_id', 'remote_group_id'])
 
     def test_list_security_group_rules_extend_sg_name_with_columns(self):
         args = '-c id -c security_group_id -c remote_group_id'.split()
         self._test_list_security_group_rules_extend_sg_name(
-            expected_mode='remote_group_id', args=args)
+            expected_mode='remote_group_id', args=args,
+            list_fields=['id', 'security_group_id', 'remote_group_id'])
 
     def test_list_security_group_rules_extend_sg_name_with_columns_no_id(self):
         args = '-c id -c security_group -c remote_group'.split()
         self._test_list_security_group_rules_extend_sg_name(
-            expected_mode='remote_group_id', args=args)
+            expected_mode='remote_group_id', args=args,
+            list_fields=['id', 'security_group_id', 'remote_group_id'])
 
     def test_list_security_group_rules_extend_sg_name_with_fields(self):
         # NOTE: remote_ip_prefix is required to show "remote" column
@@ -505,7 +514,10 @@ class CLITestV20SecurityGroupsJSON(test_cli20.CLITestV20Base):
                     'data': [('ruleid1', 'group1', '172.16.18.0/24 (CIDR)'),
                              ('ruleid2', 'group2', '172.16.20.0/24 (CIDR)'),
                              ('ruleid3', 'group2', 'group3 (group)')]}
-        self._test_list_security_group_rules_extend(data, expected, args)
+        self._test_list_security_group_rules_extend(
+            data, expected, args,
+            query_fields=['id', 'security_group_id', 'remote_ip_prefix',
+                          'remote_group_id'])
 
     def test_list_security_group_rules_extend_proto_port(self):
         data = [self._prepare_rule(rule_id='ruleid1', sg_id='myid1',
@@ -527,7 +539,12 @@ class CLITestV20SecurityGroupsJSON(test_cli20.CLITestV20Base):
                 ('ruleid3', 'group2', 'ingress', 'IPv4', 'icmp',
                  '10.2.0.0/16 (CIDR)')
             ]}
-        self._test_list_security_group_rules_extend(data, expected)
+        self._test_list_security_group_rules_extend(
+            data, expected,
+            query_fields=['id', 'security_group_id', 'direction',
+                          'ethertype', 'protocol', 'port_range_min',
+                          'port_range_max', 'remote_ip_prefix',
+                          'remote_group_id', 'tenant_id'])
 
     def _prepare_rule(self, rule_id=None, sg_id=None, tenant_id=None,
                       direction=None, ethertype=None,
@@ -128,5 +128,6 @@ class CLITestV20Tag(test_cli20.CLITestV20Base):
         network.ListNetwork.extend_list(mox.IsA(list), mox.IgnoreArg())
         args = ['--not-tags', 'red,blue', '--tags-any', 'green',
                 '--not-tags-any', 'black']
-        query = "not-tags=red,blue&tags-any=green&not-tags-any=black"
+        query = ("not-tags=red,blue&tags-any=green&not-tags-any=black&"
+                 "fields=id&fields=name&fields=subnets&fields=tenant_id")
         self._test_tags_query(cmd, resources, args, query)
@@ -17,7 +17,10 @@
 import inspect
 import sys
 
+import fixtures
 import mock
+import pkg_resources
+import testtools
 
 from neutronclient.common import extension
 from neutronclient.neutron.v2_0.contrib import _fox_sockets as fox_sockets
@@ -219,3 +222,35 @@ class CLITestV20ExtensionJSONChildResource(test_cli20.CLITestV20Base):
         for method in methods:
             argspec = inspect.getargspec(method)
             self.assertIn("parent_id", argspec.args)
+
+
+class DiscoverExtensionsTest(testtools.TestCase):
+
+    def _set_entry_points(self, *entry_points):
+        dists = []
+        for text in entry_points:
+            dist = mock.Mock()
+            dist.has_metadata.return_value = text is not None
+            dist.get_metadata.return_value = text
+            dists.append(dist)
+        self.useFixture(fixtures.MockPatchObject(
+            pkg_resources, 'working_set', dists))
+        return self.useFixture(fixtures.MockPatch(
+            'stevedore.extension.ExtensionManager')).mock
+
+    def test_no_extension_is_not_scanned(self):
+        manager = self._set_entry_points(
+            None, '[console_scripts]\nfoo = foo:main\n')
+        self.assertEqual([], list(extension._discover_via_entry_points()))
+        self.assertFalse(manager.called)
+
+    def test_extensions_are_scanned(self):
+        manager = self._set_entry_points(
+            None, '[console_scripts]\nfoo = foo:main\n\n'
+                  '[neutronclient.extension]\nfox = foo.fox\n')
+        manager.return_value = [mock.Mock(plugin=fox_sockets)]
+        manager.return_value[0].name = 'fox'
+        self.assertEqual([('fox', fox_sockets)],
+                         list(extension._discover_via_entry_points()))
+        manager.assert_called_once_with('neutronclient.extension',
+                                        invoke_on_load=False)
@@ -0,0 +1,219 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import threading
+
+from keystoneauth1 import fixture as ks_fixture
+from keystoneauth1.identity import v2 as ks_v2
+from keystoneauth1 import session
+from oslo_serialization import jsonutils
+import testtools
+
+from neutronclient import client as http_client
+from neutronclient.tests.unit import fake_server
+from neutronclient.v2_0 import client
+
+THREADS = 8
+CALLS_PER_THREAD = 40
+NETWORKS = 10
+PAGES = 20
+REGION = 'RegionOne'
+
+
+class SharedClientStressTest(testtools.TestCase):
+    """Many threads sharing one client against a local server."""
+
+    def setUp(self):
+        super(SharedClientStressTest, self).setUp()
+        responses = {
+            ('POST', '/v2.0/tokens'): self._new_token,
+            ('GET', '/v2.0/networks'): self._list_networks,
+            ('POST', '/v2.0/networks'): self._create_network,
+        }
+        for i in range(NETWORKS):
+            path = '/v2.0/networks/net-%d' % i
+            responses[('GET', path)] = self._show_network
+            responses[('PUT', path)] = self._update_network
+            responses[('DELETE', path)] = self._delete_network
+        self.server = self.useFixture(fake_server.FakeNeutronServer(
+            responses))
+        self.lock = threading.Lock()
+        self.tokens = []
+        self.valid_token = None
+        self.revocations = 0
+        self.api_calls = 0
+
+    def _new_token(self, method, path, query, body):
+        with self.lock:
+            token_id = 'tok%d' % (len(self.tokens) + 1)
+            self.tokens.append(token_id)
+            self.valid_token = token_id
+        token = ks_fixture.V2Token(token_id=token_id)
+        token.set_scope()
+        token.add_service('network').add_endpoint(self.server.url,
+                                                  region=REGION)
+        return 200, token
+
+    def _authorized(self):
+        token = self.server.current_headers.get('x-auth-token')
+        with self.lock:
+            if token != self.valid_token:
+                return False
+            self.api_calls += 1
+            # Revoke the token every 50 calls so that the threads race to
+            # obtain a new one.
+            if self.api_calls % 50 == 0:
+                self.valid_token = None
+                self.revocations += 1
+            return True
+
+    def _network(self, path):
+        return {'id': path.rsplit('/', 1)[1],
+                'token': self.server.current_headers.get('x-auth-token')}
+
+    def _show_network(self, method, path, query, body):
+        if not self._authorized():
+            return 401, ''
+        return 200, {'network': self._network(path)}
+
+    def _update_network(self, method, path, query, body):
+        if not self._authorized():
+            return 401, ''
+        network = self._network(path)
+        network.update(jsonutils.loads(body)['network'])
+        return 200, {'network': network}
+
+    def _delete_network(self, method, path, query, body):
+        if not self._authorized():
+            return 401, ''
+        return 204, ''
+
+    def _create_network(self, method, path, query, body):
+        if not self._authorized():
+            return 401, ''
+        return 201, {'network': jsonutils.loads(body)['network']}
+
+    def _list_networks(self, method, path, query, body):
+        if not self._authorized():
+            return 401, ''
+        page = int(query.get('marker', ['0'])[0])
+        resp = {'networks': [{'id': 'net-%d' % page}]}
+        if page + 1 < PAGES:
+            resp['networks_links'] = [{
+                'rel': 'next',
+                'href': '%s/v2.0/networks?marker=%d' % (self.server.url,
+                                                        page + 1)}]
+        return 200, resp
+
+    def _run_threads(self, target, count=THREADS):
+        errors = []
+
+        def run(index):
+            try:
+                target(index)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(i,))
+                   for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+
+    def _hammer(self, neutron):
+        headers = {'X-Custom': 'value'}
+        results = []
+
+        def calls(index):
+            for i in range(CALLS_PER_THREAD):
+                net_id = 'net-%d' % ((index + i) % NETWORKS)
+                op = i % 4
+                if op == 0:
+                    res = neutron.show_network(net_id)
+                    self.assertEqual(net_id, res['network']['id'])
+                elif op == 1:
+                    name = 'thread-%d-%d' % (index, i)
+                    res = neutron.update_network(
+                        net_id, {'network': {'name': name}})
+                    self.assertEqual(net_id, res['network']['id'])
+                    self.assertEqual(name, res['network']['name'])
+                elif op == 2:
+                    name = 'new-%d-%d' % (index, i)
+                    res = neutron.create_network({'network': {'name': name}})
+                    self.assertEqual(name, res['network']['name'])
+                else:
+                    res = neutron.delete_network(net_id)
+                self.assertEqual(1, len(res.request_ids))
+                results.append(res.request_ids[0])
+                # Extra headers given by callers must not leak into, or be
+                # modified by, concurrent calls.
+                neutron.httpclient.do_request(
+                    '/v2.0/networks/%s' % net_id, 'GET', headers=headers)
+
+        self._run_threads(calls)
+        self.assertEqual({'X-Custom': 'value'}, headers)
+        self.assertEqual(THREADS * CALLS_PER_THREAD, len(set(results)))
+        # Only the GET requests made with them carry the caller's headers.
+        for (method, path), sent in zip(self.server.requests,
+                                        self.server.request_headers):
+            if 'x-custom' in sent:
+                self.assertEqual('GET', method)
+
+    def _assert_single_refresh_per_revocation(self):
+        # The last revocation may not have been noticed by any thread.
+        self.assertIn(len(self.tokens), (self.revocations,
+                                         self.revocations + 1))
+
+    def test_shared_http_client(self):
+        neutron = client.Client(username='user', password='secret',
+                                project_name='project', region_name=REGION,
+                                auth_url=self.server.url + '/v2.0')
+        self._hammer(neutron)
+        self.assertGreater(self.revocations, 5)
+        self._assert_single_refresh_per_revocation()
+
+    def test_shared_session_client(self):
+        auth = ks_v2.Password(self.server.url + '/v2.0', username='user',
+                              password='secret', tenant_name='project')
+        neutron = client.Client(session=session.Session(auth=auth),
+                                region_name=REGION)
+        self.assertIsInstance(neutron.httpclient, http_client.SessionClient)
+        self._hammer(neutron)
+        self.assertGreater(self.revocations, 5)
+        self._assert_single_refresh_per_revocation()
+
+    def test_generator_shared_by_threads(self):
+        neutron = client.Client(username='user', password='secret',
+                                project_name='project', region_name=REGION,
+                                auth_url=self.server.url + '/v2.0')
+        pages = neutron.list_networks(retrieve_all=False)
+        seen = []
+
+        def consume(index):
+            for page in pages:
+                seen.extend(n['id'] for n in page['networks'])
+
+        self._run_threads(consume, count=4)
+        self.assertEqual(sorted('net-%d' % i for i in range(PAGES)),
+                         sorted(seen))
+        self.assertEqual(PAGES, len(pages.request_ids))
+
+    def test_request_ids_is_a_copy(self):
+        self.valid_token = 'tok'
+        neutron = client.Client(token='tok', endpoint_url=self.server.url)
+        res = neutron.list_networks(retrieve_all=False)
+        next(res)
+        res.request_ids.append('req-fake')
+        self.assertEqual(1, len(res.request_ids))
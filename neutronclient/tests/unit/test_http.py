@@ -14,7 +14,16 @@
 #    under the License.
 
 import abc
-
+import cProfile
+import datetime
+import pstats
+import threading
+import time
+
+from keystoneauth1 import fixture as ks_fixture
+from keystoneauth1.identity import v2 as ks_v2
+from keystoneauth1 import session
+from oslo_utils import timeutils
 from oslo_utils import uuidutils
 import osprofiler.profiler
 import osprofiler.web
@@ -24,9 +33,11 @@ import testtools
 
 from neutronclient import client
 from neutronclient.common import exceptions
+from neutronclient.tests.unit import fake_server
 
 
 AUTH_TOKEN = 'test_token'
+REGION = 'RegionOne'
 END_URL = 'test_url'
 METHOD = 'GET'
 URL = 'http://test.test:1234/v2.0/test'
@@ -139,3 +150,381 @@ class TestHTTPClientWithReqId(TestHTTPClientMixin, testtools.TestCase):
         }
         self.requests.register_uri(METHOD, URL, request_headers=headers)
         self.http.request(URL, METHOD)
+
+
+class TestHTTPClientConnectionPool(testtools.TestCase):
+    """Tests for connection reuse against a local stub server."""
+
+    def setUp(self):
+        super(TestHTTPClientConnectionPool, self).setUp()
+        self.server = self.useFixture(fake_server.FakeNeutronServer(
+            {('GET', '/v2.0/networks'): (200, {'networks': []})}))
+
+    def _do_requests(self, http, count):
+        for i in range(count):
+            resp, body = http.do_request('/v2.0/networks', 'GET')
+            self.assertEqual(200, resp.status_code)
+
+    def test_connection_is_reused(self):
+        http = client.HTTPClient(token=AUTH_TOKEN,
+                                 endpoint_url=self.server.url)
+        self._do_requests(http, 10)
+        self.assertEqual(10, len(self.server.requests))
+        self.assertEqual(1, self.server.connections)
+
+    def test_idle_connection_is_dropped(self):
+        http = client.HTTPClient(token=AUTH_TOKEN,
+                                 endpoint_url=self.server.url,
+                                 pool_idle_timeout=30)
+        self._do_requests(http, 2)
+        http._last_request_time = time.time() - 60
+        self._do_requests(http, 2)
+        self.assertEqual(2, self.server.connections)
+
+    def test_pool_kwargs_are_passed_to_adapter(self):
+        http = client.construct_http_client(token=AUTH_TOKEN,
+                                            endpoint_url=self.server.url,
+                                            pool_connections=3,
+                                            pool_maxsize=7,
+                                            pool_block=True)
+        adapter = http.http_session.get_adapter(self.server.url)
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(7, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+
+class TestHTTPClientTokenRefresh(testtools.TestCase):
+
+    # NOTE: These tests use a real server since requests_mock is not safe
+    # to use from several threads at once.
+
+    def setUp(self):
+        super(TestHTTPClientTokenRefresh, self).setUp()
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('POST', '/v2.0/tokens'): self._new_token,
+            ('GET', '/v2.0/networks'): (200, {'networks': []}),
+        }))
+        self.tokens = []
+        self.expires_in = 3600
+
+    def _new_token(self, method, path, query, body):
+        # Let concurrent callers pile up behind the refreshing thread.
+        time.sleep(0.05)
+        token = ks_fixture.V2Token(
+            token_id='tok%d' % (len(self.tokens) + 1),
+            expires=timeutils.utcnow() + datetime.timedelta(
+                seconds=self.expires_in))
+        token.set_scope()
+        token.add_service('network').add_endpoint(self.server.url)
+        self.tokens.append(token.token_id)
+        return 200, token
+
+    def _new_client(self, **kwargs):
+        return client.HTTPClient(username='user', password='secret',
+                                 project_name='project',
+                                 auth_url=self.server.url + '/v2.0',
+                                 **kwargs)
+
+    def _tokens_sent(self):
+        return [headers['x-auth-token'] for (method, path), headers
+                in zip(self.server.requests, self.server.request_headers)
+                if method == 'GET']
+
+    def test_token_is_refreshed_before_expiry(self):
+        self.expires_in = 30
+        http = self._new_client()
+        http.do_request('/v2.0/networks', 'GET')
+        self.expires_in = 3600
+        http.do_request('/v2.0/networks', 'GET')
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(['tok1', 'tok2'], self.tokens)
+        self.assertEqual(['tok1', 'tok2', 'tok2'], self._tokens_sent())
+
+    def test_refresh_margin_is_configurable(self):
+        self.expires_in = 300
+        http = self._new_client(token_refresh_margin=600)
+        http.do_request('/v2.0/networks', 'GET')
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(['tok1', 'tok2'], self.tokens)
+
+    def test_no_refresh_without_margin(self):
+        self.expires_in = 30
+        http = self._new_client(token_refresh_margin=None)
+        http.do_request('/v2.0/networks', 'GET')
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(['tok1'], self.tokens)
+
+    def _run_concurrently(self, func, count=8):
+        threads = [threading.Thread(target=func) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_single_refresh_under_concurrency(self):
+        self.expires_in = 30
+        http = self._new_client()
+        http.do_request('/v2.0/networks', 'GET')
+        self.expires_in = 3600
+        self._run_concurrently(
+            lambda: http.do_request('/v2.0/networks', 'GET'))
+        self.assertEqual(['tok1', 'tok2'], self.tokens)
+        self.assertEqual(['tok2'] * 8, self._tokens_sent()[1:])
+
+    def test_single_reauthentication_on_concurrent_401(self):
+        http = self._new_client()
+        http.do_request('/v2.0/networks', 'GET')
+
+        def _networks(method, path, query, body):
+            if self.server.current_headers['x-auth-token'] == 'tok1':
+                time.sleep(0.05)
+                return 401, ''
+            return 200, {'networks': []}
+
+        self.server.responses[('GET', '/v2.0/networks')] = _networks
+        self._run_concurrently(
+            lambda: http.do_request('/v2.0/networks', 'GET'))
+        self.assertEqual(['tok1', 'tok2'], self.tokens)
+
+
+class TestEndpointCache(testtools.TestCase):
+
+    AUTH_URL = 'http://keystone.test:5000/v2.0'
+
+    def setUp(self):
+        super(TestEndpointCache, self).setUp()
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.tokens = []
+        self.requests.post(self.AUTH_URL + '/tokens', json=self._new_token)
+        for host in ('neutron1.test', 'neutron2.test', 'internal1.test'):
+            self.requests.get('http://%s:9696/v2.0/networks' % host,
+                              json={'networks': []})
+
+    def _new_token(self, request, context):
+        token = ks_fixture.V2Token(token_id=uuidutils.generate_uuid())
+        token.set_scope()
+        # Every new token points to another neutron server.
+        number = len(self.tokens) + 1
+        token.add_service('network').add_endpoint(
+            'http://neutron%d.test:9696' % number,
+            internal='http://internal%d.test:9696' % number)
+        self.tokens.append(token.token_id)
+        return token
+
+    def _new_client(self):
+        auth = ks_v2.Password(self.AUTH_URL, username='user',
+                              password='secret', tenant_name='project')
+        return client.construct_http_client(
+            session=session.Session(auth=auth))
+
+    def _hosts(self):
+        return [r.hostname for r in self.requests.request_history
+                if r.path == '/v2.0/networks']
+
+    def _profile_requests(self, http, count):
+        """Count the service catalog lookups made by ``count`` requests."""
+        profiler = cProfile.Profile()
+        profiler.runcall(
+            lambda: [http.do_request('/v2.0/networks', 'GET')
+                     for i in range(count)])
+        return sum(nc for (filename, line, func), (cc, nc, tt, ct, callers)
+                   in pstats.Stats(profiler).stats.items()
+                   if func == 'endpoint_data_for' and
+                   filename.endswith('service_catalog.py'))
+
+    def test_session_client_resolves_endpoint_once(self):
+        auth = ks_v2.Password(self.AUTH_URL, username='user',
+                              password='secret', tenant_name='project')
+        http = client.construct_http_client(
+            session=session.Session(auth=auth))
+        self.assertEqual(1, self._profile_requests(http, 1))
+        self.assertEqual(0, self._profile_requests(http, 50))
+        self.assertEqual(52, len(self.requests.request_history))
+
+    def test_session_client_endpoint_follows_auth(self):
+        auth = ks_v2.Password(self.AUTH_URL, username='user',
+                              password='secret', tenant_name='project')
+        http = client.construct_http_client(
+            session=session.Session(auth=auth))
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual('http://neutron1.test:9696', http.endpoint_url)
+        auth.invalidate()
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual('http://neutron2.test:9696', http.endpoint_url)
+        self.assertEqual('neutron2.test',
+                         self.requests.last_request.hostname)
+
+    def test_session_client_endpoint_follows_reauth(self):
+        self.requests.get('http://neutron1.test:9696/v2.0/networks',
+                          [{'status_code': 401}, {'json': {'networks': []}}])
+        http = self._new_client()
+        http.do_request('/v2.0/networks', 'GET')
+        http.do_request('/v2.0/networks', 'GET')
+        # The request is sent again to the endpoint of the new token.
+        self.assertEqual(['neutron1.test', 'neutron2.test', 'neutron2.test'],
+                         self._hosts())
+        self.assertEqual(2, len(self.tokens))
+
+    def test_session_client_request_selects_endpoint(self):
+        http = self._new_client()
+        http.do_request('/v2.0/networks', 'GET')
+        http.do_request('/v2.0/networks', 'GET',
+                        endpoint_filter={'interface': 'internal'})
+        http.do_request('/v2.0/networks', 'GET')
+        http.interface = 'internal'
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(['neutron1.test', 'internal1.test', 'neutron1.test',
+                          'internal1.test'], self._hosts())
+
+    def test_token_endpoints_are_shared(self):
+        token = uuidutils.generate_uuid()
+        self.requests.get(
+            self.AUTH_URL + '/tokens/%s/endpoints' % token,
+            json={'endpoints': [{'type': 'network',
+                                 'publicURL': 'http://neutron1.test:9696',
+                                 'region': 'RegionOne'}]})
+        for i in range(3):
+            http = client.HTTPClient(token=token, auth_url=self.AUTH_URL,
+                                     region_name='RegionOne')
+            http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(['/v2.0/tokens/%s/endpoints' % token] +
+                         ['/v2.0/networks'] * 3,
+                         [r.path for r in self.requests.request_history])
+
+    def test_lru_eviction(self):
+        cache = client.EndpointCache(max_entries=2)
+        for auth_key in ('a', 'b', 'a', 'c'):
+            cache.get(auth_key, 'network', 'public', None,
+                      lambda: 'url-%s' % auth_key)
+        self.assertEqual('url-a', cache.get('a', 'network', 'public', None,
+                                            lambda: 'new'))
+        self.assertEqual('new', cache.get('b', 'network', 'public', None,
+                                          lambda: 'new'))
+        cache.invalidate('a')
+        self.assertEqual('new', cache.get('a', 'network', 'public', None,
+                                          lambda: 'new'))
+
+
+class TestEndpointPool(testtools.TestCase):
+
+    def setUp(self):
+        super(TestEndpointPool, self).setUp()
+        self.servers = [self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/networks'): (200, {'networks': []}),
+            ('POST', '/v2.0/tokens'): self._new_token,
+        })) for i in range(3)]
+        self.urls = [server.url for server in self.servers]
+
+    def _new_token(self, method, path, query, body):
+        token = ks_fixture.V2Token(token_id='tok')
+        token.set_scope()
+        service = token.add_service('network')
+        for url in self.urls:
+            service.add_endpoint(url, region=REGION)
+        return 200, token
+
+    def _served(self):
+        return [len([r for r in server.requests if r[1] != '/v2.0/tokens'])
+                for server in self.servers]
+
+    def test_round_robin(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_urls=self.urls)
+        for i in range(6):
+            http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual([2, 2, 2], self._served())
+
+    def test_failed_endpoint_is_ejected(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_urls=self.urls)
+        for i in range(3):
+            http.do_request('/v2.0/networks', 'GET')
+        self.servers[1].stop()
+        for i in range(9):
+            resp, body = http.do_request('/v2.0/networks', 'GET')
+            self.assertEqual(200, resp.status_code)
+        self.assertEqual([5, 1, 6], self._served())
+        stats = http.endpoint_pool.stats
+        self.assertFalse(stats[self.urls[1]]['healthy'])
+        self.assertTrue(stats[self.urls[0]]['healthy'])
+
+    def test_ejected_endpoint_comes_back(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_urls=self.urls,
+                                 endpoint_eject_time=0)
+        http.endpoint_pool.report_failure(self.urls[0])
+        for i in range(3):
+            http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual([1, 1, 1], self._served())
+
+    def test_unavailable_response_moves_request(self):
+        self.servers[0].responses[('GET', '/v2.0/networks')] = (503, '')
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_urls=self.urls)
+        resp, body = http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual([1, 1, 0], self._served())
+
+    def test_post_is_not_moved(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_urls=self.urls)
+        self.servers[0].stop()
+        self.assertRaises(exceptions.ConnectionFailed, http.do_request,
+                          '/v2.0/networks', 'POST', body='{}')
+        self.assertEqual([0, 0, 0], self._served())
+        http.do_request('/v2.0/networks', 'POST', body='{}')
+        self.assertEqual([0, 0, 1], self._served())
+
+    def test_all_endpoints_down(self):
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_urls=self.urls)
+        for server in self.servers:
+            server.stop()
+        self.assertRaises(exceptions.ConnectionFailed, http.do_request,
+                          '/v2.0/networks', 'GET')
+        self.assertEqual([], [url for url, stats
+                              in http.endpoint_pool.stats.items()
+                              if stats['healthy']])
+
+    def test_least_latency(self):
+        def slow(method, path, query, body):
+            time.sleep(0.05)
+            return 200, {'networks': []}
+        self.servers[0].responses[('GET', '/v2.0/networks')] = slow
+        self.servers[1].responses[('GET', '/v2.0/networks')] = slow
+        http = client.HTTPClient(token=AUTH_TOKEN, endpoint_urls=self.urls,
+                                 endpoint_selection='least-latency')
+        for i in range(10):
+            http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual([1, 1, 8], self._served())
+
+    def test_unknown_selection(self):
+        self.assertRaises(ValueError, client.EndpointPool, self.urls,
+                          selection='random')
+
+    def test_http_client_uses_catalog(self):
+        http = client.HTTPClient(username='user', password='secret',
+                                 project_name='project', region_name=REGION,
+                                 auth_url=self.urls[0] + '/v2.0',
+                                 endpoint_selection='round-robin')
+        for i in range(6):
+            http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual([2, 2, 2], self._served())
+
+    def test_session_client_uses_catalog(self):
+        auth = ks_v2.Password(self.urls[0] + '/v2.0', username='user',
+                              password='secret', tenant_name='project')
+        http = client.construct_http_client(
+            session=session.Session(auth=auth), region_name=REGION,
+            endpoint_selection='round-robin')
+        for i in range(3):
+            http.do_request('/v2.0/networks', 'GET')
+        self.servers[2].stop()
+        for i in range(6):
+            resp, body = http.do_request('/v2.0/networks', 'GET')
+            self.assertEqual(200, resp.status_code)
+        self.assertEqual([5, 3, 1], self._served())
+
+    def test_session_client_endpoint_urls(self):
+        auth = ks_v2.Password(self.urls[0] + '/v2.0', username='user',
+                              password='secret', tenant_name='project')
+        http = client.construct_http_client(
+            session=session.Session(auth=auth), region_name=REGION,
+            endpoint_urls=self.urls[1:])
+        for i in range(4):
+            http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual([0, 2, 2], self._served())
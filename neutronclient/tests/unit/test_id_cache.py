@@ -0,0 +1,254 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import fixtures
+import six
+import testtools
+
+from neutronclient import client as http_client
+from neutronclient.common import exceptions
+from neutronclient.common import id_cache
+from neutronclient.common import utils
+from neutronclient.tests.unit import fake_server
+from neutronclient.v2_0 import client
+
+NET_ID = '11111111-2222-3333-4444-555555555555'
+NET_IDS = ['11111111-2222-3333-4444-%012d' % i for i in range(100)]
+
+
+class IdCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(IdCacheTest, self).setUp()
+        self.now = 1000.0
+        self.useFixture(fixtures.MockPatchObject(utils, 'monotonic_time',
+                                                 lambda: self.now))
+        self.cache = id_cache.IdCache(ttl=10, max_entries=2)
+
+    def _set(self, key, resource_id):
+        self.cache.set(key, resource_id, self.cache.begin())
+
+    def test_ttl(self):
+        self._set('net1', 'id1')
+        self.now += 9
+        self.assertEqual('id1', self.cache.get('net1'))
+        self.now += 2
+        self.assertIsNone(self.cache.get('net1'))
+        self.assertEqual({'hits': 1, 'misses': 1, 'invalidations': 0,
+                          'entries': 0}, self.cache.stats)
+
+    def test_lru_eviction(self):
+        self._set('net1', 'id1')
+        self._set('net2', 'id2')
+        self.cache.get('net1')
+        self._set('net3', 'id3')
+        self.assertIsNone(self.cache.get('net2'))
+        self.assertEqual('id1', self.cache.get('net1'))
+
+    def test_invalidate_path(self):
+        self.cache = id_cache.IdCache()
+        self._set('net1', 'id1')
+        self._set('id1', 'id1')
+        self._set('net2', 'id2')
+        self.cache.invalidate('/networks/id1')
+        self.assertIsNone(self.cache.get('net1'))
+        self.assertIsNone(self.cache.get('id1'))
+        self.assertEqual('id2', self.cache.get('net2'))
+        self.assertEqual(2, self.cache.stats['invalidations'])
+
+    def test_resolution_older_than_invalidation_is_not_cached(self):
+        token = self.cache.begin()
+        self.cache.invalidate('/networks/id1')
+        self.cache.set('net1', 'id1', token)
+        self.assertIsNone(self.cache.get('net1'))
+
+
+class ClientIdCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ClientIdCacheTest, self).setUp()
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/networks'): self._list_networks,
+            ('DELETE', '/v2.0/networks/%s' % NET_ID): (204, ''),
+        }))
+        self.neutron = client.Client(token='token',
+                                     endpoint_url=self.server.url,
+                                     id_cache=True)
+
+    def _list_networks(self, method, path, query, body):
+        if (query.get('id') == [NET_ID] or
+                query.get('name') == ['net1']):
+            return 200, {'networks': [{'id': NET_ID}]}
+        return 200, {'networks': []}
+
+    def test_name_is_resolved_once(self):
+        for i in range(3):
+            self.assertEqual(NET_ID, self.neutron.find_resource(
+                'network', 'net1', fields='id')['id'])
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual(2, self.neutron.id_cache.stats['hits'])
+
+    def test_id_is_resolved_once(self):
+        for i in range(3):
+            self.assertEqual(NET_ID, self.neutron.find_resource_by_id(
+                'network', NET_ID, fields=['id'])['id'])
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_other_fields_are_not_cached(self):
+        self.neutron.find_resource('network', 'net1', fields=['id', 'name'])
+        self.neutron.find_resource('network', 'net1', fields=['id', 'name'])
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_missing_resource_is_not_cached(self):
+        for i in range(2):
+            self.assertRaises(exceptions.NotFound, self.neutron.find_resource,
+                              'network', 'missing', fields='id')
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_delete_invalidates(self):
+        self.neutron.find_resource('network', 'net1', fields='id')
+        self.neutron.delete_network(NET_ID)
+        self.neutron.find_resource('network', 'net1', fields='id')
+        self.assertEqual(3, len(self.server.requests))
+
+    def test_trust_uuids(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                trust_uuids=True)
+        self.assertEqual({'id': NET_ID}, neutron.find_resource(
+            'network', NET_ID, fields='id'))
+        self.assertEqual({'id': NET_ID}, neutron.find_resource_by_id(
+            'network', NET_ID, fields='id'))
+        self.assertEqual([], self.server.requests)
+        neutron.find_resource('network', 'net1', fields='id')
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_disabled_by_default(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url)
+        self.assertIsNone(neutron.id_cache)
+        neutron.find_resource_by_id('network', NET_ID, fields='id')
+        neutron.find_resource_by_id('network', NET_ID, fields='id')
+        self.assertEqual(2, len(self.server.requests))
+
+
+class FindResourcesTest(testtools.TestCase):
+
+    def setUp(self):
+        super(FindResourcesTest, self).setUp()
+        self.networks = [{'id': net_id, 'name': 'net%d' % i}
+                         for i, net_id in enumerate(NET_IDS)]
+        self.networks.append({'id': NET_IDS[0].replace('1', '9'),
+                              'name': 'net1'})
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/networks'): self._list_networks}))
+        self.neutron = client.Client(token='token',
+                                     endpoint_url=self.server.url)
+
+    def _list_networks(self, method, path, query, body):
+        names = [six.ensure_text(name) for name in query.get('name', [])]
+        return 200, {'networks': [
+            net for net in self.networks
+            if net['id'] in query.get('id', [net['id']]) and
+            net['name'] in (names or [net['name']])]}
+
+    def test_names_and_ids(self):
+        found = self.neutron.find_resources(
+            'network', ['net3', NET_IDS[2], 'net4'], fields='id')
+        self.assertEqual([NET_IDS[3], NET_IDS[2], NET_IDS[4]],
+                         [net['id'] for net in found])
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_missing_and_ambiguous(self):
+        missing_id = NET_IDS[0].replace('1', '8')
+        found = self.neutron.find_resources(
+            'network', ['net2', 'net1', 'missing', missing_id],
+            return_errors=True)
+        self.assertEqual(NET_IDS[2], found[0]['id'])
+        self.assertIsInstance(found[1], exceptions.NeutronClientNoUniqueMatch)
+        self.assertIsInstance(found[2], exceptions.NotFound)
+        self.assertIsInstance(found[3], exceptions.NotFound)
+        e = self.assertRaises(exceptions.NotFound,
+                              self.neutron.find_resources,
+                              'network', ['net1', 'missing', missing_id])
+        self.assertEqual(3, len(str(e).splitlines()))
+        self.assertIn("'missing'", str(e))
+        self.assertRaises(exceptions.NeutronClientNoUniqueMatch,
+                          self.neutron.find_resources,
+                          'network', ['net1', 'net2'])
+
+    def test_long_filters_are_split(self):
+        self.useFixture(fixtures.MockPatchObject(
+            http_client, 'MAX_URI_LEN', 1500))
+        found = self.neutron.find_resources('network', NET_IDS, fields='id')
+        self.assertEqual(NET_IDS, [net['id'] for net in found])
+        self.assertLess(1, len(self.server.requests))
+        self.assertGreater(len(NET_IDS), len(self.server.requests))
+
+    def test_cached_values_are_not_listed(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                id_cache=True)
+        neutron.find_resources('network', ['net3', 'net4'], fields='id')
+        self.assertEqual([NET_IDS[3], NET_IDS[4], NET_IDS[5]],
+                         [net['id'] for net in neutron.find_resources(
+                             'network', ['net3', 'net4', 'net5'],
+                             fields='id')])
+        self.assertIn('name=net5', self.server.requests[-1][1])
+        self.assertNotIn('name=net3', self.server.requests[-1][1])
+        self.assertEqual(NET_IDS[3], neutron.find_resource(
+            'network', 'net3', fields='id')['id'])
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_trust_uuids(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                trust_uuids=True)
+        found = neutron.find_resources('network', NET_IDS[:3], fields='id')
+        self.assertEqual(NET_IDS[:3], [net['id'] for net in found])
+        self.assertEqual([], self.server.requests)
+
+    def test_uuids_in_upper_case(self):
+        net_id = NET_IDS[0].replace('1', 'a')
+        self.networks.append({'id': net_id, 'name': 'neta'})
+        found = self.neutron.find_resources(
+            'network', [net_id.upper(), net_id, 'net3'], fields='id')
+        self.assertEqual([net_id, net_id, NET_IDS[3]],
+                         [net['id'] for net in found])
+        self.assertIn('id=%s' % net_id, self.server.requests[0][1])
+        self.assertNotIn(net_id.upper(), self.server.requests[0][1])
+        self.assertEqual(2, len(self.server.requests))
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                trust_uuids=True)
+        self.assertEqual([{'id': net_id}],
+                         neutron.find_resources('network', [net_id.upper()],
+                                                fields='id'))
+
+    def test_values_which_are_not_strings(self):
+        self.networks.append({'id': NET_IDS[0].replace('1', '7'),
+                              'name': '42'})
+        found = self.neutron.find_resources('network', [42, 'net2'],
+                                            fields='id')
+        self.assertEqual([NET_IDS[0].replace('1', '7'), NET_IDS[2]],
+                         [net['id'] for net in found])
+        e = self.assertRaises(exceptions.NotFound,
+                              self.neutron.find_resources, 'network', [7])
+        self.assertIn("'7'", str(e))
+
+    def test_non_ascii_names(self):
+        self.networks.append({'id': NET_IDS[0].replace('1', '7'),
+                              'name': u'r\xe9seau'})
+        found = self.neutron.find_resources(
+            'network', [u'r\xe9seau', 'net2'], fields='id')
+        self.assertEqual([NET_IDS[0].replace('1', '7'), NET_IDS[2]],
+                         [net['id'] for net in found])
+        e = self.assertRaises(exceptions.NotFound,
+                              self.neutron.find_resources,
+                              'network', [u'\xe9tranger'])
+        self.assertIn(u"'\xe9tranger'", six.text_type(e))
@@ -0,0 +1,193 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import fixtures
+import testtools
+
+from neutronclient.common import resource_cache
+from neutronclient.common import utils
+from neutronclient.tests.unit import fake_server
+from neutronclient.v2_0 import client
+
+
+def _port(port_id, revision=1):
+    return {'port': {'id': port_id, 'revision_number': revision}}
+
+
+class ResourceCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ResourceCacheTest, self).setUp()
+        self.now = 1000.0
+        self.useFixture(fixtures.MockPatchObject(utils, 'monotonic_time',
+                                                 lambda: self.now))
+        self.cache = resource_cache.ResourceCache(ttl=10, max_entries=2)
+
+    def _set(self, path, value, params=''):
+        self.cache.set(path + params, path, value, self.cache.begin())
+
+    def test_hit_returns_copy(self):
+        self._set('/ports/p1', _port('p1'))
+        value = self.cache.get('/ports/p1')
+        value['port']['name'] = 'changed'
+        self.assertEqual(_port('p1'), self.cache.get('/ports/p1'))
+        self.assertEqual({'hits': 2, 'misses': 0, 'evictions': 0,
+                          'expirations': 0, 'invalidations': 0,
+                          'entries': 1}, self.cache.stats)
+
+    def test_ttl(self):
+        self._set('/ports/p1', _port('p1'))
+        self.now += 9
+        self.assertIsNotNone(self.cache.get('/ports/p1'))
+        self.now += 2
+        self.assertIsNone(self.cache.get('/ports/p1'))
+        self.assertEqual(1, self.cache.stats['expirations'])
+        self.assertEqual(1, self.cache.stats['misses'])
+
+    def test_lru_eviction(self):
+        self._set('/ports/p1', _port('p1'))
+        self._set('/ports/p2', _port('p2'))
+        self.cache.get('/ports/p1')
+        self._set('/ports/p3', _port('p3'))
+        self.assertIsNone(self.cache.get('/ports/p2'))
+        self.assertIsNotNone(self.cache.get('/ports/p1'))
+        self.assertEqual(1, self.cache.stats['evictions'])
+
+    def test_policies(self):
+        cache = resource_cache.ResourceCache(
+            ttl=10, policies={'network': 0, 'port': 60})
+        cache.set('/networks/n1', '/networks/n1',
+                  {'network': {'id': 'n1'}}, cache.begin())
+        cache.set('/ports/p1', '/ports/p1', _port('p1'), cache.begin())
+        self.now += 30
+        self.assertIsNone(cache.get('/networks/n1'))
+        self.assertIsNotNone(cache.get('/ports/p1'))
+
+    def test_lists_are_not_cached(self):
+        self._set('/ports', {'ports': [_port('p1')['port']]})
+        self.assertIsNone(self.cache.get('/ports'))
+
+    def test_invalidate_related_paths(self):
+        self._set('/routers/r1', {'router': {'id': 'r1'}})
+        self._set('/routers/r2', {'router': {'id': 'r2'}})
+        self.cache.invalidate('/routers/r1/add_router_interface')
+        self.assertIsNone(self.cache.get('/routers/r1'))
+        self.assertIsNotNone(self.cache.get('/routers/r2'))
+        self.cache.invalidate('/routers', children=False)
+        self.assertIsNotNone(self.cache.get('/routers/r2'))
+        self.cache.invalidate('/routers')
+        self.assertIsNone(self.cache.get('/routers/r2'))
+
+    def test_read_older_than_write_is_not_cached(self):
+        token = self.cache.begin()
+        self.cache.invalidate('/ports/p1')
+        self.cache.set('/ports/p1', '/ports/p1', _port('p1'), token)
+        self.assertIsNone(self.cache.get('/ports/p1'))
+
+    def test_newer_revision_makes_entry_stale(self):
+        self._set('/ports/p1', _port('p1', revision=3))
+        self.cache.observe({'ports': [_port('p1', revision=3)['port']]})
+        self.assertIsNotNone(self.cache.get('/ports/p1'))
+        self.cache.observe({'ports': [_port('p1', revision=4)['port']]})
+        self.assertIsNone(self.cache.get('/ports/p1'))
+        self.assertEqual(1, self.cache.stats['invalidations'])
+
+    def test_newer_revision_replaces_other_views(self):
+        self._set('/ports/p1', _port('p1', revision=3), '?fields=id')
+        self._set('/ports/p1', _port('p1', revision=4))
+        self.assertIsNone(self.cache.get('/ports/p1?fields=id'))
+
+
+class ClientResourceCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ClientResourceCacheTest, self).setUp()
+        self.revision = 1
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/ports/p1'): self._show_port,
+            ('PUT', '/v2.0/ports/p1'): self._update_port,
+            ('DELETE', '/v2.0/ports/p1'): (204, ''),
+            ('GET', '/v2.0/ports'): self._list_ports,
+            ('GET', '/v2.0/routers/r1'): (200, {'router': {'id': 'r1'}}),
+            ('PUT', '/v2.0/routers/r1/add_router_interface'): (200, {}),
+        }))
+        self.neutron = client.Client(token='token',
+                                     endpoint_url=self.server.url,
+                                     resource_cache=True)
+
+    def _show_port(self, method, path, query, body):
+        return 200, _port('p1', self.revision)
+
+    def _update_port(self, method, path, query, body):
+        self.revision += 1
+        return 200, _port('p1', self.revision)
+
+    def _list_ports(self, method, path, query, body):
+        return 200, {'ports': [_port('p1', self.revision)['port']]}
+
+    def _gets(self, path):
+        return len([r for r in self.server.requests
+                    if r == ('GET', '/v2.0' + path)])
+
+    def test_show_is_cached(self):
+        self.neutron.show_port('p1')
+        port = self.neutron.show_port('p1')
+        self.assertEqual(_port('p1'), port)
+        self.assertEqual(['req-1'], port.request_ids)
+        self.assertEqual(1, self._gets('/ports/p1'))
+        stats = self.neutron.resource_cache.stats
+        self.assertEqual((1, 1), (stats['hits'], stats['misses']))
+
+    def test_fields_are_cached_apart(self):
+        self.neutron.show_port('p1')
+        self.neutron.show_port('p1', fields='id')
+        self.neutron.show_port('p1', fields='id')
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_update_invalidates(self):
+        self.neutron.show_port('p1')
+        self.neutron.update_port('p1', {'port': {'name': 'new'}})
+        port = self.neutron.show_port('p1')
+        self.assertEqual(2, port['port']['revision_number'])
+        self.assertEqual(2, self._gets('/ports/p1'))
+
+    def test_delete_invalidates(self):
+        self.neutron.show_port('p1')
+        self.neutron.delete_port('p1')
+        self.neutron.show_port('p1')
+        self.assertEqual(2, self._gets('/ports/p1'))
+
+    def test_router_action_invalidates_router(self):
+        self.neutron.show_router('r1')
+        self.neutron.add_interface_router('r1', {'subnet_id': 's1'})
+        self.neutron.show_router('r1')
+        self.assertEqual(2, self._gets('/routers/r1'))
+
+    def test_list_with_newer_revision_invalidates(self):
+        self.neutron.show_port('p1')
+        self.neutron.list_ports()
+        self.neutron.show_port('p1')
+        self.assertEqual(1, self._gets('/ports/p1'))
+        # Changed by another client.
+        self.revision = 5
+        self.neutron.list_ports()
+        port = self.neutron.show_port('p1')
+        self.assertEqual(5, port['port']['revision_number'])
+        self.assertEqual(2, self._gets('/ports/p1'))
+
+    def test_disabled_by_default(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url)
+        self.assertIsNone(neutron.resource_cache)
+        neutron.show_port('p1')
+        neutron.show_port('p1')
+        self.assertEqual(2, self._gets('/ports/p1'))
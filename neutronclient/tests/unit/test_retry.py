@@ -0,0 +1,185 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import email.utils
+import time
+
+import mock
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import retry
+from neutronclient.tests.unit import fake_server
+from neutronclient.v2_0 import client
+
+NOT_FOUND = (404, {'NeutronError': {'type': 'NetworkNotFound',
+                                    'message': 'not found', 'detail': ''}})
+
+
+class RetryPolicyTest(testtools.TestCase):
+
+    def test_exponential_backoff(self):
+        policy = retry.RetryPolicy(backoff=1, backoff_factor=2,
+                                   max_backoff=5, jitter=False)
+        self.assertEqual([1, 2, 4, 5, 5],
+                         [policy.get_delay(i) for i in range(5)])
+
+    @mock.patch('random.uniform')
+    def test_jitter(self, uniform):
+        uniform.return_value = 0.3
+        policy = retry.RetryPolicy(backoff=1, backoff_factor=2)
+        self.assertEqual(0.3, policy.get_delay(2))
+        uniform.assert_called_once_with(0, 4)
+
+    def test_retry_after_takes_precedence(self):
+        policy = retry.RetryPolicy(backoff=1, jitter=False)
+        exc = exceptions.TooManyRequests(retry_after='7')
+        self.assertEqual(7, policy.get_delay(0, exc))
+        exc = exceptions.TooManyRequests(retry_after='0')
+        self.assertEqual(1, policy.get_delay(0, exc))
+        policy.respect_retry_after = False
+        exc = exceptions.TooManyRequests(retry_after='7')
+        self.assertEqual(1, policy.get_delay(0, exc))
+
+    def test_retry_after_is_capped(self):
+        policy = retry.RetryPolicy(backoff=1, max_backoff=10, jitter=False)
+        exc = exceptions.TooManyRequests(retry_after='86400')
+        self.assertEqual(10, policy.get_delay(0, exc))
+        exc = exceptions.TooManyRequests(retry_after='inf')
+        self.assertEqual(1, policy.get_delay(0, exc))
+        policy.max_backoff = None
+        exc = exceptions.TooManyRequests(retry_after='86400')
+        self.assertEqual(86400, policy.get_delay(0, exc))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(3, retry.parse_retry_after('3'))
+        self.assertIsNone(retry.parse_retry_after(None))
+        self.assertIsNone(retry.parse_retry_after('soon'))
+        self.assertIsNone(retry.parse_retry_after('inf'))
+        self.assertIsNone(retry.parse_retry_after('-Infinity'))
+        self.assertIsNone(retry.parse_retry_after('nan'))
+        date = email.utils.formatdate(time.time() + 60, usegmt=True)
+        self.assertTrue(55 < retry.parse_retry_after(date) <= 60)
+        date = email.utils.formatdate(time.time() - 60, usegmt=True)
+        self.assertEqual(0, retry.parse_retry_after(date))
+
+    def test_retriable_errors(self):
+        policy = retry.RetryPolicy()
+        self.assertTrue(policy.is_retriable(
+            'GET', exceptions.ServiceUnavailable()))
+        self.assertTrue(policy.is_retriable(
+            'PUT', exceptions.TooManyRequests()))
+        self.assertTrue(policy.is_retriable(
+            'DELETE', exceptions.ConnectionFailed(reason='down')))
+        self.assertFalse(policy.is_retriable(
+            'GET', exceptions.InternalServerError()))
+        self.assertFalse(policy.is_retriable(
+            'POST', exceptions.ServiceUnavailable()))
+        policy.retry_post = True
+        self.assertTrue(policy.is_retriable(
+            'POST', exceptions.ServiceUnavailable()))
+
+    def test_limits(self):
+        policy = retry.RetryPolicy(max_retries=2, backoff=1, jitter=False,
+                                   time_budget=5)
+        exc = exceptions.ServiceUnavailable()
+        self.assertEqual(2, policy.next_delay('GET', 1, exc))
+        self.assertIsNone(policy.next_delay('GET', 2, exc))
+        self.assertIsNone(policy.next_delay('GET', 1, exc, elapsed=3.5))
+
+
+class ClientRetryTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ClientRetryTest, self).setUp()
+        self.server = self.useFixture(fake_server.FakeNeutronServer())
+        patcher = mock.patch('neutronclient.v2_0.client.time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _client(self, **kwargs):
+        return client.Client(token='token', endpoint_url=self.server.url,
+                             **kwargs)
+
+    def _fail_first(self, path, failures, method='GET'):
+        def respond(*args):
+            if len(self.server.requests) <= len(failures):
+                return failures[len(self.server.requests) - 1]
+            return 200, {'network': {'id': 'net1'}}
+        self.server.responses[(method, path)] = respond
+
+    def test_503_is_retried_with_backoff(self):
+        self._fail_first('/v2.0/networks/net1', [(503, ''), (503, '')])
+        policy = retry.RetryPolicy(backoff=1, jitter=False)
+        result = self._client(retry_policy=policy).show_network('net1')
+        self.assertEqual('net1', result['network']['id'])
+        self.assertEqual([mock.call(1), mock.call(2)],
+                         self.sleep.call_args_list)
+        self.assertEqual(['req-3'], result.request_ids)
+
+    def test_429_honours_retry_after(self):
+        self._fail_first('/v2.0/networks/net1',
+                         [(429, '', {'Retry-After': '12'})])
+        self._client(retry_policy=retry.RetryPolicy()).show_network('net1')
+        self.sleep.assert_called_once_with(12.0)
+
+    def test_gives_up_after_max_retries(self):
+        self.server.responses[('GET', '/v2.0/networks/net1')] = (503, '')
+        policy = retry.RetryPolicy(max_retries=2)
+        exc = self.assertRaises(exceptions.ServiceUnavailable,
+                                self._client(retry_policy=policy).show_network,
+                                'net1')
+        self.assertEqual(3, len(self.server.requests))
+        self.assertEqual(['req-3'], exc.request_ids)
+
+    def test_other_errors_are_not_retried(self):
+        self.server.responses[('GET', '/v2.0/networks/net1')] = NOT_FOUND
+        self.assertRaises(exceptions.NetworkNotFoundClient,
+                          self._client(retry_policy=retry.RetryPolicy())
+                          .show_network, 'net1')
+        self.assertEqual(1, len(self.server.requests))
+        self.assertFalse(self.sleep.called)
+
+    def test_post_is_not_retried_by_default(self):
+        self._fail_first('/v2.0/networks', [(503, '')], method='POST')
+        self.assertRaises(exceptions.ServiceUnavailable,
+                          self._client(retry_policy=retry.RetryPolicy())
+                          .create_network, {'network': {}})
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_post_retry_opt_in(self):
+        self._fail_first('/v2.0/networks', [(503, '')], method='POST')
+        policy = retry.RetryPolicy(retry_post=True)
+        self._client(retry_policy=policy).create_network({'network': {}})
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_legacy_retries_only_connection_failures(self):
+        self._fail_first('/v2.0/networks/net1', [(503, '')])
+        neutron = self._client(retries=2)
+        self.assertRaises(exceptions.ServiceUnavailable,
+                          neutron.show_network, 'net1')
+        with mock.patch.object(neutron, 'do_request') as do_request:
+            do_request.side_effect = exceptions.ConnectionFailed(reason='x')
+            self.assertRaises(exceptions.ConnectionFailed,
+                              neutron.show_network, 'net1')
+        self.assertEqual(3, do_request.call_count)
+        self.assertEqual([mock.call(1), mock.call(1)],
+                         self.sleep.call_args_list)
+
+    def test_legacy_no_raise_errors_message(self):
+        neutron = self._client(retries=1, raise_errors=False)
+        with mock.patch.object(neutron, 'do_request') as do_request:
+            do_request.side_effect = exceptions.ConnectionFailed(reason='x')
+            exc = self.assertRaises(exceptions.ConnectionFailed,
+                                    neutron.show_network, 'net1')
+        self.assertIn('after 2 attempts', str(exc))
@@ -0,0 +1,124 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import uuid
+
+import fixtures
+import six
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import serializer
+from neutronclient.v2_0 import client
+
+
+PORT = {'port': {'id': 'a8e4e5a2-a6ed-4c6a-8b2c-1a2b3c4d5e6f',
+                 'name': u'p\u00f6rt/1',
+                 'admin_state_up': True,
+                 'fixed_ips': [{'subnet_id': 's1',
+                                'ip_address': '10.0.0.3'}],
+                 'binding:profile': {},
+                 'port_security_enabled': None,
+                 'revision_number': 4}}
+
+
+class _Unavailable(serializer.JSONCodec):
+
+    def __init__(self):
+        raise ImportError('not installed')
+
+
+class JSONCodecTest(testtools.TestCase):
+
+    def setUp(self):
+        super(JSONCodecTest, self).setUp()
+        self.useFixture(fixtures.EnvironmentVariable(
+            serializer.JSON_CODEC_ENV))
+
+    def _get_codec_or_skip(self, name):
+        try:
+            return serializer.JSON_CODECS[name]()
+        except ImportError:
+            self.skipTest('%s is not installed' % name)
+
+    def _test_round_trip(self, name):
+        codec = self._get_codec_or_skip(name)
+        ser = serializer.Serializer(codec=name)
+        self.assertIsInstance(ser.codec, type(codec))
+        data = ser.serialize(PORT)
+        self.assertIsInstance(data, six.string_types)
+        self.assertNotIn(u'\u00f6', data)
+        self.assertEqual(PORT, ser.deserialize(data)['body'])
+
+    def test_round_trip_json(self):
+        self._test_round_trip('json')
+
+    def test_round_trip_simplejson(self):
+        self._test_round_trip('simplejson')
+
+    def test_round_trip_ujson(self):
+        self._test_round_trip('ujson')
+
+    def test_round_trip_orjson(self):
+        self._test_round_trip('orjson')
+
+    def test_unknown_objects_are_stringified(self):
+        value = uuid.uuid4()
+        for name in serializer.JSON_CODECS:
+            # Unavailable backends fall back to the default one.
+            ser = serializer.Serializer(codec=name)
+            self.assertEqual({'id': str(value)},
+                             ser.deserialize(
+                                 ser.serialize({'id': value}))['body'])
+
+    def test_malformed_body(self):
+        for name in serializer.JSON_CODECS:
+            ser = serializer.Serializer(codec=name)
+            self.assertRaises(exceptions.MalformedResponseBody,
+                              ser.deserialize, '{"port": ')
+
+    def test_fallback_chain(self):
+        self.useFixture(fixtures.MonkeyPatch(
+            'neutronclient.common.serializer.JSON_CODECS',
+            dict(serializer.JSON_CODECS, missing=_Unavailable)))
+        codec = serializer.get_json_codec('missing, unknown,simplejson')
+        self.assertIs(serializer.get_json_codec('simplejson'), codec)
+        self.assertIsInstance(serializer.get_json_codec(['missing']),
+                              serializer.JSONCodec)
+
+    def test_codec_instances_are_reused(self):
+        self.assertIs(serializer.get_json_codec('json'),
+                      serializer.get_json_codec('json'))
+
+    def test_environment_variable(self):
+        self.useFixture(fixtures.EnvironmentVariable(
+            serializer.JSON_CODEC_ENV, 'simplejson'))
+        self.assertIsInstance(serializer.get_json_codec(),
+                              serializer.SimpleJSONCodec)
+
+    def test_register_json_codec(self):
+        class Codec(serializer.JSONCodec):
+            pass
+
+        self.addCleanup(serializer.JSON_CODECS.pop, 'custom')
+        serializer.register_json_codec('custom', Codec)
+        self.assertIsInstance(serializer.get_json_codec('custom'), Codec)
+
+    def test_client_json_codec(self):
+        neutron = client.Client(token='token', endpoint_url='http://h:9696',
+                                json_codec='simplejson')
+        self.assertIsInstance(neutron.serializer.codec,
+                              serializer.SimpleJSONCodec)
+        self.assertIs(neutron.serializer, neutron.serializer)
+        self.assertEqual(PORT, neutron.deserialize(neutron.serialize(PORT),
+                                                   200))
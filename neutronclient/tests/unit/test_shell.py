@@ -17,16 +17,20 @@ import argparse
 import logging
 import os
 import re
+import subprocess
 import sys
 
 import fixtures
 from keystoneauth1 import session
 import mock
 import six
+from six.moves import configparser
 import testtools
 from testtools import matchers
 
+from neutronclient import command_index
 from neutronclient.common import clientmanager
+from neutronclient.common import token_cache
 from neutronclient.neutron.v2_0 import network
 from neutronclient import shell as openstack_shell
 
@@ -45,6 +49,8 @@ DEFAULT_SERVICE_TYPE = 'network'
 DEFAULT_SERVICE_NAME = 'neutron'
 DEFAULT_RETRIES = 3
 DEFAULT_TIMEOUT = 3.0
+# Maximum number of neutronclient.neutron modules imported to run a command.
+COMMAND_IMPORT_BUDGET = 10
 
 
 class ShellTest(testtools.TestCase):
@@ -232,6 +238,8 @@ class ShellTest(testtools.TestCase):
                         'network_service_name': DEFAULT_SERVICE_NAME,
                         'neutron_service_type': DEFAULT_SERVICE_TYPE}
 
+        options.setdefault('token_cache', False)
+        options.setdefault('id_cache', False)
         options.update(base_options)
         if options.get('os_token'):
             options.update({'auth_type': 'token'})
@@ -258,6 +266,7 @@ class ShellTest(testtools.TestCase):
             else:
                 auth = None
                 auth_session = None
+            use_cache = options['token_cache'] and auth is not None
 
             shell.authenticate_user()
 
@@ -282,7 +291,13 @@ class ShellTest(testtools.TestCase):
             endpoint_type=DEFAULT_ENDPOINT_TYPE,
             auth=auth,
             insecure=expect_insecure,
-            log_credentials=True)
+            log_credentials=True,
+            token_cache=mock.ANY if use_cache else None,
+            id_cache=options['id_cache'])
+        if use_cache:
+            cache = cmgr_mock.call_args[1]['token_cache']
+            self.assertIsInstance(cache, token_cache.TokenCache)
+            self.assertEqual(options['token_cache_dir'], cache.cache_dir)
 
     def test_authenticate_secure_with_cacert_with_cert(self):
         self._test_authenticate_user(
@@ -295,6 +310,21 @@ class ShellTest(testtools.TestCase):
             insecure=False, cacert='cacert', cert='cert',
             expect_verify='cacert', expect_insecure=False)
 
+    def test_authenticate_with_token_cache(self):
+        self._test_authenticate_user(
+            insecure=False, token_cache=True, token_cache_dir='/cache',
+            expect_verify=True, expect_insecure=False)
+
+    def test_authenticate_with_token_cache_with_token(self):
+        self._test_authenticate_user(
+            os_token='token', token_cache=True, token_cache_dir='/cache',
+            insecure=False, expect_verify=True, expect_insecure=False)
+
+    def test_authenticate_with_id_cache(self):
+        self._test_authenticate_user(
+            insecure=False, id_cache=True,
+            expect_verify=True, expect_insecure=False)
+
     def test_authenticate_insecure_with_cacert_with_cert(self):
         self._test_authenticate_user(
             insecure=True, cacert='cacert', cert='cert',
@@ -364,3 +394,120 @@ class ShellTest(testtools.TestCase):
              'net-show': network.ShowNetwork,
              'net-update': network.UpdateNetwork},
             openstack_shell.COMMANDS['2.0'])
+
+    def test_commands_dict_is_lazy(self):
+        neutron_shell = openstack_shell.NeutronShell('2.0')
+        commands = openstack_shell.COMMANDS['2.0']
+        self.assertEqual(len(neutron_shell.command_manager.commands),
+                         len(commands))
+        self.assertIn('net-list', list(commands))
+        with mock.patch.object(neutron_shell.command_manager,
+                               'find_command') as find_command:
+            self.assertIn('net-list', commands)
+            self.assertNotIn('missing', commands)
+            self.assertFalse(find_command.called)
+        self.assertRaises(KeyError, commands.__getitem__, 'missing')
+        commands['my-net-list'] = network.ListNetwork
+        self.assertEqual(network.ListNetwork,
+                         neutron_shell.command_manager.find_command(
+                             ['my-net-list'])[0])
+
+    def test_commands_of_ignored_modules_are_skipped(self):
+        manager = openstack_shell.CommandManager('neutron.cli.v2')
+        manager.commands.clear()
+        # NOTE: Only cliff>=4 takes ignored_modules in the constructor.
+        manager.ignored_modules = ('neutronclient.neutron.v2_0.network',
+                                   'neutronclient.neutron.v2_0.qos')
+        manager.load_commands('neutron.cli.v2')
+        self.assertNotIn('net-list', manager.commands)
+        self.assertNotIn('qos-policy-list', manager.commands)
+        self.assertIn('port-list', manager.commands)
+
+    def test_commands_loaded_from_index(self):
+        neutron_shell = openstack_shell.NeutronShell('2.0')
+        commands = dict(neutron_shell.command_manager.commands)
+        # Added by cliff.
+        commands.pop('help')
+        self.assertEqual(len(command_index.COMMANDS['neutron.cli.v2']),
+                         len(commands))
+        for name, entry in commands.items():
+            self.assertIsInstance(entry, openstack_shell._IndexedCommand)
+        self.assertEqual(network.ListNetwork,
+                         neutron_shell.command_manager.find_command(
+                             ['net-list'])[0])
+
+    def test_commands_scanned_without_index(self):
+        self.useFixture(fixtures.MockPatchObject(command_index, 'COMMANDS',
+                                                 {}))
+        neutron_shell = openstack_shell.NeutronShell('2.0')
+        self.assertNotIsInstance(
+            neutron_shell.command_manager.commands['net-list'],
+            openstack_shell._IndexedCommand)
+        self.assertEqual(network.ListNetwork,
+                         neutron_shell.command_manager.find_command(
+                             ['net-list'])[0])
+
+    def test_index_names_are_converted(self):
+        self.useFixture(fixtures.MockPatchObject(
+            command_index, 'COMMANDS', {'neutron.cli.v2': {
+                'net_list': 'neutronclient.neutron.v2_0.network:ListNetwork'
+            }}))
+        manager = openstack_shell.CommandManager('neutron.cli.v2')
+        self.assertEqual(['net list'], list(manager.commands))
+        self.assertEqual(network.ListNetwork,
+                         manager.find_command(['net', 'list'])[0])
+
+    def test_broken_command_is_skipped(self):
+        self.useFixture(fixtures.MockPatchObject(
+            command_index, 'COMMANDS', {'neutron.cli.v2': {
+                'net-list': 'neutronclient.neutron.v2_0.network:ListNetwork',
+                'broken-list': 'neutronclient.tests.unit.missing:ListBroken',
+            }}))
+        help_text, stderr = self.shell('help')
+        self.assertIn('net-list', help_text)
+        self.assertNotIn('broken-list', help_text)
+        bash_completion, stderr = self.shell('bash-completion')
+        self.assertIn('net-list', bash_completion.split())
+        self.assertNotIn('broken-list', bash_completion.split())
+        stdout, stderr = self.shell('broken-list')
+        self.assertIn('Cannot load the broken-list command', stderr)
+
+    def test_command_index_matches_setup_cfg(self):
+        # The index must be regenerated by tools/generate_command_index.py
+        # after the commands of setup.cfg change.
+        setup_cfg = os.path.join(
+            os.path.dirname(os.path.dirname(command_index.__file__)),
+            'setup.cfg')
+        if not os.path.exists(setup_cfg):
+            self.skipTest('setup.cfg is not available')
+        parser = configparser.RawConfigParser()
+        parser.read(setup_cfg)
+        for namespace in openstack_shell.NAMESPACE_MAP.values():
+            lines = parser.get('entry_points', namespace).splitlines()
+            commands = dict(
+                [part.strip() for part in line.split('=', 1)]
+                for line in lines if line.strip())
+            self.assertEqual(commands, command_index.COMMANDS[namespace])
+
+    def _count_command_imports(self, scan):
+        # Run in a new interpreter, where no command module is imported yet.
+        code = ("import sys\n"
+                "from neutronclient import command_index\n"
+                "from neutronclient import shell\n"
+                "if %r:\n"
+                "    command_index.COMMANDS.clear()\n"
+                "shell.NeutronShell('2.0').command_manager.find_command("
+                "['net-list'])\n"
+                "print(len([name for name, module in sys.modules.items()\n"
+                "           if module is not None and\n"
+                "           name.startswith('neutronclient.neutron.')]))\n"
+                % scan)
+        return int(subprocess.check_output([sys.executable, '-c', code]))
+
+    def test_command_import_budget(self):
+        self.assertLessEqual(self._count_command_imports(scan=False),
+                             COMMAND_IMPORT_BUDGET)
+
+    def test_command_import_budget_without_index(self):
+        self.assertLessEqual(self._count_command_imports(scan=True),
+                             COMMAND_IMPORT_BUDGET)
@@ -0,0 +1,214 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import threading
+import time
+
+import testtools
+
+from neutronclient.common import exceptions
+from neutronclient.common import single_flight
+from neutronclient.tests.unit import fake_server
+from neutronclient.v2_0 import client
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while not predicate():
+        if time.time() > deadline:
+            raise AssertionError("Timed out")
+        time.sleep(0.001)
+
+
+class SingleFlightTest(testtools.TestCase):
+
+    def setUp(self):
+        super(SingleFlightTest, self).setUp()
+        self.flight = single_flight.SingleFlight()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def _call(self):
+        self.calls += 1
+        self.release.wait()
+        return {'value': [1, 2]}
+
+    def _start(self, key, count, results, func=None):
+        def run():
+            try:
+                results.append(self.flight.do(key, func or self._call))
+            except BaseException as e:
+                results.append(e)
+        threads = [threading.Thread(target=run) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _join(self, threads):
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_concurrent_calls_are_coalesced(self):
+        results = []
+        threads = self._start('key', 5, results)
+        _wait_for(lambda: self.flight.stats['requests'] == 5)
+        self._join(threads)
+        self.assertEqual(1, self.calls)
+        self.assertEqual([{'value': [1, 2]}] * 5, results)
+        self.assertEqual({'requests': 5, 'coalesced': 4, 'in_flight': 0},
+                         self.flight.stats)
+
+    def test_results_are_copies(self):
+        results = []
+        threads = self._start('key', 2, results)
+        _wait_for(lambda: self.flight.stats['requests'] == 2)
+        self._join(threads)
+        results[0]['value'].append(3)
+        self.assertEqual([1, 2], results[1]['value'])
+
+    def test_different_keys_are_not_coalesced(self):
+        results = []
+        threads = self._start('key1', 1, results)
+        threads += self._start('key2', 1, results)
+        _wait_for(lambda: self.flight.stats['in_flight'] == 2)
+        self._join(threads)
+        self.assertEqual(2, self.calls)
+        self.assertEqual(0, self.flight.stats['coalesced'])
+
+    def test_exception_is_shared(self):
+        def fail():
+            self.release.wait()
+            raise exceptions.NotFound()
+        results = []
+        threads = self._start('key', 3, results, func=fail)
+        _wait_for(lambda: self.flight.stats['requests'] == 3)
+        self._join(threads)
+        self.assertEqual(3, len(results))
+        for result in results:
+            self.assertIsInstance(result, exceptions.NotFound)
+
+    def test_base_exception_is_shared(self):
+        def interrupted():
+            self.release.wait()
+            raise KeyboardInterrupt()
+        results = []
+        threads = self._start('key', 3, results, func=interrupted)
+        _wait_for(lambda: self.flight.stats['requests'] == 3)
+        self._join(threads)
+        self.assertEqual(3, len(results))
+        for result in results:
+            self.assertIsInstance(result, KeyboardInterrupt)
+        self.assertEqual(0, self.flight.stats['in_flight'])
+
+    def test_completed_call_is_not_reused(self):
+        self.release.set()
+        self.flight.do('key', self._call)
+        self.flight.do('key', self._call)
+        self.assertEqual(2, self.calls)
+
+
+class ClientSingleFlightTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ClientSingleFlightTest, self).setUp()
+        self.release = threading.Event()
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/networks/net1'): self._show,
+            ('GET', '/v2.0/networks/missing'): self._missing,
+        }))
+
+    def _show(self, method, path, query, body):
+        self.release.wait()
+        return 200, {'network': {'id': 'net1', 'tags': []}}
+
+    def _missing(self, method, path, query, body):
+        self.release.wait()
+        return 404, {'NeutronError': {'type': 'NetworkNotFound',
+                                      'message': 'Not found',
+                                      'detail': ''}}
+
+    def _run(self, neutron, func, count, *args, **kwargs):
+        results = []
+
+        def run():
+            try:
+                results.append(func(*args, **kwargs))
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=run) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        if neutron.single_flight:
+            _wait_for(
+                lambda: neutron.single_flight.stats['requests'] == count)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_gets_share_a_request(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                single_flight=True)
+        results = self._run(neutron, neutron.show_network, 4, 'net1')
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual(3, neutron.single_flight.stats['coalesced'])
+        for result in results:
+            self.assertEqual('net1', result['network']['id'])
+            self.assertEqual(['req-1'], result.request_ids)
+        results[0]['network']['tags'].append('mutated')
+        self.assertEqual([], results[1]['network']['tags'])
+
+    def test_params_are_part_of_the_key(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                single_flight=True)
+        self.release.set()
+        key1 = neutron._get_request_key('/networks', {'a': 1, 'b': [2, 3]})
+        key2 = neutron._get_request_key('/networks', {'b': [2, 3], 'a': 1})
+        key3 = neutron._get_request_key('/networks', {'a': 2, 'b': [2, 3]})
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+
+    def test_errors_are_shared(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                single_flight=True)
+        results = self._run(neutron, neutron.show_network, 3, 'missing')
+        self.assertEqual(1, len(self.server.requests))
+        for result in results:
+            self.assertIsInstance(result, exceptions.NotFound)
+
+    def test_shared_between_clients(self):
+        flight = single_flight.SingleFlight()
+        neutron1 = client.Client(token='token',
+                                 endpoint_url=self.server.url,
+                                 single_flight=flight)
+        neutron2 = client.Client(token='token',
+                                 endpoint_url=self.server.url,
+                                 single_flight=flight)
+        threads = [threading.Thread(target=neutron.show_network,
+                                    args=('net1',))
+                   for neutron in (neutron1, neutron2)]
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: flight.stats['requests'] == 2)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_disabled_by_default(self):
+        neutron = client.Client(token='token', endpoint_url=self.server.url)
+        self.release.set()
+        self._run(neutron, neutron.show_network, 3, 'net1')
+        self.assertEqual(3, len(self.server.requests))
@@ -0,0 +1,137 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import threading
+import time
+
+import mock
+import testtools
+
+from neutronclient.common import throttle
+from neutronclient.common import utils
+from neutronclient.tests.unit import fake_server
+from neutronclient.v2_0 import client
+
+
+class TokenBucketTest(testtools.TestCase):
+
+    def setUp(self):
+        super(TokenBucketTest, self).setUp()
+        self.now = 100.0
+        patcher = mock.patch.object(utils, 'monotonic_time',
+                                    lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        bucket = throttle.TokenBucket(rate=10, burst=3)
+        self.assertEqual([0, 0, 0, 0.1, 0.2],
+                         [round(bucket.reserve(), 6) for i in range(5)])
+        # Reserved tokens are paid back before new requests go through.
+        self.now += 0.35
+        self.assertEqual(0, bucket.reserve())
+        self.assertEqual(0.05, round(bucket.reserve(), 6))
+
+    def test_refill_is_capped_by_burst(self):
+        bucket = throttle.TokenBucket(rate=10, burst=2)
+        self.now += 60
+        self.assertEqual([0, 0, 0.1],
+                         [round(bucket.reserve(), 6) for i in range(3)])
+
+    @mock.patch('time.sleep')
+    def test_acquire_sleeps(self, sleep):
+        bucket = throttle.TokenBucket(rate=4)
+        self.assertEqual(0, bucket.acquire())
+        self.assertEqual(0.25, bucket.acquire())
+        sleep.assert_called_once_with(0.25)
+
+    def test_invalid_rate(self):
+        self.assertRaises(ValueError, throttle.TokenBucket, 0)
+
+
+class ThrottleTest(testtools.TestCase):
+
+    def test_get_throttle(self):
+        default = throttle.Throttle(rate=10)
+        post = throttle.Throttle(rate=1)
+        throttles = {'POST': post, throttle.ALL_METHODS: default}
+        self.assertIs(post, throttle.get_throttle(throttles, 'post'))
+        self.assertIs(default, throttle.get_throttle(throttles, 'GET'))
+        self.assertIsNone(throttle.get_throttle({'POST': post}, 'GET'))
+        self.assertIs(default, throttle.get_throttle(default, 'DELETE'))
+        self.assertIsNone(throttle.get_throttle(None, 'GET'))
+
+    @mock.patch('time.sleep')
+    def test_rate_wait_is_counted(self, sleep):
+        limiter = throttle.Throttle(rate=2)
+        for i in range(3):
+            with limiter:
+                pass
+        stats = limiter.stats
+        self.assertEqual(3, stats['requests'])
+        self.assertEqual(2, stats['delayed_requests'])
+        self.assertAlmostEqual(1.5, stats['rate_wait_time'], places=2)
+        self.assertEqual(0, stats['concurrency_wait_time'])
+
+
+class ClientThrottleTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ClientThrottleTest, self).setUp()
+        self.in_flight = 0
+        self.max_seen = 0
+        self.lock = threading.Lock()
+        self.server = self.useFixture(fake_server.FakeNeutronServer({
+            ('GET', '/v2.0/networks'): self._slow_response,
+            ('DELETE', '/v2.0/networks/net1'): (204, ''),
+        }))
+
+    def _slow_response(self, method, path, query, body):
+        with self.lock:
+            self.in_flight += 1
+            self.max_seen = max(self.max_seen, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return 200, {'networks': []}
+
+    def _run_concurrently(self, func, count=8):
+        threads = [threading.Thread(target=func) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_max_in_flight(self):
+        limiter = throttle.Throttle(max_in_flight=2)
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                throttle=limiter)
+        self._run_concurrently(neutron.list_networks)
+        self.assertEqual(8, len(self.server.requests))
+        self.assertEqual(2, self.max_seen)
+        stats = limiter.stats
+        self.assertEqual(8, stats['requests'])
+        self.assertGreater(stats['delayed_requests'], 0)
+        self.assertGreater(stats['concurrency_wait_time'], 0)
+
+    def test_per_method_throttles(self):
+        get_limiter = throttle.Throttle(max_in_flight=1)
+        delete_limiter = throttle.Throttle(rate=1000)
+        neutron = client.Client(token='token', endpoint_url=self.server.url,
+                                throttle={'GET': get_limiter,
+                                          'DELETE': delete_limiter})
+        self._run_concurrently(neutron.list_networks, count=4)
+        neutron.delete_network('net1')
+        self.assertEqual(1, self.max_seen)
+        self.assertEqual(4, get_limiter.stats['requests'])
+        self.assertEqual(1, delete_limiter.stats['requests'])
@@ -0,0 +1,239 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+import datetime
+import os
+import stat
+
+import fixtures
+from keystoneauth1 import fixture as ks_fixture
+from keystoneauth1.identity import v2 as ks_v2
+from keystoneauth1 import session
+from oslo_utils import timeutils
+from requests_mock.contrib import fixture as mock_fixture
+import testtools
+
+from neutronclient import client
+from neutronclient.common import token_cache
+
+AUTH_URL = 'http://keystone.test:5000/v2.0'
+TOKEN_URL = AUTH_URL + '/tokens'
+NEUTRON_URL = 'http://neutron.test:9696'
+REGION = 'RegionOne'
+CREDENTIALS = {'username': 'user', 'password': 'secret',
+               'project_name': 'project', 'auth_url': AUTH_URL}
+
+
+def _token(token_id, expires_in=3600):
+    token = ks_fixture.V2Token(
+        token_id=token_id,
+        expires=timeutils.utcnow() + datetime.timedelta(seconds=expires_in))
+    token.set_scope()
+    service = token.add_service('network')
+    service.add_endpoint(NEUTRON_URL, region=REGION)
+    return token
+
+
+class TokenCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(TokenCacheTest, self).setUp()
+        tempdir = self.useFixture(fixtures.TempDir()).path
+        self.cache_dir = os.path.join(tempdir, 'tokens')
+        self.cache = token_cache.TokenCache(self.cache_dir)
+        self.key = token_cache.credentials_cache_key(
+            AUTH_URL, username='user', project_name='project',
+            region_name=REGION)
+
+    def _state(self, token_id, expires_in=3600):
+        return {'auth_token': token_id,
+                'body': _token(token_id, expires_in)}
+
+    def test_round_trip(self):
+        self.cache.set(self.key, self._state('tok1'))
+        state = token_cache.TokenCache(self.cache_dir).get(self.key)
+        self.assertEqual('tok1', state['auth_token'])
+        self.assertEqual(REGION, state['body']['access']['serviceCatalog'][0]
+                         ['endpoints'][0]['region'])
+
+    def test_files_are_private(self):
+        self.cache.set(self.key, self._state('tok1'))
+        self.assertEqual(0o700, stat.S_IMODE(os.stat(self.cache_dir).st_mode))
+        path = os.path.join(self.cache_dir, self.key)
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(path).st_mode))
+        self.assertNotIn('user', self.key)
+        self.assertEqual([self.key], os.listdir(self.cache_dir))
+
+    def test_readable_by_others_is_ignored(self):
+        self.cache.set(self.key, self._state('tok1'))
+        os.chmod(os.path.join(self.cache_dir, self.key), 0o644)
+        self.assertIsNone(token_cache.TokenCache(self.cache_dir).get(
+            self.key))
+
+    def test_expired_token_is_discarded(self):
+        self.cache.set(self.key, self._state('tok1', expires_in=60))
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertEqual([], os.listdir(self.cache_dir))
+
+    def test_corrupted_file_is_discarded(self):
+        self.cache.set(self.key, self._state('tok1'))
+        with open(os.path.join(self.cache_dir, self.key), 'w') as f:
+            f.write('{"auth_token": ')
+        self.assertIsNone(token_cache.TokenCache(self.cache_dir).get(
+            self.key))
+        self.assertEqual([], os.listdir(self.cache_dir))
+
+    def test_key_depends_on_region_and_user(self):
+        other_region = token_cache.credentials_cache_key(
+            AUTH_URL, username='user', project_name='project',
+            region_name='RegionTwo')
+        other_user = token_cache.credentials_cache_key(
+            AUTH_URL, username='user2', project_name='project',
+            region_name=REGION)
+        self.cache.set(self.key, self._state('tok1'))
+        self.assertIsNone(self.cache.get(other_region))
+        self.assertIsNone(self.cache.get(other_user))
+
+    def test_invalidate(self):
+        self.cache.set(self.key, self._state('tok1'))
+        self.cache.invalidate(self.key)
+        self.assertIsNone(self.cache.get(self.key))
+        self.cache.invalidate(self.key)
+
+
+class HTTPClientTokenCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(HTTPClientTokenCacheTest, self).setUp()
+        tempdir = self.useFixture(fixtures.TempDir()).path
+        self.cache = token_cache.TokenCache(tempdir)
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.requests.post(TOKEN_URL, [{'json': _token('tok1')},
+                                       {'json': _token('tok2')}])
+
+    def _new_client(self):
+        return client.HTTPClient(region_name=REGION,
+                                 token_cache=self.cache, **CREDENTIALS)
+
+    def _token_requests(self):
+        return [r for r in self.requests.request_history
+                if r.url == TOKEN_URL]
+
+    def test_token_is_reused_by_next_client(self):
+        self.requests.get(NEUTRON_URL + '/v2.0/networks', json={})
+        self._new_client().do_request('/v2.0/networks', 'GET')
+        http = self._new_client()
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(1, len(self._token_requests()))
+        self.assertEqual('tok1', http.auth_token)
+        self.assertEqual(NEUTRON_URL, http.endpoint_url)
+        self.assertEqual('tok1', self.requests.last_request.headers[
+            'X-Auth-Token'])
+
+    def test_unauthorized_invalidates_cache(self):
+        self.requests.get(NEUTRON_URL + '/v2.0/networks',
+                          [{'json': {}}, {'status_code': 401}, {'json': {}}])
+        self._new_client().do_request('/v2.0/networks', 'GET')
+        http = self._new_client()
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(2, len(self._token_requests()))
+        self.assertEqual('tok2', http.auth_token)
+        self.assertEqual('tok2', token_cache.TokenCache(
+            self.cache.cache_dir).get(http._token_cache_key())['auth_token'])
+
+    def test_different_credentials_do_not_share(self):
+        self.requests.get(NEUTRON_URL + '/v2.0/networks', json={})
+        self._new_client().do_request('/v2.0/networks', 'GET')
+        http = client.HTTPClient(region_name=REGION, token_cache=self.cache,
+                                 **dict(CREDENTIALS, username='other'))
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(2, len(self._token_requests()))
+
+
+class SessionClientTokenCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(SessionClientTokenCacheTest, self).setUp()
+        tempdir = self.useFixture(fixtures.TempDir()).path
+        self.cache = token_cache.TokenCache(tempdir)
+        self.requests = self.useFixture(mock_fixture.Fixture())
+        self.requests.post(TOKEN_URL, [{'json': _token('tok1')},
+                                       {'json': _token('tok2')}])
+
+    def _new_client(self):
+        auth = ks_v2.Password(AUTH_URL, username='user', password='secret',
+                              tenant_name='project')
+        return client.construct_http_client(
+            session=session.Session(auth=auth), region_name=REGION,
+            token_cache=self.cache)
+
+    def _token_requests(self):
+        return [r for r in self.requests.request_history
+                if r.url == TOKEN_URL]
+
+    def test_token_is_reused_by_next_client(self):
+        self.requests.get(NEUTRON_URL + '/v2.0/networks', json={})
+        self._new_client().do_request('/v2.0/networks', 'GET')
+        http = self._new_client()
+        self.assertEqual(NEUTRON_URL, http.endpoint_url)
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(1, len(self._token_requests()))
+        self.assertEqual('tok1', self.requests.last_request.headers[
+            'X-Auth-Token'])
+
+    def test_authenticate_stores_token(self):
+        self._new_client().authenticate()
+        self._new_client().authenticate()
+        self.assertEqual(1, len(self._token_requests()))
+
+    def test_unauthorized_replaces_cached_token(self):
+        self.requests.get(NEUTRON_URL + '/v2.0/networks',
+                          [{'json': {}}, {'status_code': 401}, {'json': {}}])
+        self._new_client().do_request('/v2.0/networks', 'GET')
+        # keystoneauth fetches a new token and retries once.
+        self._new_client().do_request('/v2.0/networks', 'GET')
+        self.assertEqual(2, len(self._token_requests()))
+        self.assertEqual('tok2', self.requests.last_request.headers[
+            'X-Auth-Token'])
+        self._new_client().authenticate()
+        self.assertEqual(2, len(self._token_requests()))
+
+    def test_token_is_saved_once(self):
+        self.requests.get(NEUTRON_URL + '/v2.0/networks',
+                          [{'json': {}}, {'json': {}}, {'status_code': 401},
+                           {'json': {}}])
+        http = self._new_client()
+        save_plugin = self.useFixture(fixtures.MockPatchObject(
+            self.cache, 'save_plugin', wraps=self.cache.save_plugin)).mock
+        http.do_request('/v2.0/networks', 'GET')
+        http.do_request('/v2.0/networks', 'GET')
+        http.authenticate()
+        self.assertEqual(1, save_plugin.call_count)
+        # The token obtained after the 401 response is saved in turn.
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertEqual(2, save_plugin.call_count)
+        self.assertEqual(2, len(self._token_requests()))
+
+    def test_loaded_token_is_not_saved_again(self):
+        self.requests.get(NEUTRON_URL + '/v2.0/networks', json={})
+        self._new_client().do_request('/v2.0/networks', 'GET')
+        http = self._new_client()
+        save_plugin = self.useFixture(fixtures.MockPatchObject(
+            self.cache, 'save_plugin')).mock
+        http.do_request('/v2.0/networks', 'GET')
+        self.assertFalse(save_plugin.called)
+
+    def test_persistent_unauthorized_drops_cached_token(self):
+        self.requests.get(NEUTRON_URL + '/v2.0/networks', status_code=401)
+        self._new_client().do_request('/v2.0/networks', 'GET')
+        self.assertEqual([], os.listdir(self.cache.cache_dir))
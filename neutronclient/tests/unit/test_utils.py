@@ -14,6 +14,7 @@
 #    under the License.
 
 import argparse
+import time
 
 from oslo_utils import netutils
 
@@ -154,6 +155,64 @@ class TestUtils(testtools.TestCase):
         self.assertFalse(netutils.is_valid_cidr('wrong_cidr_format'))
 
 
+class MapConcurrentlyTestCase(testtools.TestCase):
+
+    def _square(self, value):
+        if value < 0:
+            raise ValueError(value)
+        return value * value
+
+    def test_results_are_ordered(self):
+        for workers in (1, 4):
+            self.assertEqual([i * i for i in range(20)],
+                             utils.map_concurrently(self._square, range(20),
+                                                    max_workers=workers))
+
+    def test_first_failure_is_raised(self):
+        for workers in (1, 4):
+            e = self.assertRaises(ValueError, utils.map_concurrently,
+                                  self._square, [1, -2, 3, -4],
+                                  max_workers=workers)
+            self.assertEqual((-2,), e.args)
+
+    def test_return_exceptions(self):
+        for workers in (1, 4):
+            results = utils.map_concurrently(self._square, [1, -2, 3],
+                                             max_workers=workers,
+                                             return_exceptions=True)
+            self.assertEqual(1, results[0])
+            self.assertIsInstance(results[1], ValueError)
+            self.assertEqual(9, results[2])
+
+
+class PrefetchTestCase(testtools.TestCase):
+
+    def _items(self, produced, count, fail=False):
+        for i in range(count):
+            produced.append(i)
+            yield i
+        if fail:
+            raise ValueError()
+
+    def test_items_are_ordered(self):
+        produced = []
+        self.assertEqual(list(range(10)), list(
+            utils.prefetch(self._items(produced, 10), depth=3)))
+
+    def test_failure_is_raised_after_items(self):
+        items = utils.prefetch(self._items([], 2, fail=True))
+        self.assertEqual([0, 1], [next(items), next(items)])
+        self.assertRaises(ValueError, next, items)
+
+    def test_close_stops_production(self):
+        produced = []
+        items = utils.prefetch(self._items(produced, 100), depth=2)
+        self.assertEqual(0, next(items))
+        items.close()
+        time.sleep(0.05)
+        self.assertLess(len(produced), 10)
+
+
 class ImportClassTestCase(testtools.TestCase):
     def test_get_client_class_invalid_version(self):
         self.assertRaises(
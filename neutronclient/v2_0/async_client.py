@@ -0,0 +1,145 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""Thread-offloading asyncio wrapper of the Neutron v2.0 API client.
+
+There is no asynchronous HTTP transport: each call runs the blocking
+request of the synchronous client on a worker thread of the executor of
+the client, and holds that thread until the response is received. The
+event loop is not blocked, but the number of requests in progress is
+bounded by the number of worker threads.
+
+This module requires Python 3.
+"""
+
+import asyncio
+from concurrent import futures
+import functools
+
+from six.moves import builtins
+
+from neutronclient.v2_0 import client
+
+
+DEFAULT_MAX_WORKERS = 10
+
+# Client methods which never touch the network and are therefore exposed
+# as plain synchronous methods.
+SYNC_METHODS = frozenset(['get_resource_plural', 'serialize', 'deserialize',
+                          'update_password', 'extend_show', 'extend_list',
+                          'extend_create', 'extend_delete', 'extend_update'])
+
+# NOTE: Referenced through builtins so this module stays importable by the
+# Python 2 style checks.
+_StopAsyncIteration = getattr(builtins, 'StopAsyncIteration', None)
+
+
+class _AsyncGeneratorWithMeta(client._RequestIdMixin):
+    """Asynchronous iterator over the pages of a paginated list response.
+
+    It yields the response bodies of the pages, e.g. ``{'ports': [...]}``.
+    Each page is fetched in the executor of the owning
+    :class:`ThreadedAsyncClient` when it is requested.
+    """
+
+    def __init__(self, async_client, generator):
+        self.async_client = async_client
+        self.generator = generator
+
+    @property
+    def request_ids(self):
+        return self.generator.request_ids
+
+    def _next(self):
+        try:
+            return next(self.generator)
+        except StopIteration:
+            raise _StopAsyncIteration()
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self.async_client._run(self._next)
+
+
+class ThreadedAsyncClient(object):
+    """Run the calls of a v2.0 Client on threads for asyncio callers.
+
+    This is a convenience for asyncio applications, not an asynchronous
+    client: it saves wrapping every call in ``run_in_executor``. It accepts
+    the same keyword arguments as :class:`neutronclient.v2_0.client.Client`
+    and exposes the same resource methods, including those added by client
+    extensions. Every method which talks to the Neutron server returns an
+    awaitable instead of blocking the event loop. URL building,
+    serialization and error handling are shared with the synchronous
+    client, so results and exceptions are identical.
+
+    The blocking HTTP exchange of each call runs in a thread pool owned by
+    the client, sized by ``max_workers``, and keeps one of its threads busy
+    until the response is received.
+
+    ``list_*`` methods called with ``retrieve_all=False`` (as a keyword
+    argument) return an asynchronous iterator over the pages of the
+    response, which fetches them on demand.
+
+    :param loop: Event loop to use. Defaults to the current event loop.
+    :param integer max_workers: Maximum number of concurrent requests.
+                                (default: 10)
+
+    Example::
+
+        from neutronclient.v2_0 import async_client
+        neutron = async_client.ThreadedAsyncClient(session=sess)
+
+        nets = await neutron.list_networks()
+        async for page in neutron.list_ports(retrieve_all=False):
+            for port in page['ports']:
+                ...
+        neutron.close()
+    """
+
+    def __init__(self, loop=None, max_workers=DEFAULT_MAX_WORKERS,
+                 **kwargs):
+        self.loop = loop
+        self.client = client.Client(**kwargs)
+        self._executor = futures.ThreadPoolExecutor(max_workers)
+
+    def _run(self, func, *args, **kwargs):
+        loop = self.loop or asyncio.get_event_loop()
+        return loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    def _wrap(self, name, method):
+        @functools.wraps(method)
+        def _fx(*args, **kwargs):
+            if (name.startswith('list_') and
+                    kwargs.get('retrieve_all', True) is False):
+                # Building the generator does not send any request.
+                return _AsyncGeneratorWithMeta(self, method(*args, **kwargs))
+            return self._run(method, *args, **kwargs)
+        return _fx
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on ThreadedAsyncClient itself.
+        if name == 'client':
+            raise AttributeError(name)
+        attr = getattr(self.client, name)
+        if (name.startswith('_') or name in SYNC_METHODS or
+                not callable(attr)):
+            return attr
+        return self._wrap(name, attr)
+
+    def close(self):
+        """Release the worker threads of this client."""
+        self._executor.shutdown(wait=True)
@@ -15,35 +15,65 @@
 #    under the License.
 #
 
+import collections
+import copy
 import inspect
 import itertools
 import logging
 import re
+import threading
 import time
 
 import debtcollector.renames
 from keystoneauth1 import exceptions as ksa_exc
 import requests
+import six
 import six.moves.urllib.parse as urlparse
 from six import string_types
 
 from neutronclient._i18n import _
 from neutronclient import client
+from neutronclient.common import batch as client_batch
+from neutronclient.common import constants
 from neutronclient.common import exceptions
 from neutronclient.common import extension as client_extension
+from neutronclient.common import id_cache
+from neutronclient.common import resource_cache
+from neutronclient.common import retry
 from neutronclient.common import serializer
+from neutronclient.common import single_flight
+from neutronclient.common import throttle
 from neutronclient.common import utils
 
 
 _logger = logging.getLogger(__name__)
 
-HEX_ELEM = '[0-9A-Fa-f]'
-UUID_PATTERN = '-'.join([HEX_ELEM + '{8}', HEX_ELEM + '{4}',
-                         HEX_ELEM + '{4}', HEX_ELEM + '{4}',
-                         HEX_ELEM + '{12}'])
-
-
-def exception_handler_v20(status_code, error_content):
+HEX_ELEM = constants.HEX_ELEM
+UUID_PATTERN = constants.UUID_PATTERN
+# Size of the chunks read from the socket when decoding streamed responses.
+STREAM_CHUNK_SIZE = 64 * 1024
+# Room left in the URIs of split list requests for the parameters, such as
+# marker and limit, which the server adds to the links to the next pages.
+PAGINATION_URI_RESERVE = 128
+# Longest endpoint URL assumed when deciding whether list filters need to
+# be split without looking the actual endpoint up.
+MAX_ENDPOINT_LEN = 1024
+# Default maximum number of resources created by a bulk create request.
+BULK_CREATE_SIZE = 100
+# Maximum size of the body of bulk create requests, below the default limit
+# of 112 KiB set by the server.
+BULK_CREATE_MAX_BODY = 96 * 1024
+# Multi-valued list parameters which are not OR-ed filters, and therefore
+# cannot be sent in separate requests.
+UNSPLITTABLE_FILTERS = frozenset(['fields', 'sort_key', 'sort_dir', 'tags',
+                                  'tags-any', 'not-tags', 'not-tags-any'])
+# List parameters which apply to the whole result, and would each apply to
+# the part returned by one request if the filters were split.
+ORDERING_PARAMS = frozenset(['sort_key', 'sort_dir', 'limit', 'marker',
+                             'page_reverse'])
+
+
+def exception_handler_v20(status_code, error_content, retry_after=None):
     """Exception handler for API v2.0 client.
 
     This routine generates the appropriate Neutron exception according to
@@ -51,6 +81,7 @@ def exception_handler_v20(status_code, error_content):
 
     :param status_code: HTTP error status code
     :param error_content: deserialized body of error response
+    :param retry_after: Retry-After header of the response, if any
     """
     error_dict = None
     request_ids = error_content.request_ids
@@ -89,7 +120,8 @@ def exception_handler_v20(status_code, error_content):
 
     raise client_exc(message=error_message,
                      status_code=status_code,
-                     request_ids=request_ids)
+                     request_ids=request_ids,
+                     retry_after=retry_after)
 
 
 class _RequestIdMixin(object):
@@ -99,7 +131,9 @@ class _RequestIdMixin(object):
 
     @property
     def request_ids(self):
-        return self._request_ids
+        # A copy, so that callers neither alter the IDs nor see them change
+        # while another thread advances a generator.
+        return list(self._request_ids)
 
     def _append_request_ids(self, resp):
         """Add request_ids as an attribute to the object
@@ -132,6 +166,10 @@ class _DictWithMeta(dict, _RequestIdMixin):
         self._request_ids_setup()
         self._append_request_ids(resp)
 
+    def __deepcopy__(self, memo):
+        return _DictWithMeta(copy.deepcopy(dict(self), memo),
+                             self.request_ids)
+
 
 class _TupleWithMeta(tuple, _RequestIdMixin):
     def __new__(cls, values, resp):
@@ -141,6 +179,10 @@ class _TupleWithMeta(tuple, _RequestIdMixin):
         self._request_ids_setup()
         self._append_request_ids(resp)
 
+    def __deepcopy__(self, memo):
+        return _TupleWithMeta(copy.deepcopy(tuple(self), memo),
+                              self.request_ids)
+
 
 class _StrWithMeta(str, _RequestIdMixin):
     def __new__(cls, value, resp):
@@ -150,6 +192,9 @@ class _StrWithMeta(str, _RequestIdMixin):
         self._request_ids_setup()
         self._append_request_ids(resp)
 
+    def __deepcopy__(self, memo):
+        return _StrWithMeta(self, self.request_ids)
+
 
 class _GeneratorWithMeta(_RequestIdMixin):
     def __init__(self, paginate_func, collection, path, **params):
@@ -158,6 +203,7 @@ class _GeneratorWithMeta(_RequestIdMixin):
         self.path = path
         self.params = params
         self.generator = None
+        self._lock = threading.Lock()
         self._request_ids_setup()
 
     def _paginate(self):
@@ -173,18 +219,58 @@ class _GeneratorWithMeta(_RequestIdMixin):
         return self.next()
 
     def next(self):
-        if not self.generator:
-            self.generator = self._paginate()
+        # Several threads may consume the same generator; each page is then
+        # returned to one of them.
+        with self._lock:
+            if not self.generator:
+                self.generator = self._paginate()
 
-        try:
-            obj, req_id = next(self.generator)
-            self._append_request_ids(req_id)
-        except StopIteration:
-            raise StopIteration()
+            try:
+                obj, req_id = next(self.generator)
+                self._append_request_ids(req_id)
+            except StopIteration:
+                raise StopIteration()
 
         return obj
 
 
+class _StreamedPage(_RequestIdMixin):
+    """A page of a list response decoded while it is being received.
+
+    Iterating over the page yields its resources. Once exhausted, ``extra``
+    holds the remaining top-level members such as the pagination links.
+    """
+
+    def __init__(self, resp, collection):
+        self._request_ids_setup()
+        self._append_request_ids(resp)
+        self.resp = resp
+        self.decoder = serializer.JSONCollectionStreamDeserializer(collection)
+
+    @property
+    def extra(self):
+        return self.decoder.extra
+
+    def __iter__(self):
+        try:
+            chunks = self.resp.iter_content(STREAM_CHUNK_SIZE)
+            for resource in self.decoder.iter_resources(chunks):
+                yield resource
+        finally:
+            self.resp.close()
+
+
+class _StreamGeneratorWithMeta(_GeneratorWithMeta):
+    """Yields the single resources of a streamed list response."""
+
+    def _paginate(self):
+        for page in self.paginate_func(
+                self.collection, self.path, **self.params):
+            self._append_request_ids(page.request_ids)
+            for resource in page:
+                yield resource, None
+
+
 class ClientBase(object):
     """Client for the OpenStack Neutron v2.0 API.
 
@@ -224,6 +310,97 @@ class ClientBase(object):
                               (default: True)
     :param session: Keystone client auth session to use. (optional)
     :param auth: Keystone auth plugin to use. (optional)
+    :param integer pool_connections: Number of per-host connection pools
+                                     kept by the HTTP client. Ignored when
+                                     a session is given. (optional)
+    :param integer pool_maxsize: Maximum number of keep-alive connections
+                                 per host. Ignored when a session is given.
+                                 (optional)
+    :param bool pool_block: Block instead of opening extra connections when
+                            a host's pool is exhausted. Ignored when a
+                            session is given. (optional)
+    :param float pool_idle_timeout: Seconds after which idle keep-alive
+                                    connections are dropped. Ignored when a
+                                    session is given. (optional)
+    :param integer token_refresh_margin: Seconds before expiry at which the
+                                         token is renewed ahead of the next
+                                         request, None to wait for a 401.
+                                         Ignored when a session is given,
+                                         keystoneauth then renews tokens
+                                         itself. (default: 60)
+    :param token_cache: A :class:`neutronclient.common.token_cache.TokenCache`
+                        reusing tokens and service catalogs across
+                        processes. (optional)
+    :param retry_policy: A :class:`neutronclient.common.retry.RetryPolicy`
+                         deciding which failed requests are retried and
+                         when. Without it, only requests which could not
+                         reach the server are retried, ``retries`` times
+                         every second, and POST requests never. (optional)
+    :param throttle: A :class:`neutronclient.common.throttle.Throttle`
+                     limiting the rate and concurrency of all requests, or
+                     a dict mapping HTTP methods to throttles, with the
+                     ``'*'`` key for the other methods. Throttles are
+                     thread-safe and can be shared between clients.
+                     (optional)
+    :param json_codec: JSON backend used to encode requests and decode
+                       responses: 'json', 'simplejson', 'ujson' or 'orjson',
+                       or a comma separated fallback chain of them.
+                       Defaults to env[NEUTRONCLIENT_JSON_CODEC], then to
+                       'json'. (optional)
+    :param endpoint_urls: List of Neutron API URLs serving the same cloud
+                          to spread requests across. An endpoint which
+                          refuses connections or answers 502, 503 or 504 is
+                          skipped for ``endpoint_eject_time`` seconds and
+                          idempotent requests (GET, PUT, DELETE) failing
+                          that way are sent to the next endpoint.
+                          (optional)
+    :param endpoint_selection: How to pick the endpoint of each request:
+                               'round-robin' or 'least-latency'. Without
+                               ``endpoint_urls``, enables spreading
+                               requests across all the endpoints of the
+                               service catalog matching the region and
+                               endpoint type. (optional)
+    :param endpoint_eject_time: Seconds an endpoint is skipped after a
+                                failure. (default: 30)
+    :param single_flight: True, or a ``SingleFlight`` from
+                          :mod:`neutronclient.common.single_flight` shared
+                          with other clients, to make identical GET
+                          requests issued while one is in flight wait for
+                          its response instead of being sent. Each caller
+                          gets its own copy of the result.
+                          ``single_flight.stats`` counts the coalesced
+                          requests. (optional)
+    :param resource_cache: True, or a ``ResourceCache`` from
+                           :mod:`neutronclient.common.resource_cache` with
+                           its own TTL, size and per resource type
+                           policies, to cache the responses to show
+                           requests. Entries are dropped when this client
+                           updates or deletes the resource. Hit, miss and
+                           eviction counters are available from
+                           ``resource_cache.stats``. (optional)
+    :param integer chunk_workers: List calls whose multi-valued filters,
+                                  e.g. ``id=[...]``, do not fit in a request
+                                  URI are split into several requests. This
+                                  is the number of them sent concurrently
+                                  when all the results are retrieved.
+                                  (default: 1)
+    :param id_cache: True, or an ``IdCache`` from
+                     :mod:`neutronclient.common.id_cache` with its own TTL
+                     and size, to cache the IDs that names or IDs resolve
+                     to in ``find_resource`` and ``find_resource_by_id``
+                     calls asking for the ``id`` field only. Entries are
+                     dropped when this client updates or deletes the
+                     resource. (optional)
+    :param bool trust_uuids: Do not check that UUIDs given to
+                             ``find_resource`` and ``find_resource_by_id``
+                             calls asking for the ``id`` field only exist,
+                             saving a request; the resource is then assumed
+                             to exist. (default: False)
+    :param integer prefetch_pages: Number of pages of a paginated list
+                                   fetched in a background thread ahead of
+                                   the page being consumed, unless the
+                                   ``prefetch`` argument of the list call
+                                   says otherwise. (default: 0)
 
     Example::
 
@@ -235,6 +412,17 @@ class ClientBase(object):
 
         nets = neutron.list_networks()
         ...
+
+    A client can be shared by several threads once constructed: API calls
+    do not modify the client, nor the arguments they are given, and
+    authentication, token refresh and endpoint lookups are serialized, so
+    that a single request is made to keystone for all the threads. Results
+    are owned by the calling thread; their ``request_ids`` property returns
+    a copy. A generator returned by a ``list_*`` call with
+    ``retrieve_all=False`` may be consumed by several threads, each page
+    then being returned to a single one of them. Changing the attributes of
+    a client while it is used, e.g. ``retries`` or ``httpclient``, is not
+    supported.
     """
 
     # API has no way to report plurals, so we have to hard code them
@@ -248,6 +436,22 @@ class ClientBase(object):
         super(ClientBase, self).__init__()
         self.retries = kwargs.pop('retries', 0)
         self.raise_errors = kwargs.pop('raise_errors', True)
+        self.retry_policy = kwargs.pop('retry_policy', None)
+        self.throttle = kwargs.pop('throttle', None)
+        self.single_flight = kwargs.pop('single_flight', None)
+        if self.single_flight is True:
+            self.single_flight = single_flight.SingleFlight()
+        self.resource_cache = kwargs.pop('resource_cache', None)
+        self.chunk_workers = kwargs.pop('chunk_workers', 1)
+        self.prefetch_pages = kwargs.pop('prefetch_pages', 0)
+        if self.resource_cache is True:
+            self.resource_cache = resource_cache.ResourceCache()
+        self.id_cache = kwargs.pop('id_cache', None)
+        if self.id_cache is True:
+            self.id_cache = id_cache.IdCache()
+        self.trust_uuids = kwargs.pop('trust_uuids', False)
+        self.serializer = serializer.Serializer(
+            codec=kwargs.pop('json_codec', None))
         self.httpclient = client.construct_http_client(**kwargs)
         self.version = '2.0'
         self.action_prefix = "/v%s" % (self.version)
@@ -268,9 +472,11 @@ class ClientBase(object):
             des_error_body = {'message': response_body}
         error_body = self._convert_into_with_meta(des_error_body, resp)
         # Raise the appropriate exception
-        exception_handler_v20(status_code, error_body)
+        exception_handler_v20(status_code, error_body,
+                              retry_after=resp.headers.get('Retry-After'))
 
-    def do_request(self, method, action, body=None, headers=None, params=None):
+    def do_request(self, method, action, body=None, headers=None, params=None,
+                   stream=False):
         # Add format and project_id
         action = self.action_prefix + action
         if isinstance(params, dict) and params:
@@ -280,16 +486,30 @@ class ClientBase(object):
         if body:
             body = self.serialize(body)
 
-        resp, replybody = self.httpclient.do_request(action, method, body=body)
+        # NOTE: A streamed response is handed back undecoded so that the
+        # caller can consume its body incrementally.
+        kwargs = {'stream': True} if stream else {}
+        method_throttle = throttle.get_throttle(self.throttle, method)
+        if method_throttle is None:
+            resp, replybody = self.httpclient.do_request(
+                action, method, body=body, **kwargs)
+        else:
+            with method_throttle:
+                resp, replybody = self.httpclient.do_request(
+                    action, method, body=body, **kwargs)
 
         status_code = resp.status_code
         if status_code in (requests.codes.ok,
                            requests.codes.created,
                            requests.codes.accepted,
                            requests.codes.no_content):
+            if stream:
+                return resp
             data = self.deserialize(replybody, status_code)
             return self._convert_into_with_meta(data, resp)
         else:
+            if stream:
+                replybody = resp.text
             if not replybody:
                 replybody = resp.reason
             self._handle_fault_response(status_code, replybody, resp)
@@ -306,7 +526,7 @@ class ClientBase(object):
         if data is None:
             return None
         elif isinstance(data, dict):
-            return serializer.Serializer().serialize(data)
+            return self.serializer.serialize(data)
         else:
             raise Exception(_("Unable to serialize object of type = '%s'") %
                             type(data))
@@ -315,85 +535,392 @@ class ClientBase(object):
         """Deserializes a JSON string into a dictionary."""
         if not data:
             return data
-        return serializer.Serializer().deserialize(
-            data)['body']
+        return self.serializer.deserialize(data)['body']
+
+    def _get_retry_policy(self):
+        if self.retry_policy is not None:
+            return self.retry_policy
+        # Without a policy, only failed connections are retried, at a
+        # fixed interval.
+        return retry.RetryPolicy(max_retries=self.retries,
+                                 backoff=self.retry_interval,
+                                 backoff_factor=1, max_backoff=None,
+                                 jitter=False, status_codes=(),
+                                 respect_retry_after=False)
 
     def retry_request(self, method, action, body=None,
-                      headers=None, params=None):
-        """Call do_request with the default retry configuration.
+                      headers=None, params=None, **kwargs):
+        """Call do_request with the configured retry policy.
 
-        Only idempotent requests should retry failed connection attempts.
+        POST requests are only retried if the retry policy allows it.
         :raises: ConnectionFailed if the maximum # of retries is exceeded
         """
-        max_attempts = self.retries + 1
-        for i in range(max_attempts):
+        policy = self._get_retry_policy()
+        start = time.time()
+        attempts = 0
+        while True:
+            attempts += 1
             try:
                 return self.do_request(method, action, body=body,
-                                       headers=headers, params=params)
-            except (exceptions.ConnectionFailed, ksa_exc.ConnectionError):
+                                       headers=headers, params=params,
+                                       **kwargs)
+            except (exceptions.NeutronClientException,
+                    ksa_exc.ConnectionError) as e:
                 # Exception has already been logged by do_request()
-                if i < self.retries:
-                    _logger.debug('Retrying connection to Neutron service')
-                    time.sleep(self.retry_interval)
-                elif self.raise_errors:
+                delay = policy.next_delay(method, attempts - 1, e,
+                                          time.time() - start)
+                if delay is not None:
+                    _logger.debug('Retrying request to Neutron service in '
+                                  '%(delay).2f seconds: %(err)s',
+                                  {'delay': delay, 'err': e})
+                    time.sleep(delay)
+                    continue
+                if (self.raise_errors or not retry.is_connection_error(e) or
+                        not policy.allows_method(method)):
                     raise
+                break
 
-        if self.retries:
+        if attempts > 1:
             msg = (_("Failed to connect to Neutron server after %d attempts")
-                   % max_attempts)
+                   % attempts)
         else:
             msg = _("Failed to connect Neutron server")
 
         raise exceptions.ConnectionFailed(reason=msg)
 
+    def _write_request(self, method, action, body=None, headers=None,
+                       params=None):
+        if self.id_cache is not None and method != 'POST':
+            self.id_cache.invalidate(action)
+            try:
+                return self._write_cached_request(method, action, body,
+                                                  headers, params)
+            finally:
+                self.id_cache.invalidate(action)
+        return self._write_cached_request(method, action, body, headers,
+                                          params)
+
+    def _write_cached_request(self, method, action, body, headers, params):
+        if self.resource_cache is None:
+            return self.retry_request(method, action, body=body,
+                                      headers=headers, params=params)
+        children = method != 'POST'
+        self.resource_cache.invalidate(action, children=children)
+        try:
+            res = self.retry_request(method, action, body=body,
+                                     headers=headers, params=params)
+        finally:
+            # Drops the entries stored by reads which completed meanwhile.
+            self.resource_cache.invalidate(action, children=children)
+        self.resource_cache.observe(res)
+        return res
+
     def delete(self, action, body=None, headers=None, params=None):
-        return self.retry_request("DELETE", action, body=body,
-                                  headers=headers, params=params)
+        return self._write_request("DELETE", action, body=body,
+                                   headers=headers, params=params)
 
     def get(self, action, body=None, headers=None, params=None):
-        return self.retry_request("GET", action, body=body,
-                                  headers=headers, params=params)
+        if body or headers or not (self.single_flight or
+                                   self.resource_cache is not None):
+            return self.retry_request("GET", action, body=body,
+                                      headers=headers, params=params)
+        key = self._get_request_key(action, params)
+        cache = self.resource_cache
+        if cache is not None:
+            res = cache.get(key)
+            if res is not None:
+                return res
+            token = cache.begin()
+        if self.single_flight:
+            res = self.single_flight.do(
+                key, lambda: self.retry_request("GET", action, params=params))
+        else:
+            res = self.retry_request("GET", action, params=params)
+        if cache is not None:
+            cache.set(key, action, res, token)
+        return res
+
+    def _get_request_key(self, action, params):
+        if not params:
+            return action
+        params = utils.safe_encode_dict(params)
+        return action + '?' + urlparse.urlencode(
+            sorted(params.items(), key=lambda item: item[0]), doseq=1)
 
     def post(self, action, body=None, headers=None, params=None):
-        # Do not retry POST requests to avoid the orphan objects problem.
-        return self.do_request("POST", action, body=body,
-                               headers=headers, params=params)
+        # POST requests are not retried unless the retry policy opts in, to
+        # avoid the orphan objects problem.
+        return self._write_request("POST", action, body=body,
+                                   headers=headers, params=params)
 
     def put(self, action, body=None, headers=None, params=None):
-        return self.retry_request("PUT", action, body=body,
-                                  headers=headers, params=params)
-
-    def list(self, collection, path, retrieve_all=True, **params):
+        return self._write_request("PUT", action, body=body,
+                                   headers=headers, params=params)
+
+    def create_bulk(self, resource, items, batch_size=BULK_CREATE_SIZE,
+                    workers=1, path=None):
+        """Create resources of a type with as few requests as possible.
+
+        ``items`` are sent in bulk create requests of up to ``batch_size``
+        resources, with bodies smaller than ``BULK_CREATE_MAX_BODY`` bytes.
+        Up to ``workers`` requests are sent concurrently.
+
+        :param resource: The resource type, e.g. ``'port'``.
+        :param items: Attributes of each resource to create.
+        :param path: The path of the collection, by default the
+                     ``<collection>_path`` attribute of the client.
+        :returns: The created resources, in the order of ``items``, with the
+                  request IDs of all the requests.
+        :raises BulkCreateFailed: when requests failed, once all of them
+                                  completed.
+        """
+        collection = self.get_resource_plural(resource)
+        if path is None:
+            path = getattr(self, '%s_path' % collection)
+        batches = self._split_bulk(collection, list(items), batch_size)
+        results = utils.map_concurrently(
+            lambda batch: self.post(path, body={collection: batch[1]}),
+            batches, max_workers=workers, return_exceptions=True)
+        created = []
+        failures = []
+        request_ids = []
+        for (index, batch), result in zip(batches, results):
+            request_ids.extend(getattr(result, 'request_ids', None) or [])
+            if isinstance(result, Exception):
+                failures.append((index, batch, result))
+            else:
+                created.extend(result[collection])
+        if failures:
+            message = (_("%(failed)d of %(total)d bulk create requests "
+                         "failed, first error: %(error)s") %
+                       {'failed': len(failures), 'total': len(batches),
+                        'error': failures[0][2]})
+            raise exceptions.BulkCreateFailed(
+                message, created=created, failures=failures,
+                request_ids=request_ids)
+        return _DictWithMeta({collection: created}, request_ids)
+
+    def _split_bulk(self, collection, items, batch_size):
+        """Return ``(index, items)`` for each bulk create request."""
+        # Length of the body without resources.
+        base_len = len(self.serialize({collection: []}))
+        batches = []
+        index = 0
+        batch = []
+        body_len = base_len
+        for item in items:
+            # Counts the separator from the previous resource.
+            item_len = len(self.serialize(item)) + 2
+            if batch and (len(batch) >= batch_size or
+                          body_len + item_len > BULK_CREATE_MAX_BODY):
+                batches.append((index, batch))
+                index += len(batch)
+                batch = []
+                body_len = base_len
+            batch.append(item)
+            body_len += item_len
+        if batch:
+            batches.append((index, batch))
+        return batches
+
+    def batch(self, max_workers=client_batch.DEFAULT_MAX_WORKERS):
+        """Return a batch queueing calls to this client.
+
+        The calls are run concurrently, on up to ``max_workers`` threads,
+        when the ``with`` block using the batch exits. See
+        :class:`neutronclient.common.batch.Batch`.
+        """
+        return client_batch.Batch(self, max_workers=max_workers)
+
+    def list(self, collection, path, retrieve_all=True, stream=False,
+             prefetch=None, **params):
+        """Fetch a collection, following pagination links.
+
+        With ``retrieve_all`` the resources of every page are returned in a
+        single dict, otherwise a generator of pages is returned.
+
+        With ``stream`` each response body is decoded incrementally while it
+        is received instead of being read whole first. Combined with
+        ``retrieve_all=False`` the generator then yields single resources
+        rather than pages.
+
+        ``prefetch`` is the number of pages fetched in a background thread
+        while the current one is consumed, ``prefetch_pages`` of the client
+        by default. Each page request needs the marker of the previous page,
+        so they are still sent one after the other. Prefetching is not done
+        with ``stream``, the links to the next page being only known once
+        the current one has been read.
+        """
+        if prefetch is None:
+            prefetch = self.prefetch_pages
+        paginate = self._stream_pagination if stream else self._pagination
+        chunks = self._split_filters(path, params)
+        if len(chunks) > 1:
+            if retrieve_all and self.chunk_workers > 1:
+                return self._list_chunks(collection, path, chunks, stream,
+                                         prefetch)
+            paginate = self._chunked_pagination(paginate, chunks)
+            params = {}
+        if prefetch and not stream:
+            paginate = self._prefetched_pagination(paginate, prefetch)
         if retrieve_all:
             res = []
             request_ids = []
-            for r in self._pagination(collection, path, **params):
-                res.extend(r[collection])
+            for r in paginate(collection, path, **params):
+                res.extend(r if stream else r[collection])
                 request_ids.extend(r.request_ids)
+            if len(chunks) > 1:
+                res = self._unique_resources(res)
             return _DictWithMeta({collection: res}, request_ids)
+        elif stream:
+            return _StreamGeneratorWithMeta(paginate, collection,
+                                            path, **params)
         else:
-            return _GeneratorWithMeta(self._pagination, collection,
+            return _GeneratorWithMeta(paginate, collection,
                                       path, **params)
 
+    def _list_chunks(self, collection, path, chunks, stream, prefetch):
+        results = utils.map_concurrently(
+            lambda chunk: self.list(collection, path, stream=stream,
+                                    prefetch=prefetch, **chunk),
+            chunks, max_workers=self.chunk_workers)
+        res = []
+        request_ids = []
+        for r in results:
+            res.extend(r[collection])
+            request_ids.extend(r.request_ids)
+        return _DictWithMeta({collection: self._unique_resources(res)},
+                             request_ids)
+
+    @staticmethod
+    def _unique_resources(resources):
+        # A resource with several values of a filtered attribute, e.g. a
+        # port with several fixed IPs, can be returned by several chunks.
+        seen = set()
+        unique = []
+        for resource in resources:
+            resource_id = resource.get('id')
+            if resource_id is not None:
+                if resource_id in seen:
+                    continue
+                seen.add(resource_id)
+            unique.append(resource)
+        return unique
+
+    @staticmethod
+    def _chunked_pagination(paginate, chunks):
+        def paginate_chunks(collection, path):
+            for chunk in chunks:
+                for page in paginate(collection, path, **chunk):
+                    yield page
+        return paginate_chunks
+
+    @staticmethod
+    def _prefetched_pagination(paginate, depth):
+        def prefetch_pages(collection, path, **params):
+            return utils.prefetch(paginate(collection, path, **params),
+                                  depth)
+        return prefetch_pages
+
+    def _get_endpoint_len(self):
+        pool = getattr(self.httpclient, 'endpoint_pool', None)
+        if pool is not None:
+            return max(len(url) for url in pool.urls)
+        if (not self.httpclient.endpoint_url and
+                hasattr(self.httpclient,
+                        'authenticate_and_fetch_endpoint_url')):
+            self.httpclient.authenticate_and_fetch_endpoint_url()
+        return len(self.httpclient.endpoint_url or '')
+
+    def _split_filters(self, path, params):
+        """Split list filters into sets which each fit in a request URI.
+
+        The values of the longest multi-valued filter are spread over as
+        few requests as possible, leaving room for the pagination
+        parameters. The filters are returned unchanged when they fit in a
+        single request, or cannot be split. They are never split when the
+        results are sorted or a page is requested, the order and the page
+        not being those of the whole result otherwise.
+        """
+        if not params or ORDERING_PARAMS.intersection(params):
+            return [params]
+        encoded = utils.safe_encode_dict(params)
+        query_len = len(urlparse.urlencode(encoded, doseq=1))
+        uri_len = (len(self.action_prefix + path) + 1 + query_len +
+                   PAGINATION_URI_RESERVE)
+        # Short queries fit whatever the endpoint, which may not be known
+        # before authenticating.
+        if uri_len + MAX_ENDPOINT_LEN <= client.MAX_URI_LEN:
+            return [params]
+        budget = client.MAX_URI_LEN - self._get_endpoint_len() - (
+            uri_len - query_len)
+        if query_len <= budget:
+            return [params]
+
+        def encoded_len(key, values):
+            return len(urlparse.urlencode({key: values}, doseq=1))
+
+        splittable = [key for key, value in params.items()
+                      if isinstance(value, (list, tuple)) and
+                      len(value) > 1 and key not in UNSPLITTABLE_FILTERS]
+        if not splittable:
+            return [params]
+        key = max(splittable, key=lambda k: encoded_len(k, encoded[k]))
+        others = dict((k, v) for k, v in encoded.items() if k != key)
+        fixed_len = len(urlparse.urlencode(others, doseq=1))
+        chunks = []
+        chunk = []
+        chunk_len = fixed_len
+        for value, encoded_value in zip(params[key], encoded[key]):
+            # Counts the '&' separating the value from the previous one.
+            value_len = encoded_len(key, [encoded_value]) + 1
+            if chunk and chunk_len + value_len > budget:
+                chunks.append(chunk)
+                chunk = []
+                chunk_len = fixed_len
+            chunk.append(value)
+            chunk_len += value_len
+        chunks.append(chunk)
+        _logger.debug("Splitting the %(count)d values of the %(key)s filter "
+                      "into %(chunks)d requests",
+                      {'count': len(params[key]), 'key': key,
+                       'chunks': len(chunks)})
+        result = []
+        for chunk in chunks:
+            chunk_params = dict(params)
+            chunk_params[key] = chunk
+            result.append(chunk_params)
+        return result
+
+    def _next_page_params(self, res, collection, linkrel):
+        for link in res.get('%s_links' % collection, []):
+            if link['rel'] == linkrel:
+                query_str = urlparse.urlparse(link['href']).query
+                return urlparse.parse_qs(query_str)
+
     def _pagination(self, collection, path, **params):
         if params.get('page_reverse', False):
             linkrel = 'previous'
         else:
             linkrel = 'next'
-        next = True
-        while next:
+        while params is not None:
             res = self.get(path, params=params)
             yield res
-            next = False
-            try:
-                for link in res['%s_links' % collection]:
-                    if link['rel'] == linkrel:
-                        query_str = urlparse.urlparse(link['href']).query
-                        params = urlparse.parse_qs(query_str)
-                        next = True
-                        break
-            except KeyError:
-                break
+            params = self._next_page_params(res, collection, linkrel)
+
+    def _stream_pagination(self, collection, path, **params):
+        if params.get('page_reverse', False):
+            linkrel = 'previous'
+        else:
+            linkrel = 'next'
+        while params is not None:
+            resp = self.retry_request("GET", path, params=params,
+                                      stream=True)
+            page = _StreamedPage(resp, collection)
+            yield page
+            # The links follow the resources in the body, so the page has
+            # been fully consumed by the time they are needed.
+            params = self._next_page_params(page.extra, collection, linkrel)
 
     def _convert_into_with_meta(self, item, resp):
         if item:
@@ -410,8 +937,38 @@ class ClientBase(object):
                 return k
         return resource + 's'
 
+    @staticmethod
+    def _is_id_only(fields):
+        return fields == 'id' or (isinstance(fields, (list, tuple)) and
+                                  list(fields) == ['id'])
+
+    def _resolve_id(self, key, fields, find):
+        """Call ``find`` through the ID cache when only the ID is needed."""
+        if self.id_cache is None or not self._is_id_only(fields):
+            return find()
+        resource_id = self.id_cache.get(key)
+        if resource_id is not None:
+            return {'id': resource_id}
+        token = self.id_cache.begin()
+        info = find()
+        self.id_cache.set(key, info['id'], token)
+        return info
+
     def find_resource_by_id(self, resource, resource_id, cmd_resource=None,
                             parent_id=None, fields=None):
+        if (self.trust_uuids and self._is_id_only(fields) and
+                re.match(UUID_PATTERN, resource_id)):
+            return {'id': resource_id}
+        return self._resolve_id(
+            ('id', resource, cmd_resource or resource, resource_id, None,
+             parent_id),
+            fields,
+            lambda: self._find_resource_by_id(resource, resource_id,
+                                              cmd_resource, parent_id,
+                                              fields))
+
+    def _find_resource_by_id(self, resource, resource_id, cmd_resource=None,
+                             parent_id=None, fields=None):
         if not cmd_resource:
             cmd_resource = resource
         cmd_resource_plural = self.get_resource_plural(cmd_resource)
@@ -470,9 +1027,21 @@ class ClientBase(object):
 
     def find_resource(self, resource, name_or_id, project_id=None,
                       cmd_resource=None, parent_id=None, fields=None):
+        if (self.trust_uuids and self._is_id_only(fields) and
+                re.match(UUID_PATTERN, name_or_id)):
+            return {'id': name_or_id}
+        return self._resolve_id(
+            ('name_or_id', resource, cmd_resource or resource, name_or_id,
+             project_id, parent_id),
+            fields,
+            lambda: self._find_resource(resource, name_or_id, project_id,
+                                        cmd_resource, parent_id, fields))
+
+    def _find_resource(self, resource, name_or_id, project_id=None,
+                       cmd_resource=None, parent_id=None, fields=None):
         try:
-            return self.find_resource_by_id(resource, name_or_id,
-                                            cmd_resource, parent_id, fields)
+            return self._find_resource_by_id(resource, name_or_id,
+                                             cmd_resource, parent_id, fields)
         except exceptions.NotFound:
             try:
                 return self._find_resource_by_name(
@@ -486,6 +1055,109 @@ class ClientBase(object):
                 raise exceptions.NotFound(
                     message=not_found_message)
 
+    def find_resources(self, resource, names_or_ids, project_id=None,
+                       cmd_resource=None, parent_id=None, fields=None,
+                       return_errors=False):
+        """Find several resources by name or ID with few list requests.
+
+        All the UUIDs are looked up by ID with a single list request, then
+        the values not found that way by name with another one; requests
+        whose filters are too long for a URI are split by ``list``.
+
+        :returns: The resources, in the order of ``names_or_ids``.
+        :raises NotFound: when a value matches no resource, or
+                          NeutronClientNoUniqueMatch when a name matches
+                          several ones, and none is missing. The message
+                          lists all the values which could not be
+                          resolved.
+        :param return_errors: Return the exception of each value which
+                              could not be resolved in place of its
+                              resource instead of raising one.
+        """
+        names_or_ids = [value if isinstance(value, string_types)
+                        else six.text_type(value) for value in names_or_ids]
+        # The IDs of the UUIDs given, which neutron returns in lower case.
+        uuids = dict((value, value.lower()) for value in names_or_ids
+                     if re.match(UUID_PATTERN, value))
+        if not cmd_resource:
+            cmd_resource = resource
+        id_only = self._is_id_only(fields)
+        found = {}
+        if id_only:
+            for value in names_or_ids:
+                if self.trust_uuids and value in uuids:
+                    found[value] = {'id': uuids[value]}
+                elif self.id_cache is not None:
+                    resource_id = self.id_cache.get(
+                        ('name_or_id', resource, cmd_resource, value,
+                         project_id, parent_id))
+                    if resource_id is not None:
+                        found[value] = {'id': resource_id}
+        cached = set(found)
+        token = self.id_cache.begin() if self.id_cache is not None else None
+
+        collection = self.get_resource_plural(resource)
+        obj_lister = getattr(
+            self, "list_%s" % self.get_resource_plural(cmd_resource))
+
+        def lister(**params):
+            if fields:
+                params['fields'] = sorted(set(
+                    ([fields] if isinstance(fields, string_types)
+                     else list(fields)) + ['id', 'name']))
+            if parent_id:
+                return obj_lister(parent_id, **params)[collection]
+            return obj_lister(**params)[collection]
+
+        ids = set(uuids[value] for value in names_or_ids
+                  if value not in found and value in uuids)
+        if ids:
+            by_id = dict((info['id'], info)
+                         for info in lister(id=sorted(ids)))
+            for value in names_or_ids:
+                if value not in found and uuids.get(value) in by_id:
+                    found[value] = by_id[uuids[value]]
+        names = sorted(set(value for value in names_or_ids
+                           if value not in found))
+        by_name = collections.defaultdict(list)
+        if names:
+            params = {'name': names}
+            if project_id:
+                params['tenant_id'] = project_id
+            for info in lister(**params):
+                by_name[info.get('name')].append(info)
+
+        results = []
+        errors = []
+        for value in names_or_ids:
+            if value not in found and len(by_name.get(value, ())) == 1:
+                found[value] = by_name[value][0]
+            if value in found:
+                results.append(found[value])
+                if (id_only and self.id_cache is not None and
+                        value not in cached):
+                    self.id_cache.set(
+                        ('name_or_id', resource, cmd_resource, value,
+                         project_id, parent_id), found[value]['id'], token)
+                continue
+            if by_name.get(value):
+                error = exceptions.NeutronClientNoUniqueMatch(
+                    resource=resource, name=value)
+            else:
+                error = exceptions.NotFound(
+                    message=_("Unable to find %(resource)s with name or id "
+                              "'%(name_or_id)s'") %
+                    {'resource': resource, 'name_or_id': value})
+            results.append(error)
+            errors.append(error)
+        if errors and not return_errors:
+            missing = [e for e in errors
+                       if isinstance(e, exceptions.NotFound)]
+            error_class = type((missing or errors)[0])
+            raise error_class(
+                message='\n'.join(six.text_type(e) for e in errors))
+        return results
+
 
 class Client(ClientBase):
 
@@ -809,6 +1481,10 @@ class Client(ClientBase):
         """Creates a new port."""
         return self.post(self.ports_path, body=body)
 
+    def create_ports_bulk(self, ports, **kwargs):
+        """Creates ports in bulk requests. See :meth:`create_bulk`."""
+        return self.create_bulk('port', ports, **kwargs)
+
     def update_port(self, port, body=None):
         """Updates a port."""
         return self.put(self.port_path % (port), body=body)
@@ -831,6 +1507,10 @@ class Client(ClientBase):
         """Creates a new network."""
         return self.post(self.networks_path, body=body)
 
+    def create_networks_bulk(self, networks, **kwargs):
+        """Creates networks in bulk requests. See :meth:`create_bulk`."""
+        return self.create_bulk('network', networks, **kwargs)
+
     def update_network(self, network, body=None):
         """Updates a network."""
         return self.put(self.network_path % (network), body=body)
@@ -852,6 +1532,10 @@ class Client(ClientBase):
         """Creates a new subnet."""
         return self.post(self.subnets_path, body=body)
 
+    def create_subnets_bulk(self, subnets, **kwargs):
+        """Creates subnets in bulk requests. See :meth:`create_bulk`."""
+        return self.create_bulk('subnet', subnets, **kwargs)
+
     def update_subnet(self, subnet, body=None):
         """Updates a subnet."""
         return self.put(self.subnet_path % (subnet), body=body)
@@ -971,6 +1655,13 @@ class Client(ClientBase):
         """Creates a new security group."""
         return self.post(self.security_groups_path, body=body)
 
+    def create_security_groups_bulk(self, security_groups, **kwargs):
+        """Creates security groups in bulk requests.
+
+        See :meth:`create_bulk`.
+        """
+        return self.create_bulk('security_group', security_groups, **kwargs)
+
     def update_security_group(self, security_group, body=None):
         """Updates a security group."""
         return self.put(self.security_group_path %
@@ -994,6 +1685,13 @@ class Client(ClientBase):
         """Creates a new security group rule."""
         return self.post(self.security_group_rules_path, body=body)
 
+    def create_security_group_rules_bulk(self, rules, **kwargs):
+        """Creates security group rules in bulk requests.
+
+        See :meth:`create_bulk`.
+        """
+        return self.create_bulk('security_group_rule', rules, **kwargs)
+
     def delete_security_group_rule(self, security_group_rule):
         """Deletes the specified security group rule."""
         return self.delete(self.security_group_rule_path %
@@ -0,0 +1,64 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare per-call connections with the pooled HTTPClient transport.
+
+Usage: python tools/benchmarks/http_keepalive.py [NUM_REQUESTS]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+import requests
+
+from neutronclient import client
+from neutronclient.tests.unit import fake_server
+
+
+def _one_connection_per_call(url, count):
+    for i in range(count):
+        requests.request('GET', url, headers={'X-Auth-Token': 'token'})
+
+
+def _pooled(endpoint_url, count):
+    http = client.HTTPClient(token='token', endpoint_url=endpoint_url)
+    for i in range(count):
+        http.do_request('/v2.0/networks', 'GET')
+
+
+def _run(name, func, arg, count):
+    server = fake_server.FakeNeutronServer(
+        {('GET', '/v2.0/networks'): (200, {'networks': []})})
+    server.setUp()
+    try:
+        target = server.url + arg
+        start = time.time()
+        func(target, count)
+        elapsed = time.time() - start
+        print('%-28s %6d requests %6d connections %8.3fs %8.1f req/s' %
+              (name, len(server.requests), server.connections, elapsed,
+               count / elapsed))
+    finally:
+        server.cleanUp()
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 1000
+    _run('requests.request per call', _one_connection_per_call,
+         '/v2.0/networks', count)
+    _run('pooled HTTPClient', _pooled, '', count)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
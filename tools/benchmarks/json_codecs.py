@@ -0,0 +1,104 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare the JSON backends on typical Neutron payloads.
+
+Usage: python tools/benchmarks/json_codecs.py [NUM_RESOURCES]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from neutronclient.common import serializer
+
+
+def _port(i):
+    return {'id': '%08x-6a6e-4c6a-8b2c-1a2b3c4d5e6f' % i,
+            'name': 'port-%d' % i,
+            'network_id': '5b2ae3f4-2c5e-4bd2-9f9f-7e1f9a0c0d11',
+            'tenant_id': 'f8e3c5a1b2d94c7e8a6b5c4d3e2f1a0b',
+            'project_id': 'f8e3c5a1b2d94c7e8a6b5c4d3e2f1a0b',
+            'mac_address': 'fa:16:3e:%02x:%02x:%02x' % (
+                i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff),
+            'admin_state_up': True,
+            'status': 'ACTIVE',
+            'device_owner': 'compute:nova',
+            'device_id': '9d1c3b4a-7e2f-4a6b-8c5d-0e1f2a3b4c5d',
+            'fixed_ips': [{'subnet_id': '1f0e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b',
+                           'ip_address': '10.%d.%d.%d' % (
+                               i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff)}],
+            'allowed_address_pairs': [],
+            'extra_dhcp_opts': [],
+            'security_groups': ['0a1b2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d'],
+            'binding:vnic_type': 'normal',
+            'binding:profile': {},
+            'binding:vif_details': {'port_filter': True,
+                                    'ovs_hybrid_plug': True},
+            'port_security_enabled': True,
+            'description': '',
+            'tags': [],
+            'revision_number': 7,
+            'created_at': '2017-08-01T10:00:00Z',
+            'updated_at': '2017-08-01T10:05:00Z'}
+
+
+def _sg_rule(i):
+    return {'id': '%08x-0b1c-4d2e-8f3a-4b5c6d7e8f90' % i,
+            'security_group_id': '0a1b2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d',
+            'tenant_id': 'f8e3c5a1b2d94c7e8a6b5c4d3e2f1a0b',
+            'project_id': 'f8e3c5a1b2d94c7e8a6b5c4d3e2f1a0b',
+            'direction': 'ingress',
+            'ethertype': 'IPv4',
+            'protocol': 'tcp',
+            'port_range_min': 1000 + i % 1000,
+            'port_range_max': 1000 + i % 1000,
+            'remote_ip_prefix': '0.0.0.0/0',
+            'remote_group_id': None,
+            'description': '',
+            'revision_number': 1,
+            'created_at': '2017-08-01T10:00:00Z',
+            'updated_at': '2017-08-01T10:00:00Z'}
+
+
+def _bench(codec, payload, number):
+    ser = serializer.Serializer(codec=codec)
+    data = ser.serialize(payload)
+    encode = min(timeit.repeat(lambda: ser.serialize(payload),
+                               repeat=3, number=number)) / number
+    decode = min(timeit.repeat(lambda: ser.deserialize(data),
+                               repeat=3, number=number)) / number
+    return encode, decode
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 1000
+    payloads = [
+        ('ports', {'ports': [_port(i) for i in range(count)]}),
+        ('security_group_rules',
+         {'security_group_rules': [_sg_rule(i) for i in range(count)]}),
+    ]
+    for name in sorted(serializer.JSON_CODECS):
+        try:
+            serializer.JSON_CODECS[name]()
+        except ImportError:
+            print('%-12s not available' % name)
+            continue
+        for payload_name, payload in payloads:
+            encode, decode = _bench(name, payload, 10)
+            print('%-12s %-22s encode %8.2fms decode %8.2fms' %
+                  (name, payload_name, encode * 1000, decode * 1000))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
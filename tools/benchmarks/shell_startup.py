@@ -0,0 +1,67 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare the cold start of the neutron shell with and without the index.
+
+Each run starts a new interpreter which creates the shell and looks up the
+net-list command, as ``neutron net-list`` does before sending any request.
+Without the index, the commands are found by scanning the entry points of
+the installed distributions.
+
+Usage: python tools/benchmarks/shell_startup.py [NUM_RUNS]
+"""
+
+from __future__ import print_function
+
+import subprocess
+import sys
+import time
+
+_CODE = '''
+import time
+start = time.time()
+from neutronclient import command_index
+from neutronclient import shell
+if %(scan)r:
+    command_index.COMMANDS.clear()
+shell_start = time.time()
+shell.NeutronShell('2.0').command_manager.find_command(['net-list'])
+print('%%f %%f' %% (time.time() - start, time.time() - shell_start))
+'''
+
+
+def _run(scan):
+    start = time.time()
+    output = subprocess.check_output(
+        [sys.executable, '-c', _CODE % {'scan': scan}])
+    total = time.time() - start
+    in_process, shell = [float(value) for value in output.split()]
+    return total, in_process - shell, shell
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 10
+    modes = [('entry point scanning', True), ('command index', False)]
+    results = dict((name, []) for name, scan in modes)
+    # Runs of both modes alternate, so that they see the same load.
+    for i in range(count):
+        for name, scan in modes:
+            results[name].append(_run(scan))
+    for name, scan in modes:
+        totals, imports, shells = zip(*results[name])
+        print('%-22s process %8.1fms imports %8.1fms shell %8.2fms' %
+              (name, min(totals) * 1000, min(imports) * 1000,
+               min(shells) * 1000))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
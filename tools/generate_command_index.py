@@ -0,0 +1,88 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Generate neutronclient/command_index.py from the setup.cfg entry points.
+
+The neutron shell loads its commands from this index instead of scanning
+the entry points of the installed distributions. Run it after changing
+the commands of setup.cfg; the unit tests fail while the index is stale.
+
+Usage: python tools/generate_command_index.py
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+
+from six.moves import configparser
+
+from neutronclient import shell
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INDEX_PATH = os.path.join(ROOT, 'neutronclient', 'command_index.py')
+
+HEADER = '''\
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# NOTE: This file is generated by tools/generate_command_index.py from the
+# entry points of setup.cfg. Do not edit it.
+# flake8: noqa
+
+"""Classes of the neutron shell commands, by namespace and command name."""
+
+COMMANDS = {
+'''
+
+
+def read_commands(setup_cfg, namespace):
+    """Return the ``{entry point name: 'module:Class'}`` of ``namespace``.
+
+    The names are kept as they are in setup.cfg; like cliff, the shell
+    converts their underscores to spaces when it loads the index.
+    """
+    parser = configparser.RawConfigParser()
+    parser.read(setup_cfg)
+    commands = {}
+    for line in parser.get('entry_points', namespace).splitlines():
+        if line.strip():
+            name, target = [part.strip() for part in line.split('=', 1)]
+            commands[name] = target
+    return commands
+
+
+def main():
+    setup_cfg = os.path.join(ROOT, 'setup.cfg')
+    with open(INDEX_PATH, 'w') as index:
+        index.write(HEADER)
+        for namespace in sorted(shell.NAMESPACE_MAP.values()):
+            index.write("    '%s': {\n" % namespace)
+            commands = read_commands(setup_cfg, namespace)
+            for name, target in sorted(commands.items()):
+                index.write("        '%s': '%s',\n" % (name, target))
+            index.write('    },\n')
+        index.write('}\n')
+    print('Wrote %s' % INDEX_PATH)
+
+
+if __name__ == '__main__':
+    sys.exit(main())